@@ -0,0 +1,473 @@
+##########################################################################
+# Copyright (c) 2010-2022 Robert Bosch GmbH
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# http://www.eclipse.org/legal/epl-2.0.
+#
+# SPDX-License-Identifier: EPL-2.0
+##########################################################################
+
+"""
+Throughput and latency of the connectors through the full auxiliary stack.
+
+Each scenario goes from a CChannel through the auxiliary threads and
+queue_out up to the API used by the test cases:
+
+- raw_loopback: CommunicationAuxiliary over CCLoopback
+- proxy_fanout: CommunicationAuxiliaries sharing a channel through
+  CCProxy and ProxyAuxiliary
+- communication: CommunicationAuxiliary over an in-process channel pair
+  with an echoing device
+- can_virtual_bus: CanAuxiliary over a python-can in-process virtual bus
+- dut_simulated: DUTAuxiliary talking to a SimulatedAuxiliary
+
+The latency phase sends one message at a time and waits for it to come
+out of the test-facing API. The throughput phase sends a burst of
+messages before receiving them. The latency phase and the sending of
+the burst are bound by a duration, so that a slow connector can't stall
+the whole run.
+
+Run with ``invoke bench`` or ``python benchmarks/bench_connectors.py``,
+results are written as JSON to track regressions between releases.
+"""
+import abc
+import collections
+import concurrent.futures
+import datetime
+import json
+import platform
+import queue
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import click
+
+import pykiso
+from pykiso.connector import CChannel
+from pykiso.lib.auxiliaries.can_auxiliary import CanAuxiliary
+from pykiso.lib.auxiliaries.communication_auxiliary import CommunicationAuxiliary
+from pykiso.lib.auxiliaries.dut_auxiliary import DUTAuxiliary
+from pykiso.lib.auxiliaries.proxy_auxiliary import ProxyAuxiliary
+from pykiso.lib.auxiliaries.simulated_auxiliary import SimulatedAuxiliary
+from pykiso.lib.connectors.cc_proxy import CCProxy
+from pykiso.lib.connectors.cc_raw_loopback import CCLoopback
+from pykiso.message import Message, MessageCommandType, MessageType
+
+try:
+    import can
+except ImportError:
+    can = None
+
+MESSAGES = 1000
+SAMPLES = 200
+DURATION = 5.0
+RECEIVE_TIMEOUT = 1.0
+PAYLOAD = bytes(range(64))
+FANOUT = 3
+# DUT commands in flight at once, must stay below the 256 message tokens
+DUT_WINDOW = 64
+DBC_FILE = Path(__file__).resolve().parent.parent / "examples" / "test_can" / "simple.dbc"
+
+
+class _PipeChannel(CChannel):
+    """In-process channel delivering its sent messages to a peer channel."""
+
+    def __init__(self, parse_messages: bool = False, **kwargs):
+        """Constructor.
+
+        :param parse_messages: deliver received packets as
+            :py:class:`~pykiso.message.Message`, otherwise as bytes
+        """
+        super().__init__(**kwargs)
+        self.parse_messages = parse_messages
+        self.inbox = queue.Queue()
+        self.peer: Optional[_PipeChannel] = None
+
+    @classmethod
+    def pair(cls, name: str, parse_device_messages: bool = False) -> Tuple["_PipeChannel", "_PipeChannel"]:
+        """Create two connected channels.
+
+        :param name: prefix of the channel names
+        :param parse_device_messages: device end delivers Message objects
+        :return: the host and device ends
+        """
+        host = cls(name=f"{name}_host")
+        device = cls(name=f"{name}_device", parse_messages=parse_device_messages)
+        host.peer, device.peer = device, host
+        return host, device
+
+    def _cc_open(self) -> None:
+        pass
+
+    def _cc_close(self) -> None:
+        pass
+
+    def _cc_send(self, msg: Any, **kwargs) -> None:
+        self.peer.inbox.put(msg)
+
+    def _cc_receive(self, timeout: float = 0.1) -> dict:
+        try:
+            msg = self.inbox.get(timeout=timeout)
+        except queue.Empty:
+            return {"msg": None}
+        if self.parse_messages and isinstance(msg, (bytes, bytearray)):
+            msg = Message.parse_packet(msg)
+        elif not self.parse_messages and isinstance(msg, Message):
+            msg = msg.serialize()
+        return {"msg": msg}
+
+
+class _Scenario(abc.ABC):
+    """Full stack setup exchanging messages with the benchmark."""
+
+    #: reason why the scenario can't run, None if it can
+    skip_reason: Optional[str] = None
+
+    def setup(self) -> None:
+        """Create and start the auxiliaries."""
+
+    def teardown(self) -> None:
+        """Stop the auxiliaries."""
+
+    @abc.abstractmethod
+    def send(self) -> None:
+        """Push one message into the stack."""
+
+    @abc.abstractmethod
+    def receive(self, timeout: float) -> bool:
+        """Get one message out of the test-facing API.
+
+        :param timeout: time in seconds to wait for the message
+        :return: True if the message was received
+        """
+
+    def round_trip(self, timeout: float) -> bool:
+        """Send one message and wait for it to reach the test.
+
+        :param timeout: time in seconds to wait for the message
+        :return: True if the message was received
+        """
+        self.send()
+        return self.receive(timeout)
+
+    def burst(self, count: int, deadline: float) -> Tuple[int, int]:
+        """Send messages back to back, then receive them all.
+
+        :param count: number of messages to send
+        :param deadline: perf_counter value after which to stop sending
+        :return: number of sent and of received messages
+        """
+        sent = 0
+        while sent < count and time.perf_counter() < deadline:
+            self.send()
+            sent += 1
+        received = 0
+        while received < sent and self.receive(RECEIVE_TIMEOUT):
+            received += 1
+        return sent, received
+
+
+class _RawLoopbackScenario(_Scenario):
+    def setup(self) -> None:
+        self.aux = CommunicationAuxiliary(com=CCLoopback(name="bench_loopback"), name="bench_loopback_aux")
+        self.aux.start()
+        self.aux.queueing_event.set()
+
+    def teardown(self) -> None:
+        self.aux.stop()
+
+    def send(self) -> None:
+        self.aux.send_message(PAYLOAD)
+
+    def receive(self, timeout: float) -> bool:
+        return self.aux.receive_message(timeout_in_s=timeout) is not None
+
+
+class _ProxyFanoutScenario(_Scenario):
+    def setup(self) -> None:
+        host, self.device = _PipeChannel.pair("bench_proxy")
+        self.auxes = [
+            CommunicationAuxiliary(com=CCProxy(name=f"bench_proxy_chan{idx}"), name=f"bench_proxy_aux{idx}")
+            for idx in range(FANOUT)
+        ]
+        self.proxy = ProxyAuxiliary(com=host, aux_list=self.auxes, name="bench_proxy")
+        for aux in self.auxes:
+            # the first started auxiliary starts the proxy
+            aux.start()
+            aux.queueing_event.set()
+
+    def teardown(self) -> None:
+        # the last stopped auxiliary stops the proxy
+        for aux in self.auxes:
+            aux.stop()
+
+    def send(self) -> None:
+        self.device.cc_send(PAYLOAD)
+
+    def receive(self, timeout: float) -> bool:
+        # a message is delivered once every auxiliary got it
+        deadline = time.perf_counter() + timeout
+        for aux in self.auxes:
+            remaining = max(deadline - time.perf_counter(), 0)
+            if aux.receive_message(timeout_in_s=remaining) is None:
+                return False
+        return True
+
+
+class _CommunicationScenario(_Scenario):
+    def setup(self) -> None:
+        host, self.device = _PipeChannel.pair("bench_com")
+        self.aux = CommunicationAuxiliary(com=host, name="bench_com_aux")
+        self.aux.start()
+        self.aux.queueing_event.set()
+
+    def teardown(self) -> None:
+        self.aux.stop()
+
+    def send(self) -> None:
+        self.aux.send_message(PAYLOAD)
+        # echo from the device side
+        echo = self.device.cc_receive(timeout=RECEIVE_TIMEOUT)["msg"]
+        if echo is not None:
+            self.device.cc_send(echo)
+
+    def receive(self, timeout: float) -> bool:
+        return self.aux.receive_message(timeout_in_s=timeout) is not None
+
+
+class _VirtualCanChannel(CChannel):
+    """Channel on a python-can in-process virtual bus."""
+
+    def __init__(self, bus_channel: str, **kwargs):
+        super().__init__(**kwargs)
+        self.bus_channel = bus_channel
+        self.bus = None
+
+    def _cc_open(self) -> None:
+        self.bus = can.Bus(interface="virtual", channel=self.bus_channel)
+
+    def _cc_close(self) -> None:
+        self.bus.shutdown()
+        self.bus = None
+
+    def _cc_send(self, msg: bytes, remote_id: Optional[int] = None, **kwargs) -> None:
+        self.bus.send(can.Message(arbitration_id=remote_id, data=msg, is_extended_id=False))
+
+    def _cc_receive(self, timeout: float = 0.1) -> dict:
+        frame = self.bus.recv(timeout)
+        if frame is None:
+            return {"msg": None}
+        return {"msg": bytes(frame.data), "remote_id": frame.arbitration_id, "timestamp": frame.timestamp}
+
+
+class _CanVirtualBusScenario(_Scenario):
+    def __init__(self) -> None:
+        if can is None:
+            self.skip_reason = "python-can is not installed, consider installing pykiso with 'pip install pykiso[can]'"
+
+    def setup(self) -> None:
+        self.aux = CanAuxiliary(
+            com=_VirtualCanChannel(bus_channel="pykiso_bench", name="bench_can"),
+            dbc_file=str(DBC_FILE),
+            name="bench_can_aux",
+        )
+        self.aux.start()
+        # the peer emulates the DUT on the same virtual bus
+        self.peer = _VirtualCanChannel(bus_channel="pykiso_bench", name="bench_can_peer")
+        self.peer.open()
+        frame = self.aux.parser.dbc.get_message_by_name("Message_1")
+        self.frame = self.aux.parser.encode(frame, {"signal_a": 1, "signal_b": 2})
+        self.collection = self.aux.collect_messages()
+        self.collection.__enter__()
+        self.consumed = 0
+
+    def teardown(self) -> None:
+        self.collection.__exit__(None, None, None)
+        self.peer.close()
+        self.aux.stop()
+
+    def send(self) -> None:
+        self.peer.cc_send(self.frame[0], remote_id=self.frame[1])
+
+    def receive(self, timeout: float) -> bool:
+        # get_collected_messages deep-copies the whole collection on each
+        # call, poll its length instead to keep the measurement linear
+        deadline = time.perf_counter() + timeout
+        while len(self.aux._messages_collected) <= self.consumed:
+            if time.perf_counter() >= deadline:
+                return False
+            time.sleep(0)
+        self.consumed += 1
+        return True
+
+
+class _DutSimulatedScenario(_Scenario):
+    def setup(self) -> None:
+        host, device = _PipeChannel.pair("bench_dut", parse_device_messages=True)
+        self.simulated = SimulatedAuxiliary(com=device, name="bench_simulated_aux")
+        self.simulated.start()
+        self.aux = DUTAuxiliary(com=host, name="bench_dut_aux")
+        self.aux.start()
+        self.in_flight = collections.deque()
+
+    def teardown(self) -> None:
+        self.aux.stop()
+        self.simulated.stop()
+
+    def send(self) -> None:
+        self.in_flight.append(self.aux.submit_command(Message(MessageType.COMMAND, MessageCommandType.PING)))
+
+    def receive(self, timeout: float) -> bool:
+        # each acknowledgement resolves the future of its ping
+        future = self.in_flight.popleft()
+        try:
+            future.result(timeout=timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            return False
+        return True
+
+    def burst(self, count: int, deadline: float) -> Tuple[int, int]:
+        # pipeline the pings within the window of message tokens
+        sent = received = 0
+        while (sent < count and time.perf_counter() < deadline) or self.in_flight:
+            if sent < count and len(self.in_flight) < DUT_WINDOW and time.perf_counter() < deadline:
+                self.send()
+                sent += 1
+            elif self.receive(RECEIVE_TIMEOUT):
+                received += 1
+            else:
+                for future in self.in_flight:
+                    future.cancel()
+                self.in_flight.clear()
+        return sent, received
+
+
+SCENARIOS = {
+    "raw_loopback": _RawLoopbackScenario,
+    "proxy_fanout": _ProxyFanoutScenario,
+    "communication": _CommunicationScenario,
+    "can_virtual_bus": _CanVirtualBusScenario,
+    "dut_simulated": _DutSimulatedScenario,
+}
+
+
+def _percentile(sorted_values: List[float], percent: float) -> Optional[float]:
+    """Nearest-rank percentile of already sorted values."""
+    if not sorted_values:
+        return None
+    rank = max(int(round(percent / 100 * len(sorted_values) + 0.5)) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+def _measure(scenario: _Scenario, messages: int, samples: int, duration: float) -> Dict[str, Any]:
+    """Run the latency and throughput phases of a scenario.
+
+    :param scenario: scenario to measure
+    :param messages: number of messages sent in the throughput phase
+    :param samples: number of round trips in the latency phase
+    :param duration: maximum time in seconds spent in each phase
+    :return: the scenario's results
+    """
+    scenario.setup()
+    try:
+        latencies = []
+        timeouts = 0
+        deadline = time.perf_counter() + duration
+        while len(latencies) + timeouts < samples and time.perf_counter() < deadline:
+            start = time.perf_counter()
+            if scenario.round_trip(RECEIVE_TIMEOUT):
+                latencies.append(time.perf_counter() - start)
+            else:
+                timeouts += 1
+
+        start = time.perf_counter()
+        sent, received = scenario.burst(messages, start + duration)
+        elapsed = time.perf_counter() - start
+    finally:
+        scenario.teardown()
+
+    latencies.sort()
+    return {
+        "throughput": {
+            "sent": sent,
+            "received": received,
+            "duration_s": elapsed,
+            "messages_per_s": received / elapsed if elapsed else None,
+        },
+        "latency_ms": {
+            "samples": len(latencies),
+            "timeouts": timeouts,
+            "p50": _scale(_percentile(latencies, 50)),
+            "p99": _scale(_percentile(latencies, 99)),
+            "max": _scale(latencies[-1] if latencies else None),
+        },
+    }
+
+
+def _scale(seconds: Optional[float]) -> Optional[float]:
+    return seconds * 1e3 if seconds is not None else None
+
+
+def run(
+    messages: int = MESSAGES,
+    samples: int = SAMPLES,
+    duration: float = DURATION,
+    scenarios: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """Measure the throughput and latency of each scenario.
+
+    :param messages: number of messages sent in the throughput phase
+    :param samples: number of round trips in the latency phase
+    :param duration: maximum time in seconds spent in each phase
+    :param scenarios: names of the scenarios to run, all by default
+    :return: the benchmark results
+    """
+    results = {}
+    for name in scenarios or SCENARIOS:
+        scenario = SCENARIOS[name]()
+        if scenario.skip_reason is not None:
+            results[name] = {"skipped": scenario.skip_reason}
+            continue
+        results[name] = _measure(scenario, messages, samples, duration)
+
+    return {
+        "pykiso_version": pykiso.__version__,
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "parameters": {"messages": messages, "samples": samples, "duration_s": duration},
+        "scenarios": results,
+    }
+
+
+@click.command()
+@click.option("-o", "--output", type=click.Path(dir_okay=False, path_type=Path), help="JSON file to write to")
+@click.option("-n", "--messages", default=MESSAGES, show_default=True, help="messages per throughput burst")
+@click.option("-s", "--samples", default=SAMPLES, show_default=True, help="round trips per latency measurement")
+@click.option("-d", "--duration", default=DURATION, show_default=True, help="maximum seconds per phase")
+@click.option("--scenario", "scenarios", multiple=True, type=click.Choice(list(SCENARIOS)), help="scenario to run")
+def main(output: Optional[Path], messages: int, samples: int, duration: float, scenarios: Tuple[str]) -> None:
+    """Benchmark the connectors through the full auxiliary stack."""
+    results = run(messages, samples, duration, list(scenarios) or None)
+
+    for name, result in results["scenarios"].items():
+        if "skipped" in result:
+            click.echo(f"{name}: skipped ({result['skipped']})")
+            continue
+        throughput, latency = result["throughput"], result["latency_ms"]
+        click.echo(
+            f"{name}: {throughput['messages_per_s'] or 0:.0f} msg/s "
+            f"({throughput['received']}/{throughput['sent']}), "
+            f"p50 {latency['p50'] or 0:.3f} ms, p99 {latency['p99'] or 0:.3f} ms"
+        )
+
+    if output is not None:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(results, indent=2))
+        click.echo(f"results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+##########################################################################
+# Copyright (c) 2010-2022 Robert Bosch GmbH
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# http://www.eclipse.org/legal/epl-2.0.
+#
+# SPDX-License-Identifier: EPL-2.0
+##########################################################################
+
+"""
+Cost of the CRC16 protecting the pykiso Message protocol.
+
+Compares the former bit by bit computation with the table-driven one of
+:py:mod:`pykiso.crc`, then measures parse_packet on TLV-heavy reports
+and the bulk verification of a whole recording.
+"""
+import time
+from typing import Dict
+
+from pykiso import crc
+from pykiso.message import Message, MessageReportType, MessageType, TlvKnownTags
+
+PACKETS = 20_000
+REPORT = Message(
+    MessageType.REPORT,
+    MessageReportType.TEST_FAILED,
+    test_suite=1,
+    test_case=2,
+    tlv_dict={TlvKnownTags.TEST_REPORT: "x" * 120, TlvKnownTags.FAILURE_REASON: "y" * 120},
+).serialize()
+
+
+def bitwise_crc16(data: bytes) -> int:
+    """CRC16 as previously computed by Message.get_crc and CCUart."""
+    crc_value = 0
+    for byte in data:
+        crc_value = ((crc_value >> 8) | (crc_value << 8)) & 0xFFFF
+        crc_value ^= byte
+        crc_value ^= (crc_value & 0xFF) >> 4
+        crc_value ^= (crc_value << 12) & 0xFFFF
+        crc_value ^= ((crc_value & 0xFF) << 5) & 0xFFFF
+    return crc_value
+
+
+def _per_packet(func, packets: int) -> float:
+    start = time.perf_counter()
+    for _ in range(packets):
+        func()
+    return (time.perf_counter() - start) / packets
+
+
+def run(packets: int = PACKETS) -> Dict[str, float]:
+    """Measure the CRC cost per packet.
+
+    :param packets: number of packets per measurement
+    :return: per-packet durations in microseconds
+    """
+    body = REPORT[: -crc.CRC16_SIZE]
+    recording = [REPORT] * packets
+
+    results = {
+        "packets": packets,
+        "packet_size": len(REPORT),
+        "bitwise_crc_us": _per_packet(lambda: bitwise_crc16(body), packets) * 1e6,
+        "table_crc_us": _per_packet(lambda: crc.crc16(body), packets) * 1e6,
+        "parse_packet_us": _per_packet(lambda: Message.parse_packet(REPORT), packets) * 1e6,
+    }
+    start = time.perf_counter()
+    crc.verify_packets(recording)
+    results["verify_packets_us"] = (time.perf_counter() - start) / packets * 1e6
+    results["vectorized"] = crc.np is not None
+    return results
+
+
+if __name__ == "__main__":
+    for key, value in run().items():
+        print(f"{key}: {value:.3f}" if isinstance(value, float) else f"{key}: {value}")
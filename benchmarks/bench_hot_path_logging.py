@@ -0,0 +1,97 @@
+##########################################################################
+# Copyright (c) 2010-2022 Robert Bosch GmbH
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# http://www.eclipse.org/legal/epl-2.0.
+#
+# SPDX-License-Identifier: EPL-2.0
+##########################################################################
+
+"""
+Per-frame cost of the reception hot path with internal logging disabled.
+
+Runs the reception of the communication auxiliary twice for the same
+received frame: once with the lazy %-style logging it uses, and once with
+its log calls formatted eagerly, as an f-string message would be.
+"""
+import logging
+import time
+from typing import Dict
+
+from pykiso.connector import CChannel
+from pykiso.lib.auxiliaries import communication_auxiliary
+from pykiso.lib.auxiliaries.communication_auxiliary import CommunicationAuxiliary
+from pykiso.logging_initializer import add_internal_log_levels
+
+FRAMES = 100_000
+FRAME = {"msg": bytes(range(64)), "remote_id": 0x123}
+
+
+class _ConstantChannel(CChannel):
+    """Channel returning the same frame on each reception."""
+
+    def _cc_open(self) -> None:
+        pass
+
+    def _cc_close(self) -> None:
+        pass
+
+    def _cc_send(self, msg: bytes, **kwargs) -> None:
+        pass
+
+    def _cc_receive(self, timeout: float = 0.1) -> dict:
+        return FRAME
+
+
+class _EagerLogger:
+    """Logger formatting the debug messages before checking the level,
+    like a call with an f-string message.
+    """
+
+    def __init__(self, logger: logging.Logger) -> None:
+        self._logger = logger
+
+    def internal_debug(self, msg: str, *args, **kwargs) -> None:
+        self._logger.internal_debug(msg % args if args else msg, **kwargs)
+
+    def __getattr__(self, name: str):
+        return getattr(self._logger, name)
+
+
+def _per_frame(func, frames: int) -> float:
+    start = time.perf_counter()
+    for _ in range(frames):
+        func()
+    return (time.perf_counter() - start) / frames
+
+
+def run(frames: int = FRAMES) -> Dict[str, float]:
+    """Measure the reception cost per frame.
+
+    :param frames: number of frames to receive per measurement
+    :return: per-frame durations in microseconds
+    """
+    add_internal_log_levels()
+    log = communication_auxiliary.log
+    previous_level = log.level
+    log.setLevel(logging.INFO)
+
+    channel = _ConstantChannel(name="bench")
+    aux = CommunicationAuxiliary(com=channel, name="bench_aux")
+    # don't keep the received frames
+    aux.queueing_event.clear()
+
+    try:
+        lazy_us = _per_frame(lambda: aux._receive_message(0), frames) * 1e6
+        communication_auxiliary.log = _EagerLogger(log)
+        eager_us = _per_frame(lambda: aux._receive_message(0), frames) * 1e6
+    finally:
+        communication_auxiliary.log = log
+        log.setLevel(previous_level)
+
+    return {"frames": frames, "lazy_logging_us_per_frame": lazy_us, "eager_logging_us_per_frame": eager_us}
+
+
+if __name__ == "__main__":
+    for key, value in run().items():
+        print(f"{key}: {value:.3f}" if isinstance(value, float) else f"{key}: {value}")
@@ -0,0 +1,82 @@
+##########################################################################
+# Copyright (c) 2010-2022 Robert Bosch GmbH
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# http://www.eclipse.org/legal/epl-2.0.
+#
+# SPDX-License-Identifier: EPL-2.0
+##########################################################################
+
+"""
+Round-trip cost of the pykiso Message codec.
+
+Serializes a fixture command and a TLV report, either to a new bytes
+object or into a preallocated buffer, and parses them back from bytes
+or from a memoryview on the receive buffer. Finally splits a stream of
+reports read in fixed-size chunks with the MessageFramer, and decodes
+the headers of the whole stream at once with Message.parse_many.
+"""
+import time
+from typing import Dict
+
+from pykiso.message import (
+    Message,
+    MessageCommandType,
+    MessageFramer,
+    MessageReportType,
+    MessageType,
+    TlvKnownTags,
+    np,
+)
+
+MESSAGES = 50_000
+CHUNK_SIZE = 64
+COMMAND = Message(MessageType.COMMAND, MessageCommandType.TEST_CASE_RUN, test_suite=1, test_case=2)
+REPORT = Message(
+    MessageType.REPORT,
+    MessageReportType.TEST_FAILED,
+    test_suite=1,
+    test_case=2,
+    tlv_dict={TlvKnownTags.TEST_REPORT: "x" * 100, TlvKnownTags.FAILURE_REASON: "y" * 100},
+)
+
+
+def _per_message(func, messages: int) -> float:
+    start = time.perf_counter()
+    for _ in range(messages):
+        func()
+    return (time.perf_counter() - start) / messages
+
+
+def run(messages: int = MESSAGES) -> Dict[str, float]:
+    """Measure the codec cost per message.
+
+    :param messages: number of messages per measurement
+    :return: per-message durations in microseconds
+    """
+    buffer = bytearray(Message.max_message_size)
+    results = {"messages": messages}
+    for name, msg in (("command", COMMAND), ("report", REPORT)):
+        raw_packet = msg.serialize()
+        results[f"{name}_serialize_us"] = _per_message(msg.serialize, messages) * 1e6
+        results[f"{name}_serialize_into_us"] = _per_message(lambda: msg.serialize_into(buffer), messages) * 1e6
+        results[f"{name}_parse_packet_us"] = _per_message(lambda: Message.parse_packet(raw_packet), messages) * 1e6
+        size = msg.serialize_into(buffer)
+        view = memoryview(buffer)[:size]
+        results[f"{name}_parse_view_us"] = _per_message(lambda: Message.parse_packet(view), messages) * 1e6
+
+    stream = REPORT.serialize() * messages
+    framer = MessageFramer()
+    start = time.perf_counter()
+    framed = sum(len(framer.feed(stream[idx : idx + CHUNK_SIZE])) for idx in range(0, len(stream), CHUNK_SIZE))
+    results["report_framer_us"] = (time.perf_counter() - start) / framed * 1e6
+    if np is not None:
+        start = time.perf_counter()
+        decoded = len(Message.parse_many(stream))
+        results["report_parse_many_us"] = (time.perf_counter() - start) / decoded * 1e6
+    return results
+
+
+if __name__ == "__main__":
+    for key, value in run().items():
+        print(f"{key}: {value:.3f}" if isinstance(value, float) else f"{key}: {value}")
@@ -29,8 +29,9 @@ __version__ = metadata.version(__name__)
 
 from . import cli, config_parser, connector, logging_initializer, message, types
 from .auxiliary import AuxiliaryInterface
-from .connector import CChannel, Flasher
+from .connector import AsyncCChannel, CChannel, Flasher
 from .exceptions import AuxiliaryCreationError, InvalidTestModuleName, PykisoError, TestCollectionError
+from .interfaces.async_auxiliary import AsyncAuxiliaryInterface
 from .interfaces.dt_auxiliary import DTAuxiliaryInterface
 from .logging_initializer import disable_logging
 from .message import Message
@@ -17,22 +17,50 @@ Auxiliary common Interface Definition
 .. currentmodule:: pykiso
 
 """
+from __future__ import annotations
+
 import abc
+import concurrent.futures
 import enum
 import functools
+import inspect
 import logging
+import os
 import queue
+import selectors
+import socket
+import sys
 import threading
+import time
+import traceback
 from enum import Enum, unique
-from typing import Any, Callable, List, Optional, Self
+from typing import Any, Callable, Dict, Hashable, List, Optional, Self, Union
 
 from pykiso.test_setup.config_registry import ConfigRegistry
 
 from .exceptions import AuxiliaryCreationError, AuxiliaryNotStarted
 from .logging_initializer import add_internal_log_levels, initialize_loggers
+from .metrics import Metrics
+from .queues import MonitoredQueue, PriorityLaneQueue, QueuePolicy, QueuePriority
+from .tracing import tracer
 
 log = logging.getLogger(__name__)
 
+#: auto_start value creating the auxiliary on import but starting it on first use
+AUTO_START_LAZY = "lazy"
+#: default time in seconds after which an unused lazy auxiliary is stopped again
+LAZY_IDLE_TIMEOUT = 60
+#: public methods that never trigger the start of a lazy auxiliary
+LAZY_EXCLUDED_METHODS = frozenset(
+    ("start", "stop", "suspend", "resume", "create_instance", "delete_instance", "shutdown", "get_queue_stats")
+)
+#: maximum time in seconds between two stall checks of the watchdog
+STALL_CHECK_INTERVAL = 1
+#: time in seconds to wait for a stalled thread to end when restarting its auxiliary
+STALL_JOIN_TIMEOUT = 2
+#: maximum number of restarts triggered by stalls for one auxiliary
+STALL_MAX_RESTARTS = 3
+
 
 @unique
 class AuxCommand(Enum):
@@ -44,18 +72,273 @@ class AuxCommand(Enum):
     DELETE_AUXILIARY = enum.auto()
 
 
+class AuxiliaryReactor:
+    """Shared event loop dispatching channel readiness to auxiliaries.
+
+    Instead of spinning one reception thread per auxiliary, auxiliaries
+    whose channel exposes a file descriptor (``fileno()``) can register
+    to this reactor. A single thread waits on all registered file
+    descriptors using :py:mod:`selectors` and calls the owning
+    auxiliary's ``_receive_message`` as soon as data is available.
+
+    The reactor thread is only alive while at least one auxiliary is
+    registered.
+
+    .. warning:: all registered auxiliaries share the reactor thread, so
+        their ``_receive_message`` must never block: a blocking call
+        (e.g. a ``run_command`` from a reception callback, or a put into
+        a full queue_out with the "block" policy) stalls the reception
+        of every other auxiliary. Auxiliaries using a bounded queue_out
+        with the "block" policy are therefore rejected.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self) -> None:
+        """Initialize attributes."""
+        self._selector = selectors.DefaultSelector()
+        self._lock = threading.Lock()
+        self._pending = []
+        self._registered = {}
+        self._thread = None
+        # socket pair used to wake up the reactor thread on registration changes
+        self._wakeup_recv, self._wakeup_send = socket.socketpair()
+        self._wakeup_recv.setblocking(False)
+        self._selector.register(self._wakeup_recv, selectors.EVENT_READ, None)
+
+    @classmethod
+    def get_reactor(cls) -> AuxiliaryReactor:
+        """Return the process-wide reactor, create it if necessary.
+
+        :return: the shared reactor instance
+        """
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    @property
+    def is_running(self) -> bool:
+        """True if the reactor thread is currently alive."""
+        with self._lock:
+            return self._thread is not None
+
+    def register(self, aux: AuxiliaryInterface, fileno: int) -> bool:
+        """Register an auxiliary to the reactor.
+
+        :param aux: auxiliary whose ``_receive_message`` is called when
+            the file descriptor becomes readable
+        :param fileno: file descriptor of the auxiliary's channel
+
+        :return: True if the registration succeeded otherwise False
+        """
+        return self._request("register", aux, fileno)
+
+    def unregister(self, aux: AuxiliaryInterface) -> None:
+        """Unregister an auxiliary from the reactor.
+
+        Once this method returns, the auxiliary's ``_receive_message``
+        is guaranteed not to be called anymore by the reactor.
+
+        :param aux: auxiliary to unregister
+        """
+        self._request("unregister", aux, None)
+
+    def _request(self, action: str, aux: AuxiliaryInterface, fileno: Optional[int]) -> bool:
+        """Hand over a registration change to the reactor thread and
+        wait for it to be applied.
+
+        :param action: either "register" or "unregister"
+        :param aux: auxiliary concerned by the change
+        :param fileno: file descriptor to register, if any
+
+        :return: True if the change was applied successfully
+        """
+        request = {"action": action, "aux": aux, "fileno": fileno, "done": threading.Event(), "result": False}
+        with self._lock:
+            self._pending.append(request)
+            if self._thread is None:
+                self._thread = threading.Thread(name="aux_reactor", target=self._run, daemon=True)
+                self._thread.start()
+            elif self._thread is threading.current_thread():
+                # called from a dispatched _receive_message, apply it right away
+                self._apply_pending()
+        if not request["done"].is_set():
+            self._wakeup_send.send(b"\x00")
+            request["done"].wait()
+        return request["result"]
+
+    def _apply_pending(self) -> bool:
+        """Apply all pending registration changes.
+
+        .. note:: must be called with the reactor lock held
+
+        :return: True if no auxiliary remains registered
+        """
+        for request in self._pending:
+            aux = request["aux"]
+            try:
+                if request["action"] == "register":
+                    self._selector.register(request["fileno"], selectors.EVENT_READ, aux)
+                    self._registered[aux] = request["fileno"]
+                elif aux in self._registered:
+                    self._selector.unregister(self._registered.pop(aux))
+                request["result"] = True
+            except (OSError, ValueError, KeyError):
+                log.internal_warning(f"Reactor failed to {request['action']} auxiliary {aux.name}")
+            request["done"].set()
+        self._pending.clear()
+        return not self._registered
+
+    def _run(self) -> None:
+        """Reactor thread: wait for readable channels and dispatch."""
+        while True:
+            with self._lock:
+                if self._apply_pending():
+                    self._thread = None
+                    return
+            try:
+                events = self._selector.select()
+            except (OSError, ValueError):
+                log.exception("Reactor failed to wait for channel readiness")
+                self._drop_invalid_registrations()
+                continue
+            for key, _ in events:
+                aux = key.data
+                if aux is None:
+                    self._drain_wakeup()
+                    continue
+                try:
+                    aux.metrics.increment("rx_iterations")
+                    aux._dispatch_reception(timeout_in_s=0)
+                except Exception:
+                    log.exception(f"encountered error while dispatching reception to {aux.name}")
+
+    def _drain_wakeup(self) -> None:
+        """Consume all wake-up bytes."""
+        try:
+            while self._wakeup_recv.recv(1024):
+                pass
+        except BlockingIOError:
+            pass
+
+    def _drop_invalid_registrations(self) -> None:
+        """Unregister auxiliaries whose file descriptor became invalid."""
+        with self._lock:
+            for aux, fileno in list(self._registered.items()):
+                try:
+                    os.fstat(fileno)
+                except OSError:
+                    log.error(f"Channel of auxiliary {aux.name} is not valid anymore, drop it from the reactor")
+                    self._selector.unregister(self._registered.pop(aux))
+
+
+class AuxiliaryWatchdog:
+    """Shared thread detecting stalled auxiliary rx/tx threads.
+
+    Each loop iteration of an auxiliary's reception and transmission
+    task is timed. An auxiliary with a ``stall_timeout`` is watched
+    while it is running: a thread stuck in a single iteration for longer
+    than this timeout (e.g. a ``_cc_receive`` call blocked in a vendor
+    library) is reported together with its Python stack.
+
+    The watchdog thread is only alive while at least one auxiliary is
+    watched.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self) -> None:
+        """Initialize attributes."""
+        self._lock = threading.Lock()
+        self._watched = set()
+        self._thread = None
+        self._wakeup = threading.Event()
+
+    @classmethod
+    def get_watchdog(cls) -> AuxiliaryWatchdog:
+        """Return the process-wide watchdog, create it if necessary.
+
+        :return: the shared watchdog instance
+        """
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def watch(self, aux: AuxiliaryInterface) -> None:
+        """Start watching the threads of an auxiliary.
+
+        :param aux: auxiliary to watch, its stall_timeout must be set
+        """
+        with self._lock:
+            self._watched.add(aux)
+            if self._thread is None:
+                self._thread = threading.Thread(name="aux_watchdog", target=self._run, daemon=True)
+                self._thread.start()
+        # take the new auxiliary's stall timeout into account right away
+        self._wakeup.set()
+
+    def unwatch(self, aux: AuxiliaryInterface) -> None:
+        """Stop watching the threads of an auxiliary.
+
+        :param aux: auxiliary to stop watching
+        """
+        with self._lock:
+            self._watched.discard(aux)
+
+    def _run(self) -> None:
+        """Watchdog thread: periodically check all watched auxiliaries."""
+        while True:
+            with self._lock:
+                if not self._watched:
+                    self._thread = None
+                    return
+                watched = list(self._watched)
+            interval = min([STALL_CHECK_INTERVAL] + [aux.stall_timeout / 4 for aux in watched])
+            now = time.monotonic()
+            for aux in watched:
+                try:
+                    aux._check_stall(now)
+                except Exception:
+                    log.exception(f"Watchdog failed to check auxiliary {aux.name}")
+            self._wakeup.wait(interval)
+            self._wakeup.clear()
+
+
+def _format_thread_stack(thread: threading.Thread) -> str:
+    """Get the current Python stack of a thread.
+
+    :param thread: thread to inspect
+    :return: the formatted stack, empty if the thread is not running
+    """
+    frame = sys._current_frames().get(thread.ident)
+    if frame is None:
+        return ""
+    return "".join(traceback.format_stack(frame))
+
+
 class AuxiliaryInterface(abc.ABC):
     """Common interface for all double threaded auxiliary. A so called
     << double threaded >> auxiliary, simply encapsulate two threads one
     for the reception and one for the transmmission.
     """
 
+    #: set by auxiliaries whose _receive_message routes the responses
+    #: to their command with _resolve_command, which lets control
+    #: commands of run_command bypass the commands waiting for a reply
+    correlates_responses = False
+
     @classmethod
     def get_instance(cls, name: str) -> Self:
         """Experimental - Get an auxiliary instance by its name."""
+        from .interfaces.process_auxiliary import is_auxiliary_of_type
+
         auxiliary = ConfigRegistry.get_aux_by_alias(name)
         # Verify if the auxiliary is of the right type
-        if not isinstance(auxiliary, cls):
+        if not is_auxiliary_of_type(auxiliary, cls):
             raise ValueError(f"Requested auxiliary {name} is not of type {cls}")
         return auxiliary
 
@@ -67,7 +350,14 @@ class AuxiliaryInterface(abc.ABC):
         activate_log: List[str] = None,
         tx_task_on=True,
         rx_task_on=True,
-        auto_start: bool = True,
+        auto_start: Union[bool, str] = True,
+        use_reactor: bool = False,
+        queue_size: int = 0,
+        queue_policy: str = QueuePolicy.BLOCK,
+        lazy_idle_timeout: Optional[float] = LAZY_IDLE_TIMEOUT,
+        warm_suspend: bool = False,
+        stall_timeout: Optional[float] = None,
+        restart_on_stall: bool = False,
     ) -> None:
         """Initialize auxiliary attributes
 
@@ -80,7 +370,33 @@ class AuxiliaryInterface(abc.ABC):
         :param tx_task_on: enable or not the tx thread
         :param rx_task_on: enable or not the rx thread
         :param auto_start: determine if the auxiliayry is automatically
-             started (magic import) or manually (by user)
+             started (magic import) or manually (by user). With "lazy",
+             the auxiliary is started on the first call of one of its
+             public methods.
+        :param use_reactor: if the attached channel exposes a file
+            descriptor, dispatch the reception through the shared
+            :py:class:`AuxiliaryReactor` instead of a dedicated rx
+            thread. The _receive_message implementation must then never
+            block.
+        :param queue_size: capacity of queue_in and queue_out, 0 means
+            unbounded
+        :param queue_policy: behaviour of the queues once full, one of
+            "block", "drop-oldest" or "drop-newest"
+        :param lazy_idle_timeout: with auto_start "lazy", time in seconds
+            after which the unused auxiliary is stopped again until its
+            next use. None keeps it running.
+        :param warm_suspend: if True, a suspended auxiliary keeps its
+            threads and channel while discarding all received data,
+            otherwise (default) it is stopped until resumed
+        :param stall_timeout: time in seconds after which a single
+            iteration of the rx or tx task is reported as stalled by the
+            :py:class:`AuxiliaryWatchdog`, None disables the detection.
+            Must be greater than the reception timeout.
+        :param restart_on_stall: restart the auxiliary when one of its
+            threads stalls, at most STALL_MAX_RESTARTS times
+
+        :raises ValueError: if the reactor is used together with bounded
+            queues blocking once full
         """
         initialize_loggers(activate_log)
         add_internal_log_levels()
@@ -92,8 +408,14 @@ class AuxiliaryInterface(abc.ABC):
         self._stop_event = threading.Event()
         self.stop_tx = threading.Event()
         self.stop_rx = threading.Event()
-        self.queue_in = queue.Queue()
-        self.queue_out = queue.Queue()
+        self.queue_in = PriorityLaneQueue(queue_size, queue_policy)
+        self.queue_out = MonitoredQueue(queue_size, queue_policy)
+        if use_reactor and queue_size > 0 and self.queue_out.policy == QueuePolicy.BLOCK:
+            # a full queue_out would block the reactor thread shared by all auxiliaries
+            raise ValueError(
+                f"Auxiliary {name} cannot use the reactor with a bounded queue and the 'block' policy, "
+                "use the 'drop-oldest' or 'drop-newest' policy instead"
+            )
         self.tx_task_on = tx_task_on
         self.rx_task_on = rx_task_on
         self.tx_thread = None
@@ -101,6 +423,193 @@ class AuxiliaryInterface(abc.ABC):
         self.recv_timeout = 1
         self.is_instance = False
         self.connector_required = connector_required
+        self.use_reactor = use_reactor
+        self._reactor = None
+        self._pending_commands: Dict[Hashable, concurrent.futures.Future] = {}
+        self._pending_lock = threading.Lock()
+        self.metrics = Metrics(f"auxiliary.{name}")
+        self.metrics.register_gauge("queue_in_depth", self.queue_in.qsize)
+        self.metrics.register_gauge("queue_out_depth", self.queue_out.qsize)
+        self.metrics.register_child("channel", self._get_channel_metrics)
+        self.warm_suspend = warm_suspend
+        # cleared while the auxiliary is suspended
+        self._resume_event = threading.Event()
+        self._resume_event.set()
+        self.lazy_idle_timeout = lazy_idle_timeout
+        self._lazy_lock = threading.RLock()
+        self._lazy_calls = 0
+        self._lazy_starting = False
+        self._last_use = 0.0
+        self._idle_wakeup = threading.Event()
+        self._idle_thread = None
+        self.stall_timeout = stall_timeout
+        self.restart_on_stall = restart_on_stall
+        # start time of the iteration currently executed by each task thread
+        self._busy_since: Dict[threading.Thread, float] = {}
+        self._stall_reported: Dict[threading.Thread, float] = {}
+        # stalled threads left behind by a restart, ended as soon as they return
+        self._abandoned_threads = set()
+        self._stall_restarts = 0
+        self._restarting = False
+        if self.auto_start == AUTO_START_LAZY:
+            self._install_lazy_activation()
+
+    def _install_lazy_activation(self) -> None:
+        """Wrap all public methods so that the first call starts the
+        auxiliary.
+        """
+        for method_name, _ in inspect.getmembers(type(self), inspect.isfunction):
+            if method_name.startswith("_") or method_name in LAZY_EXCLUDED_METHODS:
+                continue
+            setattr(self, method_name, self._wrap_lazy_method(getattr(self, method_name)))
+
+    def _wrap_lazy_method(self, method: Callable) -> Callable:
+        """Make a bound method start the auxiliary before its execution.
+
+        :param method: bound public method to wrap
+        :return: the wrapped method
+        """
+
+        @functools.wraps(method)
+        def lazy_method(*args, **kwargs) -> Any:
+            # the auxiliary's own threads only run while it is started
+            if self._is_internal_thread():
+                return method(*args, **kwargs)
+            self._acquire_lazy_use()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self._release_lazy_use()
+
+        return lazy_method
+
+    def _is_internal_thread(self) -> bool:
+        """True if called from one of the threads run for this auxiliary."""
+        current = threading.current_thread()
+        reactor = self._reactor
+        if reactor is not None and reactor._thread is current:
+            return True
+        return current in (self.tx_thread, self.rx_thread, self._idle_thread)
+
+    def _acquire_lazy_use(self) -> None:
+        """Start the lazy auxiliary if needed and mark it as in use.
+
+        :raises AuxiliaryCreationError: if the auxiliary failed to start
+        """
+        with self._lazy_lock:
+            if not self.is_instance and not self._lazy_starting:
+                log.internal_info(f"First use of lazy auxiliary {self.name}, starting it")
+                self._lazy_starting = True
+                try:
+                    self.create_instance()
+                finally:
+                    self._lazy_starting = False
+                self._start_idle_monitor()
+            self._lazy_calls += 1
+
+    def _release_lazy_use(self) -> None:
+        """Mark the end of a use of the lazy auxiliary."""
+        with self._lazy_lock:
+            self._lazy_calls -= 1
+            self._last_use = time.monotonic()
+
+    def _start_idle_monitor(self) -> None:
+        """Start the thread parking the lazy auxiliary once idle."""
+        if self.lazy_idle_timeout is None:
+            return
+        self._last_use = time.monotonic()
+        self._idle_wakeup.clear()
+        self._idle_thread = threading.Thread(name=f"{self.name}_idle", target=self._idle_monitor_task, daemon=True)
+        self._idle_thread.start()
+
+    def _idle_monitor_task(self) -> None:
+        """Stop the lazy auxiliary once it was not used for
+        lazy_idle_timeout seconds, it is started again on next use.
+        """
+        while True:
+            with self._lazy_lock:
+                if not self.is_instance:
+                    return
+                remaining = self._last_use + self.lazy_idle_timeout - time.monotonic()
+                if self._lazy_calls == 0 and remaining <= 0:
+                    log.internal_info(f"Lazy auxiliary {self.name} unused for {self.lazy_idle_timeout}s, parking it")
+                    self.delete_instance()
+                    return
+            # a call in progress resets the idle time once finished
+            self._idle_wakeup.wait(remaining if remaining > 0 else self.lazy_idle_timeout)
+
+    def _check_stall(self, now: float) -> None:
+        """Report the task threads stuck in their current iteration for
+        longer than stall_timeout and restart the auxiliary if requested.
+
+        Called periodically by the :py:class:`AuxiliaryWatchdog`.
+
+        :param now: current time.monotonic() value
+        """
+        stalled = False
+        for thread, busy_since in dict(self._busy_since).items():
+            if thread in self._abandoned_threads or now - busy_since < self.stall_timeout:
+                continue
+            # report each stalled iteration only once
+            if self._stall_reported.get(thread) == busy_since:
+                continue
+            self._stall_reported[thread] = busy_since
+            stalled = True
+            log.error(
+                "Thread %s of auxiliary %s stalled for %.1fs, current stack:\n%s",
+                thread.name,
+                self.name,
+                now - busy_since,
+                _format_thread_stack(thread),
+            )
+            self.metrics.increment("stalls")
+        if not stalled or not self.restart_on_stall or self._restarting:
+            return
+        if self._stall_restarts >= STALL_MAX_RESTARTS:
+            log.error(f"Auxiliary {self.name} reached {STALL_MAX_RESTARTS} stall restarts, not restarting it again")
+            return
+        self._restarting = True
+        self._stall_restarts += 1
+        threading.Thread(name=f"{self.name}_restart", target=self._restart_stalled, daemon=True).start()
+
+    def _restart_stalled(self) -> None:
+        """Restart the auxiliary, leaving its stalled threads behind."""
+        try:
+            with self.lock:
+                if not self.is_instance:
+                    return
+                log.warning(f"Restarting stalled auxiliary {self.name}")
+                AuxiliaryWatchdog.get_watchdog().unwatch(self)
+                self._resume_event.set()
+                # closing the channel first releases a blocked _cc_receive/_cc_send for most connectors
+                try:
+                    self._delete_auxiliary_instance()
+                except Exception:
+                    log.exception(f"Failed to close stalled auxiliary {self.name}")
+                self._stop_tx_task(join_timeout=STALL_JOIN_TIMEOUT)
+                self._stop_rx_task(join_timeout=STALL_JOIN_TIMEOUT)
+                for thread in (self.tx_thread, self.rx_thread):
+                    if thread is not None and thread.is_alive():
+                        log.error(f"Thread {thread.name} of auxiliary {self.name} did not end, leaving it behind")
+                        self._abandoned_threads.add(thread)
+                # commands queued for the stalled instance (including a pending delete) are discarded
+                while True:
+                    try:
+                        self.queue_in.get_nowait()
+                    except queue.Empty:
+                        break
+                self._cancel_pending_commands()
+                self._stall_reported.clear()
+                self.is_instance = False
+            self.create_instance()
+        except Exception:
+            log.exception(f"Failed to restart stalled auxiliary {self.name}")
+        finally:
+            self._restarting = False
+
+    def _get_channel_metrics(self) -> Optional[Metrics]:
+        """Get the metrics of the attached channel, if any."""
+        return getattr(getattr(self, "channel", None), "metrics", None)
 
     def run_command(
         self,
@@ -109,6 +618,7 @@ class AuxiliaryInterface(abc.ABC):
         blocking: bool = True,
         timeout_in_s: int = 5,
         timeout_result: Any = None,
+        priority: Union[str, QueuePriority] = QueuePriority.BULK,
     ) -> Any:
         """Send a request by transmitting it through queue_in and
         waiting for a response using queue_out.
@@ -122,6 +632,10 @@ class AuxiliaryInterface(abc.ABC):
             for an answer
         :param timeout_result: Value to return when the command times
             out. Defaults to None.
+        :param priority: lane of queue_in the command is put in, higher
+            priority commands are executed first. If the auxiliary
+            correlates its responses, control commands don't wait for
+            the reply of the commands already in flight.
 
         :raises pykiso.exceptions.AuxiliaryNotStarted: if a command is
             executed although the auxiliary was not started.
@@ -133,22 +647,217 @@ class AuxiliaryInterface(abc.ABC):
         if self._stop_event.is_set():
             return timeout_result
 
-        with self.lock:
+        if QueuePriority(priority) == QueuePriority.CONTROL and self.correlates_responses:
+            correlation_id = self._get_command_correlation_id(cmd_message)
+            if correlation_id is not None:
+                return self._run_control_command(
+                    cmd_message, cmd_data, correlation_id, blocking, timeout_in_s, timeout_result
+                )
+
+        with tracer.span("run_command", "auxiliary", aux=self.name, command=cmd_message), self.lock:
             if not self.is_instance:
                 raise AuxiliaryNotStarted(self.name)
+            if self.is_suspended:
+                log.warning(f"command {cmd_message} not sent, auxiliary {self.name} is suspended")
+                return timeout_result
 
-            log.internal_debug(f"sending command '{cmd_message}' with payload {cmd_data} using {self.name} aux.")
+            log.internal_debug("sending command '%s' with payload %s using %s aux.", cmd_message, cmd_data, self.name)
             response_received = timeout_result
-            self.queue_in.put((cmd_message, cmd_data))
+            start = time.perf_counter()
+            self.queue_in.put((cmd_message, cmd_data), priority=priority)
             try:
                 response_received = self.queue_out.get(blocking, timeout_in_s)
-                log.internal_debug(f"reply to command '{cmd_message}' received: '{response_received}' in {self.name}")
+                self.metrics.observe("run_command_latency", time.perf_counter() - start)
+                log.internal_debug(
+                    "reply to command '%s' received: '%s' in %s", cmd_message, response_received, self.name
+                )
             except queue.Empty:
+                self.metrics.increment("run_command_timeouts")
                 log.error(
                     f"no reply received within time for command {cmd_message} for payload {cmd_data} using {self.name} aux."
                 )
         return response_received
 
+    def _run_control_command(
+        self,
+        cmd_message: Any,
+        cmd_data: Any,
+        correlation_id: Hashable,
+        blocking: bool,
+        timeout_in_s: int,
+        timeout_result: Any,
+    ) -> Any:
+        """Send a control command and wait for the response routed to it
+        by correlation ID.
+
+        Unlike the other commands of :py:meth:`run_command`, the lock is
+        not kept until the response arrives: a control command can
+        therefore overtake a command still waiting for its reply.
+
+        :param cmd_message: command request to the auxiliary
+        :param cmd_data: data you would like to populate the command
+            with
+        :param correlation_id: identifier shared by the request and its
+            response
+        :param blocking: If you want the command request to be
+            blocking or not
+        :param timeout_in_s: Number of time (in s) you want to wait
+            for an answer
+        :param timeout_result: Value to return when the command times
+            out
+
+        :return: the response to the command, timeout_result if none
+            was received in time
+        """
+        with tracer.span("run_command", "auxiliary", aux=self.name, command=cmd_message):
+            if self.is_suspended:
+                log.warning(f"command {cmd_message} not sent, auxiliary {self.name} is suspended")
+                return timeout_result
+
+            log.internal_debug("sending command '%s' with payload %s using %s aux.", cmd_message, cmd_data, self.name)
+            start = time.perf_counter()
+            future = self.submit_command(cmd_message, cmd_data, correlation_id, priority=QueuePriority.CONTROL)
+            try:
+                response_received = future.result(timeout=timeout_in_s if blocking else 0)
+            except concurrent.futures.TimeoutError:
+                future.cancel()
+                self.metrics.increment("run_command_timeouts")
+                log.error(
+                    f"no reply received within time for command {cmd_message} for payload {cmd_data} using {self.name} aux."
+                )
+                return timeout_result
+            self.metrics.observe("run_command_latency", time.perf_counter() - start)
+            log.internal_debug("reply to command '%s' received: '%s' in %s", cmd_message, response_received, self.name)
+        return response_received
+
+    def submit_command(
+        self,
+        cmd_message: Any,
+        cmd_data: Any = None,
+        correlation_id: Optional[Hashable] = None,
+        priority: Union[str, QueuePriority] = QueuePriority.BULK,
+    ) -> concurrent.futures.Future:
+        """Send a request through queue_in without waiting for its
+        response.
+
+        Unlike :py:meth:`run_command`, multiple submitted commands can be
+        in flight at the same time: each reply is routed to the future
+        registered under the same correlation ID, so that a late reply
+        can never be consumed by another caller.
+
+        .. note:: a future that is not needed anymore (e.g. after a
+            timeout on ``future.result``) should be cancelled in order to
+            release its correlation ID.
+
+        :param cmd_message: command request to the auxiliary
+        :param cmd_data: data you would like to populate the command
+            with
+        :param correlation_id: identifier shared by the request and its
+            response, if not given it is derived from cmd_message
+            (e.g. the token of a :py:class:`~pykiso.message.Message`)
+        :param priority: lane of queue_in the command is put in, higher
+            priority commands are executed first
+
+        :raises NotImplementedError: if the auxiliary doesn't route its
+            responses to the submitted commands (see
+            :py:attr:`correlates_responses`), its futures would never
+            complete
+        :raises pykiso.exceptions.AuxiliaryNotStarted: if a command is
+            submitted although the auxiliary was not started.
+        :raises ValueError: if no correlation ID could be determined or
+            if a command with the same correlation ID is still in flight
+        :return: future resolved with the response to the command,
+            already cancelled if the auxiliary is suspended
+        """
+        if not self.correlates_responses:
+            raise NotImplementedError(f"Auxiliary {self.name} doesn't route responses to submitted commands")
+        if not self.is_instance:
+            raise AuxiliaryNotStarted(self.name)
+        if self.is_suspended:
+            log.warning(f"command {cmd_message} not sent, auxiliary {self.name} is suspended")
+            future = concurrent.futures.Future()
+            future.cancel()
+            return future
+
+        if correlation_id is None:
+            correlation_id = self._get_command_correlation_id(cmd_message)
+        if correlation_id is None:
+            raise ValueError(f"No correlation ID available for command {cmd_message!r}")
+
+        future = concurrent.futures.Future()
+        with self._pending_lock:
+            if correlation_id in self._pending_commands:
+                raise ValueError(f"A command with correlation ID {correlation_id!r} is already in flight")
+            self._pending_commands[correlation_id] = future
+        future.add_done_callback(functools.partial(self._forget_command, correlation_id))
+
+        log.internal_debug(
+            "submitting command '%s' (correlation ID %r) using %s aux.", cmd_message, correlation_id, self.name
+        )
+        self.queue_in.put((cmd_message, cmd_data), priority=priority)
+        return future
+
+    def _forget_command(self, correlation_id: Hashable, future: concurrent.futures.Future) -> None:
+        """Release the correlation ID of a completed or cancelled future.
+
+        :param correlation_id: correlation ID of the submitted command
+        :param future: the future bound to this correlation ID
+        """
+        with self._pending_lock:
+            if self._pending_commands.get(correlation_id) is future:
+                del self._pending_commands[correlation_id]
+
+    def _get_command_correlation_id(self, cmd_message: Any) -> Optional[Hashable]:
+        """Get the correlation ID of a submitted command.
+
+        :param cmd_message: command request submitted to the auxiliary
+
+        :return: the message token if any otherwise None
+        """
+        return getattr(cmd_message, "msg_token", None)
+
+    def _get_response_correlation_id(self, response: Any) -> Optional[Hashable]:
+        """Get the correlation ID of a received response.
+
+        :param response: response received by the auxiliary
+
+        :return: the message token if any otherwise None
+        """
+        return getattr(response, "msg_token", None)
+
+    def _resolve_command(self, response: Any) -> bool:
+        """Complete the future of the submitted command matching the
+        given response.
+
+        Meant to be called from the child defined _receive_message.
+
+        :param response: response received by the auxiliary
+
+        :return: True if the response was routed to a pending future,
+            False if it should be handled as usual
+        """
+        if not self._pending_commands:
+            return False
+        correlation_id = self._get_response_correlation_id(response)
+        with self._pending_lock:
+            future = self._pending_commands.pop(correlation_id, None)
+        if future is None:
+            return False
+        try:
+            future.set_result(response)
+        except concurrent.futures.InvalidStateError:
+            # the future was cancelled in the meantime
+            return False
+        return True
+
+    def _cancel_pending_commands(self) -> None:
+        """Cancel all futures of commands still in flight."""
+        with self._pending_lock:
+            pending = list(self._pending_commands.values())
+            self._pending_commands.clear()
+        for future in pending:
+            future.cancel()
+
     def create_instance(self) -> bool:
         """Start auxiliary's running tasks and activities.
 
@@ -174,6 +883,8 @@ class AuxiliaryInterface(abc.ABC):
             self._start_rx_task()
 
             self.is_instance = True
+            if self.stall_timeout is not None:
+                AuxiliaryWatchdog.get_watchdog().watch(self)
             return is_created
 
     def delete_instance(self) -> bool:
@@ -191,17 +902,24 @@ class AuxiliaryInterface(abc.ABC):
                 self._stop_event.clear()
                 return True
 
+            if self.stall_timeout is not None:
+                AuxiliaryWatchdog.get_watchdog().unwatch(self)
+            # a suspended auxiliary's threads have to be released to stop
+            self._resume_event.set()
             # stop each auxiliary's tasks
             self._stop_tx_task()
             self._stop_rx_task()
 
             is_deleted = self._delete_auxiliary_instance()
+            self._cancel_pending_commands()
 
             if not is_deleted:
                 log.error(f"Unexpected error occurred during deletion of auxiliary instance {self.name}")
 
             self.is_instance = False
             self._stop_event.clear()
+            # let a lazy auxiliary's idle monitor terminate
+            self._idle_wakeup.set()
             return is_deleted
 
     def _start_tx_task(self) -> None:
@@ -222,33 +940,84 @@ class AuxiliaryInterface(abc.ABC):
             log.internal_debug("reception task is not needed, don't start it")
             return
         with self.rx_lock:
+            if self.use_reactor and self._register_to_reactor():
+                return
             task_name = f"{self.name}_rx"
             log.internal_debug("start reception task %s", task_name)
             # Any created thread should disappear after main-thread exit
             self.rx_thread = threading.Thread(name=task_name, target=self._reception_task, daemon=True)
             self.rx_thread.start()
 
-    def _stop_tx_task(self) -> None:
-        """Stop transmission task."""
+    def _get_channel_fileno(self) -> Optional[int]:
+        """Get the file descriptor of the attached channel, if it can
+        expose its readiness.
+
+        :return: the channel's file descriptor otherwise None
+        """
+        channel = getattr(self, "channel", None)
+        # only consider an implementation defined on the channel's class,
+        # a mocked or wrapping channel would otherwise accept any attribute
+        if getattr(type(channel), "fileno", None) is None:
+            return None
+        try:
+            fileno = channel.fileno()
+        except Exception:
+            return None
+        return fileno if isinstance(fileno, int) and fileno >= 0 else None
+
+    def _register_to_reactor(self) -> bool:
+        """Register the auxiliary's reception to the shared reactor.
+
+        :return: True if the reception is handled by the reactor,
+            False if a dedicated rx thread is needed
+        """
+        fileno = self._get_channel_fileno()
+        if fileno is None:
+            log.internal_warning(f"Channel of {self.name} cannot expose its readiness, fall back to a rx thread")
+            return False
+        reactor = AuxiliaryReactor.get_reactor()
+        if not reactor.register(self, fileno):
+            return False
+        log.internal_debug(f"reception of {self.name} is handled by the reactor")
+        self._reactor = reactor
+        return True
+
+    def _stop_tx_task(self, join_timeout: Optional[float] = None) -> None:
+        """Stop transmission task.
+
+        :param join_timeout: maximum time in seconds to wait for the
+            thread to end, None waits until it ends
+        """
         if self.tx_task_on is False:
             log.internal_debug("transmit task was not started, no need to stop it")
             return
 
         log.internal_debug(f"stop transmit task {self.name}_tx")
-        self.queue_in.put((AuxCommand.DELETE_AUXILIARY, None))
+        # set the stop flag first: if a full dropping queue discards the delete
+        # command, the tx task will still end after its next queued command
         self.stop_tx.set()
-        self.tx_thread.join()
+        self.queue_in.put((AuxCommand.DELETE_AUXILIARY, None), priority=QueuePriority.CONTROL)
+        self.tx_thread.join(join_timeout)
         self.stop_tx.clear()
 
-    def _stop_rx_task(self) -> None:
-        """Stop reception task."""
+    def _stop_rx_task(self, join_timeout: Optional[float] = None) -> None:
+        """Stop reception task.
+
+        :param join_timeout: maximum time in seconds to wait for the
+            thread to end, None waits until it ends
+        """
         if self.rx_task_on is False:
             log.internal_debug("reception task was not started, no need to stop it")
             return
         with self.rx_lock:
+            if self._reactor is not None:
+                log.internal_debug(f"unregister {self.name} from reactor")
+                self._reactor.unregister(self)
+                self._reactor = None
+                return
             log.internal_debug(f"stop reception task {self.name}_rx")
             self.stop_rx.set()
-            self.rx_thread.join()
+            self.rx_thread.join(join_timeout)
             self.stop_rx.clear()
 
     def start(self) -> bool:
@@ -285,12 +1054,30 @@ class AuxiliaryInterface(abc.ABC):
         if not stop_status:
             raise RuntimeError(f"Failed to stop auxiliary {self.name}")
 
+    @property
+    def is_suspended(self) -> bool:
+        """True if the auxiliary is running but suspended."""
+        return not self._resume_event.is_set()
+
     def suspend(self) -> bool:
         """Supend current auxiliary's run.
 
+        With warm_suspend enabled, the threads and the channel are kept
+        and all received data is discarded until the auxiliary is
+        resumed. New commands are not sent: run_command returns its
+        timeout_result and submit_command a cancelled future. The
+        commands queued before the suspension are sent once resumed.
+        Otherwise the auxiliary is stopped.
+
         :return: True if the auxiliary is suspend otherwise False
         """
-        return self.delete_instance()
+        if not self.warm_suspend:
+            return self.delete_instance()
+        with self.lock:
+            if self.is_instance:
+                log.internal_info(f"Suspending auxiliary {self.name}")
+                self._resume_event.clear()
+            return True
 
     def resume(self) -> bool:
         """Resume current auxiliary's run.
@@ -300,6 +1087,11 @@ class AuxiliaryInterface(abc.ABC):
 
         :return: True if the auxiliary is resumed otherwise False
         """
+        with self.lock:
+            if self.is_instance and self.is_suspended:
+                log.internal_info(f"Resuming auxiliary {self.name}")
+                self._resume_event.set()
+                return True
         return self.create_instance()
 
     def _transmit_task(self) -> None:
@@ -313,15 +1105,58 @@ class AuxiliaryInterface(abc.ABC):
             if cmd == AuxCommand.DELETE_AUXILIARY:
                 break
 
-            self._run_command(cmd, data)
+            # hold back the commands while the auxiliary is suspended
+            self._resume_event.wait()
+            if self.stop_tx.is_set():
+                break
+
+            thread = threading.current_thread()
+            self._busy_since[thread] = time.monotonic()
+            try:
+                with tracer.span("_run_command", "auxiliary", aux=self.name, command=cmd):
+                    self._run_command(cmd, data)
+            finally:
+                self._busy_since.pop(thread, None)
+            if thread in self._abandoned_threads:
+                break
 
     def _reception_task(self) -> None:
         """Auxiliary reception task.
 
         Simply call the child defined _receive_message method.
         """
-        while not self.stop_rx.is_set():
-            self._receive_message(timeout_in_s=self.recv_timeout)
+        thread = threading.current_thread()
+        while not self.stop_rx.is_set() and thread not in self._abandoned_threads:
+            self.metrics.increment("rx_iterations")
+            self._busy_since[thread] = time.monotonic()
+            try:
+                self._dispatch_reception(timeout_in_s=self.recv_timeout)
+            finally:
+                self._busy_since.pop(thread, None)
+
+    def _dispatch_reception(self, timeout_in_s: float) -> None:
+        """Receive a message with _receive_message, or discard it while
+        the auxiliary is suspended.
+
+        :param timeout_in_s: maximum time in seconds to wait for a message
+        """
+        if self._resume_event.is_set():
+            with tracer.span("_receive_message", "auxiliary", aux=self.name):
+                self._receive_message(timeout_in_s=timeout_in_s)
+            return
+
+        channel = getattr(self, "channel", None)
+        if channel is None:
+            self._resume_event.wait(timeout_in_s)
+            return
+        try:
+            recv_response = channel.cc_receive(timeout=timeout_in_s)
+        except Exception:
+            log.internal_debug("failed to drain channel of suspended auxiliary %s", self.name, exc_info=True)
+            self._resume_event.wait(timeout_in_s)
+            return
+        if isinstance(recv_response, dict) and recv_response.get("msg") is not None:
+            self.metrics.increment("rx_discarded")
 
     def wait_for_queue_out(self, blocking: bool = False, timeout_in_s: int = 0) -> Optional[Any]:
         """Wait for data from the queue out.
@@ -338,6 +1173,14 @@ class AuxiliaryInterface(abc.ABC):
         except queue.Empty:
             return None
 
+    def get_queue_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get the fill level and overflow counters of the auxiliary's
+        queues.
+
+        :return: statistics of queue_in and queue_out
+        """
+        return {"queue_in": self.queue_in.stats(), "queue_out": self.queue_out.stats()}
+
     def shutdown(self):
         """Uninitialize method. Will be called at the end of the test session."""
         pass
@@ -375,6 +1218,11 @@ class AuxiliaryInterface(abc.ABC):
         """Defines what needs to be done as a receive message. Such as,
          what do I need to do to receive a message.
 
+        .. warning:: when the reception is dispatched by the
+            :py:class:`AuxiliaryReactor`, this method is called with a
+            timeout of 0 from the thread shared by all auxiliaries and
+            must not block.
+
         :param timeout_in_s: How much time to block on the receive
         """
 
@@ -33,11 +33,14 @@ from . import __version__
 from .config_parser import parse_config
 from .global_config import Grabber
 from .logging_initializer import change_logger_class, initialize_logging
+from .metrics import registry as metrics_registry
 from .test_coordinator import test_execution
 from .test_setup.config_registry import ConfigRegistry
+from .tracing import tracer
 from .types import PathType
 
 UNRESOLVED_THREAD_TIMEOUT = 10
+UNRESOLVED_THREAD_POLL_INTERVAL = 0.1
 
 
 def eval_user_tags(click_context: click.Context) -> Dict[str, List[str]]:
@@ -97,7 +100,8 @@ def active_threads() -> list[str]:
 def check_and_handle_unresolved_threads(log: logging.Logger, timeout: int = 10) -> None:
     """Check if there are unresolved threads and handle them.
     Process for unresolved threads:
-    - If there are unresolved threads, log a warning and wait for a timeout.
+    - If there are unresolved threads, log a warning and wait up to a timeout
+      for them to terminate.
     - If the threads are still running after the timeout, log a fatal error and force exit.
     - If the threads are properly shut down, log a warning and exit normally.
     """
@@ -107,8 +111,12 @@ def check_and_handle_unresolved_threads(log: logging.Logger, timeout: int = 10)
     if len(running_threads) > 0:
         for thread in running_threads:
             log.warning(f"Unresolved thread {thread} is still running")
-        log.warning(f"Wait {timeout}s for unresolved threads to be terminated.")
-        time.sleep(timeout)
+        log.warning(f"Wait up to {timeout}s for unresolved threads to be terminated.")
+        # poll instead of sleeping for the whole timeout to return as soon as possible
+        for _ in range(int(timeout / UNRESOLVED_THREAD_POLL_INTERVAL)):
+            if threading.active_count() <= 1:
+                break
+            time.sleep(UNRESOLVED_THREAD_POLL_INTERVAL)
         if threading.active_count() > 1:
             log.fatal(
                 f"Unresolved threads {', '.join(active_threads())} are still running after {timeout} seconds. Force pykiso to Exit."
@@ -220,6 +228,25 @@ class CommandWithOptionalFlagValues(click.Command):
     required=False,
     help="use the specified logger class in pykiso",
 )
+@click.option(
+    "--parallel-startup",
+    is_flag=True,
+    help="start all auxiliaries concurrently before running the tests",
+)
+@click.option(
+    "--metrics-output",
+    required=False,
+    default=None,
+    type=click.Path(writable=True, dir_okay=False),
+    help="dump the performance metrics of all auxiliaries and channels to the specified JSON file",
+)
+@click.option(
+    "--trace-timeline",
+    required=False,
+    default=None,
+    type=click.Path(writable=True, dir_okay=False),
+    help="record a timeline of the auxiliary, channel and test activity to the specified Chrome trace JSON file",
+)
 @click.version_option(__version__)
 @click.pass_context
 @Grabber.grab_cli_config
@@ -235,6 +262,9 @@ def main(
     verbose: bool = False,
     logger: Optional[str] = None,
     junit: Optional[str] = None,
+    metrics_output: Optional[PathType] = None,
+    parallel_startup: bool = False,
+    trace_timeline: Optional[PathType] = None,
 ):
     """Embedded Integration Test Framework - CLI Entry Point.
 
@@ -256,6 +286,9 @@ def main(
     :param failfast: stop the test run on the first error or failure
     :param verbose: activate logging for the whole framework
     :param logger: class of the logger that will be used in the tests
+    :param metrics_output: file path for the JSON metrics dump or None
+    :param parallel_startup: start independent auxiliaries concurrently
+    :param trace_timeline: file path for the Chrome trace export or None
     """
     # we are expecting one log file path or as many as the provided configuration files
     if log_path and len(log_path) not in (1, len(test_configuration_file)):
@@ -272,6 +305,11 @@ def main(
     if logger:
         change_logger_class(log_level, verbose, logger)
 
+    session_metrics = {}
+
+    if trace_timeline is not None:
+        tracer.enable()
+
     for idx, config_file in enumerate(test_configuration_file):
         yaml_name = Path(config_file).stem
 
@@ -289,7 +327,7 @@ def main(
         log.debug("cfg_dict:\n%s", pprint.pformat(cfg_dict))
 
         # Run tests
-        with ConfigRegistry.provide_auxiliaries(cfg_dict):
+        with ConfigRegistry.provide_auxiliaries(cfg_dict, parallel_startup):
             exit_code = test_execution.execute(
                 cfg_dict,
                 report_type,
@@ -300,6 +338,9 @@ def main(
                 failfast,
                 junit,
             )
+            if metrics_output is not None:
+                # snapshot before the auxiliaries are released at context exit
+                session_metrics[yaml_name] = metrics_registry.snapshot_all()
 
         for handler in logging.getLogger().handlers:
             if isinstance(handler, logging.FileHandler):
@@ -307,4 +348,11 @@ def main(
 
         check_and_handle_unresolved_threads(log, timeout=UNRESOLVED_THREAD_TIMEOUT)
 
+    if metrics_output is not None:
+        metrics_registry.dump_json(metrics_output, session_metrics)
+
+    if trace_timeline is not None:
+        tracer.disable()
+        tracer.dump_json(trace_timeline)
+
     sys.exit(exit_code)
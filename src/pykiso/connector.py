@@ -20,15 +20,27 @@ Interface Definition for Connectors, CChannels and Flasher
 
 """
 import abc
+import asyncio
+import collections
 import logging
 import pathlib
+import selectors
 import threading
-from typing import Dict, Optional
+import time
+from typing import Coroutine, Deque, Dict, Iterable, List, Optional, Tuple
 
+from .metrics import Metrics
+from .tracing import tracer
 from .types import MsgType, PathType
 
 log = logging.getLogger(__name__)
 
+#: default maximum number of messages returned by a single cc_receive_many call
+RECEIVE_BATCH_SIZE = 64
+#: duration in seconds of the sliding window over which the offset between
+#: a hardware clock and the host clock is estimated, to follow clock drift
+HW_CLOCK_WINDOW = 10.0
+
 
 class Connector(abc.ABC):
     """Abstract interface for all connectors to inherit from.
@@ -86,21 +98,82 @@ class CChannel(Connector):
         self._lock_rx = threading.RLock()
         self._lock = threading.Lock()
         self.auto_open = auto_open
+        self.metrics = Metrics(f"channel.{self.name or type(self).__name__}")
+        #: offset to add to the hardware timestamps to express them on the
+        #: host clock (time.perf_counter), None until a timestamp is received
+        self.hw_clock_offset: Optional[float] = None
+        self._hw_clock_samples: Deque[Tuple[float, float]] = collections.deque()
 
     def open(self) -> None:
         """Open a thread-safe channel."""
         with self._lock:
             self._cc_open()
+            # the device clock may have been reset
+            self.hw_clock_offset = None
+            self._hw_clock_samples.clear()
 
     def close(self) -> None:
         """Close a thread-safe channel."""
         with self._lock:
             self._cc_close()
 
+    def close_when_idle(self, timeout: float) -> bool:
+        """Close the channel once no other thread opens, closes or
+        transfers data through it, without waiting longer than timeout.
+
+        :param timeout: time in seconds to wait for the channel to be
+            released
+        :return: True if the channel got closed, False if it is still in
+            use
+        """
+        deadline = time.monotonic() + timeout
+        acquired = []
+        try:
+            for lock in (self._lock, self._lock_tx, self._lock_rx):
+                if not lock.acquire(timeout=max(deadline - time.monotonic(), 0)):
+                    return False
+                acquired.append(lock)
+            self._cc_close()
+            return True
+        finally:
+            for lock in reversed(acquired):
+                lock.release()
+
     def shutdown(self) -> None:
         """Uninitialize channel. Will be called at the end of the test session."""
         pass
 
+    def fileno(self) -> Optional[int]:
+        """Get the file descriptor becoming readable when data is
+        received, to multiplex several channels with :py:mod:`selectors`.
+
+        Channels backed by a socket, a serial port... should override
+        this method.
+
+        :return: the file descriptor, None if the channel can't expose
+            its readiness
+        """
+        return None
+
+    def wait_readable(self, timeout: Optional[float] = None) -> bool:
+        """Wait until data can be received from the channel.
+
+        The default implementation waits on :py:meth:`fileno`. A channel
+        without file descriptor is always considered readable, its
+        reception then applies its own timeout.
+
+        :param timeout: time in second to wait, None to wait forever
+
+        :return: True if the channel is readable, False if the timeout
+            expired
+        """
+        fileno = self.fileno()
+        if fileno is None:
+            return True
+        with selectors.DefaultSelector() as selector:
+            selector.register(fileno, selectors.EVENT_READ)
+            return bool(selector.select(timeout))
+
     def cc_send(self, msg: MsgType, *args, **kwargs) -> None:
         """Send a thread-safe message on the channel and wait for an acknowledgement.
 
@@ -109,8 +182,14 @@ class CChannel(Connector):
         """
         if ("raw" in kwargs) or args:
             log.internal_warning("Use of 'raw' keyword argument is deprecated. It won't be passed to '_cc_send'.")
-        with self._lock_tx:
+        with tracer.span("cc_send", "channel", channel=self.name), self._lock_tx:
+            start = time.perf_counter()
             self._cc_send(msg=msg, **kwargs)
+            duration = time.perf_counter() - start
+        counters = {"send_calls": 1}
+        if isinstance(msg, (bytes, bytearray)):
+            counters["send_bytes"] = len(msg)
+        self.metrics.record({"send_duration": duration}, counters)
 
     def cc_receive(self, timeout: float = 0.1, *args, **kwargs) -> Dict[str, Optional[bytes]]:
         """Read a thread-safe message on the channel and send an acknowledgement.
@@ -122,8 +201,223 @@ class CChannel(Connector):
         """
         if ("raw" in kwargs) or args:
             log.internal_warning("Use of 'raw' keyword argument is deprecated. It won't be passed to '_cc_receive'.")
-        with self._lock_rx:
-            return self._cc_receive(timeout=timeout, **kwargs)
+        with tracer.span("cc_receive", "channel", channel=self.name), self._lock_rx:
+            start = time.perf_counter()
+            recv_response = self._cc_receive(timeout=timeout, **kwargs)
+            end = time.perf_counter()
+        counters = {}
+        self._record_reception(recv_response, end, counters)
+        self.metrics.record({"receive_duration": end - start}, counters)
+        return recv_response
+
+    def cc_send_many(self, msgs: Iterable[MsgType], **kwargs) -> None:
+        """Send several thread-safe messages on the channel, taking the
+        transmission lock only once.
+
+        :param msgs: messages to send, in order
+        :param kwargs: named arguments applied to every message
+        """
+        msgs = list(msgs)
+        with tracer.span("cc_send_many", "channel", channel=self.name, count=len(msgs)), self._lock_tx:
+            start = time.perf_counter()
+            self._cc_send_many(msgs, **kwargs)
+            duration = time.perf_counter() - start
+        self.metrics.record(
+            {"send_duration": duration},
+            {
+                "send_calls": len(msgs),
+                "send_bytes": sum(len(msg) for msg in msgs if isinstance(msg, (bytes, bytearray))),
+            },
+        )
+
+    def cc_receive_many(
+        self, max_count: int = RECEIVE_BATCH_SIZE, timeout: float = 0.1, **kwargs
+    ) -> List[Dict[str, Optional[bytes]]]:
+        """Read the messages available on the channel, taking the
+        reception lock only once.
+
+        Only the first message is waited for, the following ones are
+        returned only if already available.
+
+        :param max_count: maximum number of messages to return
+        :param timeout: time in second to wait for the first message
+        :param kwargs: named arguments
+
+        :return: the received messages, in the format returned by
+            :py:meth:`cc_receive`, empty if none was received
+        """
+        with tracer.span("cc_receive_many", "channel", channel=self.name), self._lock_rx:
+            start = time.perf_counter()
+            responses = self._cc_receive_many(max_count, timeout=timeout, **kwargs)
+            end = time.perf_counter()
+        counters = {} if responses else {"receive_empty": 1}
+        for recv_response in responses:
+            self._record_reception(recv_response, end, counters)
+        self.metrics.record({"receive_duration": end - start}, counters)
+        return responses
+
+    def cc_receive_into(self, buffer: memoryview, timeout: float = 0.1, **kwargs) -> int:
+        """Read a thread-safe message on the channel directly into a
+        caller-provided buffer.
+
+        Reusing the same buffer for each reception avoids allocating a
+        new bytes object per message, e.g. when capturing high-rate logs.
+
+        :param buffer: writable buffer (bytearray, memoryview...) to fill
+            from its beginning
+        :param timeout: time in second to wait for reading a message
+        :param kwargs: named arguments
+
+        :raises ValueError: if the received message doesn't fit into the
+            buffer
+        :return: number of bytes written into the buffer, 0 if nothing
+            was received
+        """
+        with tracer.span("cc_receive_into", "channel", channel=self.name), self._lock_rx:
+            start = time.perf_counter()
+            size = self._cc_receive_into(memoryview(buffer).cast("B"), timeout=timeout, **kwargs)
+            duration = time.perf_counter() - start
+        counters = {"receive_data": 1, "receive_bytes": size} if size else {"receive_empty": 1}
+        self.metrics.record({"receive_duration": duration}, counters)
+        return size
+
+    def _cc_send_many(self, msgs: List[MsgType], **kwargs) -> None:
+        """Send several messages on the channel.
+
+        Connectors able to transmit a batch more efficiently than one
+        message at a time should override this method.
+
+        :param msgs: messages to send, in order
+        :param kwargs: named arguments applied to every message
+        """
+        for msg in msgs:
+            self._cc_send(msg=msg, **kwargs)
+
+    def _cc_receive_many(self, max_count: int, timeout: float, **kwargs) -> List[Dict[str, Optional[bytes]]]:
+        """Receive up to max_count messages, waiting for the first one
+        only.
+
+        The messages following the first one are only read while
+        :py:meth:`wait_readable` reports pending data, a channel unable
+        to expose its readiness only returns the first message.
+        Connectors able to drain their pending messages more efficiently
+        than one message at a time should override this method.
+
+        :param max_count: maximum number of messages to return
+        :param timeout: time in second to wait for the first message
+        :param kwargs: named arguments
+        :return: the received messages, empty if none was received
+        """
+        responses = []
+        while len(responses) < max_count:
+            if responses and not self._is_readable_now():
+                break
+            recv_response = self._cc_receive(timeout=timeout, **kwargs)
+            msg = recv_response.get("msg") if isinstance(recv_response, dict) else recv_response
+            if msg is None or (isinstance(msg, (bytes, bytearray)) and not msg):
+                break
+            if isinstance(recv_response, dict):
+                recv_response.setdefault("rx_timestamp", time.perf_counter())
+            responses.append(recv_response)
+        return responses
+
+    def _is_readable_now(self) -> bool:
+        """Check without waiting whether a message can be received.
+
+        :return: True if data is pending, False if there is none or if
+            the channel can't expose its readiness
+        """
+        if self.fileno() is None and type(self).wait_readable is CChannel.wait_readable:
+            return False
+        return self.wait_readable(0)
+
+    def _cc_receive_into(self, buffer: memoryview, timeout: float, **kwargs) -> int:
+        """Receive a message and copy it into the given buffer.
+
+        Connectors able to read directly into a buffer (recv_into,
+        readinto...) should override this method to avoid the
+        intermediate bytes object.
+
+        :param buffer: writable byte-formatted buffer to fill
+        :param timeout: time in second to wait for a message
+        :param kwargs: named arguments
+
+        :raises TypeError: if the received message isn't raw bytes
+        :raises ValueError: if the received message doesn't fit into the
+            buffer
+        :return: number of bytes written into the buffer
+        """
+        recv_response = self._cc_receive(timeout=timeout, **kwargs)
+        msg = recv_response.get("msg") if isinstance(recv_response, dict) else recv_response
+        if not msg:
+            return 0
+        if not isinstance(msg, (bytes, bytearray)):
+            raise TypeError(f"Cannot copy received {type(msg).__name__} into a buffer")
+        if len(msg) > len(buffer):
+            raise ValueError(f"Received {len(msg)} bytes, buffer can only hold {len(buffer)}")
+        buffer[: len(msg)] = msg
+        return len(msg)
+
+    def _record_reception(self, recv_response: Optional[Dict], rx_timestamp: float, counters: Dict[str, int]) -> None:
+        """Count the received message and timestamp it.
+
+        Each received message gets an ``rx_timestamp`` entry taken from
+        :py:func:`time.perf_counter`, unless the connector already set
+        a more accurate one. The hardware ``timestamp`` provided by some
+        connectors is kept as is and used to calibrate
+        :py:attr:`hw_clock_offset`.
+
+        :param recv_response: value returned by _cc_receive
+        :param rx_timestamp: host time at which _cc_receive returned
+        :param counters: reception counters to increase, recorded by the
+            caller in a single metrics update
+        """
+        msg = recv_response.get("msg") if isinstance(recv_response, dict) else recv_response
+        if msg is None:
+            counters["receive_empty"] = counters.get("receive_empty", 0) + 1
+            return
+        counters["receive_data"] = counters.get("receive_data", 0) + 1
+        if isinstance(msg, (bytes, bytearray)):
+            counters["receive_bytes"] = counters.get("receive_bytes", 0) + len(msg)
+        if isinstance(recv_response, dict):
+            rx_timestamp = recv_response.setdefault("rx_timestamp", rx_timestamp)
+            hw_timestamp = recv_response.get("timestamp")
+            if hw_timestamp is not None:
+                self._calibrate_hw_clock(hw_timestamp, rx_timestamp)
+
+    def _calibrate_hw_clock(self, hw_timestamp: float, rx_timestamp: float) -> None:
+        """Update the offset between the hardware and the host clocks.
+
+        The smallest difference observed during the last
+        :py:data:`HW_CLOCK_WINDOW` seconds is kept, it corresponds to the
+        message that was delivered with the lowest latency. Only taking
+        the recent messages into account follows the drift between both
+        clocks on long runs.
+
+        :param hw_timestamp: timestamp of the message on the hardware clock
+        :param rx_timestamp: timestamp of the message on the host clock
+        """
+        offset = rx_timestamp - float(hw_timestamp)
+        samples = self._hw_clock_samples
+        # older samples with a larger offset can't be the minimum anymore
+        while samples and samples[-1][1] >= offset:
+            samples.pop()
+        samples.append((rx_timestamp, offset))
+        while samples[0][0] < rx_timestamp - HW_CLOCK_WINDOW:
+            samples.popleft()
+        self.hw_clock_offset = samples[0][1]
+
+    def to_host_time(self, hw_timestamp: float) -> Optional[float]:
+        """Convert a hardware timestamp to the host clock used for the
+        ``rx_timestamp`` of all channels.
+
+        :param hw_timestamp: timestamp provided by the connector
+        :return: the corresponding :py:func:`time.perf_counter` value,
+            None if the offset is not calibrated yet
+        """
+        if self.hw_clock_offset is None:
+            return None
+        return float(hw_timestamp) + self.hw_clock_offset
 
     @abc.abstractmethod
     def _cc_open(self) -> None:
@@ -155,6 +449,124 @@ class CChannel(Connector):
         pass
 
 
+class AsyncCChannel(Connector):
+    """Abstract class for asyncio based coordination channel.
+
+    Counterpart of :py:class:`CChannel` meant to be used by
+    :py:class:`~pykiso.interfaces.async_auxiliary.AsyncAuxiliaryInterface`.
+    All transfer methods are coroutines executed on the event loop
+    shared by the asynchronous auxiliaries.
+    """
+
+    def __init__(self, auto_open: bool = False, **kwargs: dict) -> None:
+        """Constructor.
+
+        :param auto_open: determine if the channel is automatically open.
+        """
+        super().__init__(**kwargs)
+        self.auto_open = auto_open
+        # asyncio locks are bound to the loop they are first used with,
+        # so only create them once the channel is opened on that loop
+        self._lock_tx: Optional[asyncio.Lock] = None
+        self._lock_rx: Optional[asyncio.Lock] = None
+
+    def open(self) -> None:
+        """Open the channel from synchronous code, using the shared
+        event loop.
+        """
+        self._run_on_shared_loop(self.open_async())
+
+    def close(self) -> None:
+        """Close the channel from synchronous code, using the shared
+        event loop.
+        """
+        self._run_on_shared_loop(self.close_async())
+
+    def _run_on_shared_loop(self, coro: Coroutine) -> None:
+        """Execute the given coroutine on the shared event loop and
+        wait for its completion.
+
+        :param coro: coroutine to execute
+
+        :raises RuntimeError: if called from within the shared event loop
+        """
+        from .interfaces.async_auxiliary import SharedEventLoop
+
+        try:
+            SharedEventLoop.check_blocking_call(self.name)
+        except RuntimeError:
+            coro.close()
+            raise
+        loop = SharedEventLoop.acquire()
+        try:
+            asyncio.run_coroutine_threadsafe(coro, loop).result()
+        finally:
+            SharedEventLoop.release()
+
+    async def open_async(self) -> None:
+        """Open the channel."""
+        self._lock_tx = asyncio.Lock()
+        self._lock_rx = asyncio.Lock()
+        await self._cc_open()
+
+    async def close_async(self) -> None:
+        """Close the channel."""
+        await self._cc_close()
+
+    def shutdown(self) -> None:
+        """Uninitialize channel. Will be called at the end of the test session."""
+        pass
+
+    async def cc_send(self, msg: MsgType, **kwargs) -> None:
+        """Send a message on the channel.
+
+        :param msg: message to send
+        :param kwargs: named arguments
+        """
+        async with self._lock_tx:
+            await self._cc_send(msg=msg, **kwargs)
+
+    async def cc_receive(self, timeout: float = 0.1, **kwargs) -> Dict[str, Optional[bytes]]:
+        """Read a message on the channel.
+
+        :param timeout: time in second to wait for reading a message
+        :param kwargs: named arguments
+
+        :return: the received message
+        """
+        async with self._lock_rx:
+            return await self._cc_receive(timeout=timeout, **kwargs)
+
+    @abc.abstractmethod
+    async def _cc_open(self) -> None:
+        """Open the channel."""
+        pass
+
+    @abc.abstractmethod
+    async def _cc_close(self) -> None:
+        """Close the channel."""
+        pass
+
+    @abc.abstractmethod
+    async def _cc_send(self, msg: MsgType, **kwargs) -> None:
+        """Sends the message on the channel.
+
+        :param msg: Message to send out
+        :param kwargs: named arguments
+        """
+        pass
+
+    @abc.abstractmethod
+    async def _cc_receive(self, timeout: float, **kwargs) -> Dict[str, Optional[bytes]]:
+        """How to receive something from the channel.
+
+        :param timeout: Time to wait in second for a message to be received
+        :param kwargs: named arguments
+        :return: dictionary containing the received bytes if successful, otherwise None
+        """
+        pass
+
+
 class Flasher(Connector):
     """Interface for devices that can flash firmware on our targets."""
 
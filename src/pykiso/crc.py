@@ -0,0 +1,164 @@
+##########################################################################
+# Copyright (c) 2010-2022 Robert Bosch GmbH
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# http://www.eclipse.org/legal/epl-2.0.
+#
+# SPDX-License-Identifier: EPL-2.0
+##########################################################################
+
+"""
+CRC Engine
+**********
+
+:module: crc
+
+:synopsis: table-driven CRC16 shared by the pykiso Message protocol and
+    the UART/USB connectors.
+
+The checksum is the CRC-16 with polynomial 0x1021 and initial value 0
+(also known as CRC-16/XMODEM), computed one byte at a time with a
+precomputed lookup table:
+
+.. code:: python
+
+    crc16(b"@\\x01\\x00\\x00\\x00UU\\x00")
+    verify_packets([raw_packet_1, raw_packet_2])
+
+When NumPy is installed, :py:func:`crc16_many` and
+:py:func:`verify_packets` process all buffers at once, one byte
+position at a time across all of them, instead of one buffer after the
+other.
+
+.. currentmodule:: crc
+
+"""
+from __future__ import annotations
+
+import sys
+from typing import List, Sequence, Union
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+CRC16_POLYNOMIAL = 0x1021
+CRC16_SIZE = 2
+#: below this number of buffers the vectorized path is not worth its setup
+VECTORIZE_MIN_BUFFERS = 16
+
+BytesLike = Union[bytes, bytearray, memoryview, Sequence[int]]
+
+
+def _build_crc16_table(polynomial: int) -> tuple:
+    """Compute the CRC16 of each possible byte value.
+
+    :param polynomial: generator polynomial, without its leading bit
+    :return: the 256 entries lookup table
+    """
+    table = []
+    for byte in range(256):
+        crc = byte << 8
+        for _ in range(8):
+            crc = ((crc << 1) ^ polynomial) if crc & 0x8000 else (crc << 1)
+        table.append(crc & 0xFFFF)
+    return tuple(table)
+
+
+CRC16_TABLE = _build_crc16_table(CRC16_POLYNOMIAL)
+_CRC16_ARRAY = np.array(CRC16_TABLE, dtype=np.uint16) if np is not None else None
+
+
+def crc16(data: BytesLike, crc: int = 0) -> int:
+    """Compute the CRC16 of a buffer.
+
+    :param data: bytes or sequence of byte values
+    :param crc: CRC of the previous data, to compute a CRC in several
+        chunks
+    :return: the CRC16 checksum
+    """
+    table = CRC16_TABLE
+    for byte in data:
+        crc = ((crc << 8) & 0xFFFF) ^ table[(crc >> 8) ^ byte]
+    return crc
+
+
+def crc16_array(buffer: BytesLike, offsets: "np.ndarray", lengths: "np.ndarray") -> "np.ndarray":
+    """Compute the CRC16 of many slices of a buffer at once.
+
+    :param buffer: buffer holding the data of all slices
+    :param offsets: start index of each slice in the buffer
+    :param lengths: length of each slice
+    :raises ImportError: if NumPy is not installed
+    :return: the CRC16 of each slice, as uint16 array
+    """
+    if np is None:
+        raise ImportError("numpy dependency missing, consider installing pykiso with 'pip install pykiso[analysis]'")
+
+    data = np.frombuffer(buffer, dtype=np.uint8)
+    offsets = np.asarray(offsets, dtype=np.intp)
+    lengths = np.asarray(lengths, dtype=np.intp)
+    # longest slices first: the slices still running at a byte position
+    # are then always the first ones
+    order = np.argsort(-lengths, kind="stable")
+    sorted_offsets = offsets[order]
+    sorted_lengths = lengths[order]
+    active_counts = np.searchsorted(-sorted_lengths, -np.arange(sorted_lengths[0] if len(order) else 0), side="left")
+
+    crc = np.zeros(len(order), dtype=np.uint16)
+    for position, count in enumerate(active_counts):
+        current = crc[:count]
+        index = (current >> 8) ^ data[sorted_offsets[:count] + position]
+        crc[:count] = (current << 8) ^ _CRC16_ARRAY[index]
+
+    result = np.empty_like(crc)
+    result[order] = crc
+    return result
+
+
+def crc16_many(buffers: Sequence[BytesLike]) -> List[int]:
+    """Compute the CRC16 of several buffers.
+
+    :param buffers: buffers to compute the checksum of
+    :return: the CRC16 of each buffer, in order
+    """
+    if np is None or len(buffers) < VECTORIZE_MIN_BUFFERS:
+        return [crc16(buffer) for buffer in buffers]
+
+    lengths = np.fromiter((len(buffer) for buffer in buffers), dtype=np.intp, count=len(buffers))
+    offsets = np.zeros_like(lengths)
+    np.cumsum(lengths[:-1], out=offsets[1:])
+    return crc16_array(b"".join(bytes(buffer) for buffer in buffers), offsets, lengths).tolist()
+
+
+def verify_packets(packets: Sequence[BytesLike], byteorder: str = sys.byteorder) -> List[bool]:
+    """Check the CRC16 trailing each packet.
+
+    :param packets: packets ending with the CRC16 of their content
+    :param byteorder: byte order of the trailing CRC, the native one
+        by default like :py:class:`~pykiso.message.Message`
+    :return: for each packet, True if its CRC is valid
+    """
+    if np is None or len(packets) < VECTORIZE_MIN_BUFFERS:
+        return [
+            len(packet) >= CRC16_SIZE
+            and crc16(packet[:-CRC16_SIZE]) == int.from_bytes(bytes(packet[-CRC16_SIZE:]), byteorder)
+            for packet in packets
+        ]
+
+    lengths = np.fromiter((len(packet) for packet in packets), dtype=np.intp, count=len(packets))
+    offsets = np.zeros_like(lengths)
+    np.cumsum(lengths[:-1], out=offsets[1:])
+    buffer = b"".join(bytes(packet) for packet in packets)
+    valid = lengths >= CRC16_SIZE
+    body_lengths = np.where(valid, lengths - CRC16_SIZE, 0)
+
+    # padded so that the packets shorter than a CRC can be indexed too
+    data = np.frombuffer(buffer + bytes(CRC16_SIZE), dtype=np.uint8).astype(np.uint16)
+    ends = offsets + np.maximum(lengths, CRC16_SIZE)
+    first, second = data[ends - 2], data[ends - 1]
+    expected = (first << 8 | second) if byteorder == "big" else (second << 8 | first)
+
+    valid &= crc16_array(buffer, offsets, body_lengths) == expected
+    return valid.tolist()
@@ -16,7 +16,7 @@
 """
 
 
-from typing import List, Union
+from typing import Dict, List, Union
 
 
 class PykisoError(Exception):
@@ -54,6 +54,23 @@ class AuxiliaryCreationError(PykisoError):
         super().__init__(self.message)
 
 
+class AuxiliaryStartupError(PykisoError):
+    """Raised when one or more auxiliaries failed to start during a
+    concurrent start-up.
+    """
+
+    def __init__(self, errors: Dict[str, BaseException]) -> None:
+        """Initialize attributes.
+
+        :param errors: exception raised by each auxiliary that failed,
+            stored by auxiliary alias.
+        """
+        self.errors = errors
+        details = "; ".join(f"{name}: {error!r}" for name, error in errors.items())
+        self.message = f"Failed to start auxiliaries {', '.join(errors)} ({details})"
+        super().__init__(self.message)
+
+
 class AuxiliaryNotStarted(PykisoError):
     """
     Raised when an action that requires an auxiliary to be running
@@ -0,0 +1,463 @@
+##########################################################################
+# Copyright (c) 2010-2022 Robert Bosch GmbH
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# http://www.eclipse.org/legal/epl-2.0.
+#
+# SPDX-License-Identifier: EPL-2.0
+##########################################################################
+
+"""
+Asyncio based Auxiliary Interface
+*********************************
+
+:module: async_auxiliary
+
+:synopsis: auxiliary interface whose transmission and reception tasks
+    are coroutines running on one shared event loop.
+
+Unlike :py:class:`~pykiso.auxiliary.AuxiliaryInterface`, which spawns two
+threads per auxiliary, all asynchronous auxiliaries share a single event
+loop running in a background thread. The public API is available both as
+coroutines (:py:meth:`AsyncAuxiliaryInterface.run_command_async`,
+:py:meth:`AsyncAuxiliaryInterface.receive_async`) and as blocking methods
+(:py:meth:`AsyncAuxiliaryInterface.run_command`,
+:py:meth:`AsyncAuxiliaryInterface.receive`) usable from any test case.
+
+.. currentmodule:: async_auxiliary
+
+"""
+from __future__ import annotations
+
+import abc
+import asyncio
+import logging
+import threading
+from typing import Any, Coroutine, List, Optional
+
+from ..auxiliary import AuxCommand
+from ..exceptions import AuxiliaryCreationError, AuxiliaryNotStarted
+from ..logging_initializer import add_internal_log_levels, initialize_loggers
+
+log = logging.getLogger(__name__)
+
+#: delay before retrying a failed reception, doubled on each consecutive failure
+RECEPTION_RETRY_DELAY = 0.01
+#: upper bound of the delay between two failed receptions
+RECEPTION_RETRY_MAX_DELAY = 1.0
+
+
+class SharedEventLoop:
+    """Event loop running in a background thread, shared by all
+    asynchronous auxiliaries and channels.
+
+    The loop is reference counted: the thread is started with the first
+    :py:meth:`acquire` call and stopped once every user has called
+    :py:meth:`release`.
+    """
+
+    _lock = threading.Lock()
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+    _thread: Optional[threading.Thread] = None
+    _users = 0
+
+    @classmethod
+    def acquire(cls) -> asyncio.AbstractEventLoop:
+        """Get the shared event loop, start it if necessary.
+
+        :return: the running shared event loop
+        """
+        with cls._lock:
+            if cls._loop is None:
+                cls._loop = asyncio.new_event_loop()
+                cls._thread = threading.Thread(name="aux_event_loop", target=cls._loop.run_forever, daemon=True)
+                cls._thread.start()
+            cls._users += 1
+            return cls._loop
+
+    @classmethod
+    def release(cls) -> None:
+        """Release the shared event loop, stop it if it's not used anymore."""
+        with cls._lock:
+            cls._users -= 1
+            if cls._users > 0 or cls._loop is None:
+                return
+            loop, thread = cls._loop, cls._thread
+            cls._loop = cls._thread = None
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not threading.current_thread():
+            thread.join()
+            loop.close()
+
+    @classmethod
+    def check_blocking_call(cls, name: str) -> None:
+        """Prevent a blocking call from the shared event loop thread,
+        waiting there for a coroutine scheduled on the loop never
+        returns.
+
+        :param name: name of the auxiliary or channel called
+
+        :raises RuntimeError: if called from the shared event loop thread
+        """
+        if cls._thread is not None and cls._thread is threading.current_thread():
+            raise RuntimeError(
+                f"Blocking call on {name} from the shared event loop would deadlock, await the coroutine instead"
+            )
+
+    @classmethod
+    def is_running(cls) -> bool:
+        """True if the shared event loop thread is alive."""
+        with cls._lock:
+            return cls._loop is not None
+
+
+class AsyncAuxiliaryInterface(abc.ABC):
+    """Common interface for asynchronous auxiliaries.
+
+    The transmission and reception tasks are coroutines scheduled on the
+    :py:class:`SharedEventLoop`, the command hand-off is performed through
+    :py:class:`asyncio.Queue` objects.
+    """
+
+    def __init__(
+        self,
+        name: str = None,
+        is_proxy_capable: bool = False,
+        connector_required: bool = True,
+        activate_log: List[str] = None,
+        tx_task_on: bool = True,
+        rx_task_on: bool = True,
+        auto_start: bool = True,
+    ) -> None:
+        """Initialize auxiliary attributes
+
+        :param name: alias of the auxiliary instance
+        :param is_proxy_capable: notify if the current auxiliary could
+            be (or not) associated to a proxy-auxiliary.
+        :param connector_required: define if a connector is required for
+            this auxiliary.
+        :param activate_log: loggers to deactivate
+        :param tx_task_on: enable or not the tx task
+        :param rx_task_on: enable or not the rx task
+        :param auto_start: determine if the auxiliary is automatically
+             started (magic import) or manually (by user)
+        """
+        initialize_loggers(activate_log)
+        add_internal_log_levels()
+        self.name = name
+        self.is_proxy_capable = is_proxy_capable
+        self.connector_required = connector_required
+        self.auto_start = auto_start
+        self.tx_task_on = tx_task_on
+        self.rx_task_on = rx_task_on
+        self.lock = threading.RLock()
+        self.recv_timeout = 1
+        self.is_instance = False
+        self.queue_in: Optional[asyncio.Queue] = None
+        self.queue_out: Optional[asyncio.Queue] = None
+        self.tx_task: Optional[asyncio.Task] = None
+        self.rx_task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._command_lock: Optional[asyncio.Lock] = None
+
+    def _run_sync(self, coro: Coroutine) -> Any:
+        """Execute a coroutine on the shared event loop and block until
+        its completion.
+
+        :param coro: coroutine to execute
+
+        :raises AuxiliaryNotStarted: if the auxiliary is not running
+        :raises RuntimeError: if called from within the shared event loop
+        :return: the coroutine's result
+        """
+        loop = self._loop
+        if loop is None:
+            coro.close()
+            raise AuxiliaryNotStarted(self.name)
+        try:
+            SharedEventLoop.check_blocking_call(self.name)
+        except RuntimeError:
+            coro.close()
+            raise
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    def create_instance(self) -> bool:
+        """Start auxiliary's running tasks and activities.
+
+        :return: True if the auxiliary is created otherwise False
+
+        :raises AuxiliaryCreationError: if instance creation failed
+        :raises RuntimeError: if called from within the shared event loop
+        """
+        SharedEventLoop.check_blocking_call(self.name)
+        log.internal_info(f"Creating instance of auxiliary {self.name}")
+
+        with self.lock:
+            if self.is_instance:
+                log.internal_info(f"Auxiliary {self.name} is already created")
+                return True
+
+            self._loop = SharedEventLoop.acquire()
+            try:
+                is_created = asyncio.run_coroutine_threadsafe(self._start_tasks(), self._loop).result()
+            except Exception:
+                log.exception(f"Unexpected error occurred during creation of auxiliary instance {self.name}")
+                is_created = False
+
+            if not is_created:
+                self._loop = None
+                SharedEventLoop.release()
+                raise AuxiliaryCreationError(self.name)
+
+            self.is_instance = True
+            return is_created
+
+    def delete_instance(self) -> bool:
+        """Stop auxiliary's running tasks and activities.
+
+        :return: True if the auxiliary is deleted otherwise False
+
+        :raises RuntimeError: if called from within the shared event loop
+        """
+        SharedEventLoop.check_blocking_call(self.name)
+        log.internal_info(f"Deleting instance of auxiliary {self.name}")
+
+        with self.lock:
+            if not self.is_instance:
+                log.internal_info(f"Auxiliary {self.name} is already deleted")
+                return True
+
+            try:
+                is_deleted = asyncio.run_coroutine_threadsafe(self._stop_tasks(), self._loop).result()
+            except Exception:
+                log.exception(f"Unexpected error occurred during deletion of auxiliary instance {self.name}")
+                is_deleted = False
+
+            if not is_deleted:
+                log.error(f"Unexpected error occurred during deletion of auxiliary instance {self.name}")
+
+            self.is_instance = False
+            self._loop = None
+            SharedEventLoop.release()
+            return is_deleted
+
+    async def _start_tasks(self) -> bool:
+        """Create the auxiliary instance and schedule its tasks on the
+        shared event loop.
+
+        :return: True if the auxiliary is created otherwise False
+        """
+        self.queue_in = asyncio.Queue()
+        self.queue_out = asyncio.Queue()
+        self._command_lock = asyncio.Lock()
+
+        if not await self._create_auxiliary_instance():
+            return False
+
+        if self.tx_task_on:
+            self.tx_task = asyncio.create_task(self._transmit_task(), name=f"{self.name}_tx")
+        if self.rx_task_on:
+            self.rx_task = asyncio.create_task(self._reception_task(), name=f"{self.name}_rx")
+        return True
+
+    async def _stop_tasks(self) -> bool:
+        """Stop the auxiliary's tasks and delete the auxiliary instance.
+
+        :return: True if the auxiliary is deleted otherwise False
+        """
+        if self.tx_task is not None:
+            self.queue_in.put_nowait((AuxCommand.DELETE_AUXILIARY, None))
+            await self.tx_task
+            self.tx_task = None
+        if self.rx_task is not None:
+            self.rx_task.cancel()
+            await asyncio.gather(self.rx_task, return_exceptions=True)
+            self.rx_task = None
+        return await self._delete_auxiliary_instance()
+
+    def start(self) -> bool:
+        """Force the auxiliary to start all running tasks and
+        activities.
+
+        :return: True if the auxiliary is started otherwise False
+        """
+        return self.create_instance()
+
+    def stop(self) -> bool:
+        """Force the auxiliary to stop all running tasks and activities.
+
+        :return: True if the auxiliary is stopped otherwise False
+        """
+        return self.delete_instance()
+
+    def suspend(self) -> bool:
+        """Supend current auxiliary's run.
+
+        :return: True if the auxiliary is suspend otherwise False
+        """
+        return self.delete_instance()
+
+    def resume(self) -> bool:
+        """Resume current auxiliary's run.
+
+        :return: True if the auxiliary is resumed otherwise False
+        """
+        return self.create_instance()
+
+    def shutdown(self) -> None:
+        """Uninitialize method. Will be called at the end of the test session."""
+        pass
+
+    def __enter__(self) -> AsyncAuxiliaryInterface:
+        """Context manager entry point"""
+        if self.start():
+            return self
+        raise AuxiliaryNotStarted(f"Failed to start auxiliary {self.name}")
+
+    def __exit__(self, type, value, traceback):
+        """Context manager exit point"""
+        if not self.stop():
+            raise RuntimeError(f"Failed to stop auxiliary {self.name}")
+
+    async def run_command_async(
+        self,
+        cmd_message: Any,
+        cmd_data: Any = None,
+        blocking: bool = True,
+        timeout_in_s: float = 5,
+        timeout_result: Any = None,
+    ) -> Any:
+        """Send a request by transmitting it through queue_in and
+        waiting for a response using queue_out.
+
+        :param cmd_message: command request to the auxiliary
+        :param cmd_data: data you would like to populate the command
+            with
+        :param blocking: If you want the command request to be
+            blocking or not
+        :param timeout_in_s: Number of time (in s) you want to wait
+            for an answer
+        :param timeout_result: Value to return when the command times
+            out. Defaults to None.
+
+        :raises pykiso.exceptions.AuxiliaryNotStarted: if a command is
+            executed although the auxiliary was not started.
+        :return: the response to the command or timeout_result
+        """
+        if not self.is_instance:
+            raise AuxiliaryNotStarted(self.name)
+
+        async with self._command_lock:
+            log.internal_debug("sending command '%s' with payload %s using %s aux.", cmd_message, cmd_data, self.name)
+            await self.queue_in.put((cmd_message, cmd_data))
+            response = await self.receive_async(blocking, timeout_in_s)
+            if response is None:
+                log.error(f"no reply received within time for command {cmd_message} using {self.name} aux.")
+                return timeout_result
+            return response
+
+    async def receive_async(self, blocking: bool = True, timeout_in_s: Optional[float] = None) -> Optional[Any]:
+        """Wait for data from the queue out.
+
+        :param blocking: True: wait for timeout to expire, False: return
+            immediately
+        :param timeout_in_s: if blocking, wait the defined time in
+            seconds
+
+        :return: data contained in the auxiliary's queue_out otherwise
+            None
+        """
+        try:
+            if not blocking:
+                return self.queue_out.get_nowait()
+            return await asyncio.wait_for(self.queue_out.get(), timeout_in_s)
+        except (asyncio.QueueEmpty, asyncio.TimeoutError):
+            return None
+
+    def run_command(
+        self,
+        cmd_message: Any,
+        cmd_data: Any = None,
+        blocking: bool = True,
+        timeout_in_s: float = 5,
+        timeout_result: Any = None,
+    ) -> Any:
+        """Blocking facade of :py:meth:`run_command_async`."""
+        return self._run_sync(self.run_command_async(cmd_message, cmd_data, blocking, timeout_in_s, timeout_result))
+
+    def receive(self, blocking: bool = True, timeout_in_s: Optional[float] = None) -> Optional[Any]:
+        """Blocking facade of :py:meth:`receive_async`."""
+        return self._run_sync(self.receive_async(blocking, timeout_in_s))
+
+    async def _transmit_task(self) -> None:
+        """Auxiliary transmission task.
+
+        Simply await the child defined _run_command.
+        """
+        while True:
+            cmd, data = await self.queue_in.get()
+            # just stop the current Tx task
+            if cmd == AuxCommand.DELETE_AUXILIARY:
+                break
+            try:
+                await self._run_command(cmd, data)
+            except Exception:
+                log.exception(f"encountered error while running command {cmd} in {self.name}")
+
+    async def _reception_task(self) -> None:
+        """Auxiliary reception task.
+
+        Simply await the child defined _receive_message until the task
+        gets cancelled. Consecutive failures are retried with an
+        increasing delay, and only the first one of a series is logged
+        with its traceback.
+        """
+        retry_delay = RECEPTION_RETRY_DELAY
+        failures = 0
+        while True:
+            try:
+                await self._receive_message(timeout_in_s=self.recv_timeout)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                failures += 1
+                if failures == 1:
+                    log.exception(f"encountered error while receiving message in {self.name}")
+                else:
+                    log.internal_debug("reception failed %d times in a row in %s", failures, self.name, exc_info=True)
+                await asyncio.sleep(retry_delay)
+                retry_delay = min(retry_delay * 2, RECEPTION_RETRY_MAX_DELAY)
+            else:
+                if failures:
+                    log.internal_info(f"reception recovered in {self.name} after {failures} failures")
+                retry_delay = RECEPTION_RETRY_DELAY
+                failures = 0
+
+    @abc.abstractmethod
+    async def _create_auxiliary_instance(self) -> bool:
+        """Common interface call at auxiliary creation.
+
+        :return: True - Successfully created / False - Failed by creation
+        """
+
+    @abc.abstractmethod
+    async def _delete_auxiliary_instance(self) -> bool:
+        """Common interface call at auxiliary deletion.
+
+        :return: True - Successfully deleted / False - Failed deleting
+        """
+
+    @abc.abstractmethod
+    async def _run_command(self, cmd_message: Any, cmd_data: Optional[bytes]) -> None:
+        """Run a command for the auxiliary.
+
+        :param cmd_message: command to send
+        :param cmd_data: payload data for the command
+        """
+
+    @abc.abstractmethod
+    async def _receive_message(self, timeout_in_s: float) -> None:
+        """Defines what needs to be done as a receive message.
+
+        :param timeout_in_s: How much time to wait on the receive
+        """
@@ -0,0 +1,328 @@
+##########################################################################
+# Copyright (c) 2010-2022 Robert Bosch GmbH
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# http://www.eclipse.org/legal/epl-2.0.
+#
+# SPDX-License-Identifier: EPL-2.0
+##########################################################################
+
+"""
+Out-of-process Auxiliary Hosting
+********************************
+
+:module: process_auxiliary
+
+:synopsis: run an auxiliary and its connectors in a child process and
+    proxy its public API to the test process.
+
+An auxiliary configured with ``process: true`` is created in a dedicated
+child process, so that CPU-heavy auxiliaries (frame decoding, ISO-TP...)
+don't compete with the test thread for the GIL. The object provided as
+``pykiso.auxiliaries.<alias>`` is a :py:class:`ProcessAuxiliary`: every
+method call and attribute access is forwarded through a pipe to the
+auxiliary instance living in the child process. The log records of the
+child process are forwarded to the loggers of the test process, and
+therefore end up in the configured log files and reports.
+
+.. note:: arguments, return values and raised exceptions have to be
+    picklable. Callbacks registered from the test process are not
+    supported.
+
+.. note:: the handle is an :py:class:`~pykiso.auxiliary.AuxiliaryInterface`
+    and matches the type of the hosted auxiliary when retrieved with
+    ``get_instance`` or ``get_auxes_by_type``. Its connectors live in the
+    child process and can't be shared with a proxy auxiliary.
+
+.. currentmodule:: process_auxiliary
+
+"""
+from __future__ import annotations
+
+import logging
+import logging.handlers
+import multiprocessing
+import threading
+from multiprocessing.connection import Connection
+from typing import Any, Callable, Dict, Optional, Tuple, Type
+
+from ..auxiliary import AuxiliaryInterface
+from ..exceptions import AuxiliaryCreationError
+from ..logging_initializer import add_internal_log_levels
+
+log = logging.getLogger(__name__)
+
+#: time in seconds to wait for the child process to create the auxiliary
+PROCESS_START_TIMEOUT = 30
+#: time in seconds to wait for the child process to exit once closed
+PROCESS_JOIN_TIMEOUT = 5
+
+
+class _ForwardHandler(logging.Handler):
+    """Hand the records received from the child process to the logger
+    of the same name in the test process.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        logging.getLogger(record.name).handle(record)
+
+
+def _serve_auxiliary(
+    conn: Connection,
+    log_queue: multiprocessing.Queue,
+    name: str,
+    aux_location: str,
+    aux_config: Dict[str, Any],
+    aux_connectors: Dict[str, str],
+    connectors: Dict[str, Tuple[str, Dict[str, Any]]],
+    log_level: int,
+) -> None:
+    """Child process entry point: create the auxiliary and execute the
+    requests received from the test process.
+
+    :param conn: child end of the pipe to the test process
+    :param log_queue: queue forwarding the log records to the test
+        process
+    :param name: auxiliary alias
+    :param aux_location: auxiliary type as 'module:Class' or
+        'path/to/file.py:Class'
+    :param aux_config: auxiliary configuration parameters
+    :param aux_connectors: connector alias attached to each auxiliary
+        parameter
+    :param connectors: location and configuration of each connector
+    :param log_level: level of the root logger to apply
+    """
+    from ..test_setup.dynamic_loader import AuxiliaryCache, ModuleCache
+
+    # the test process handles the records with its own handlers
+    root_logger = logging.getLogger()
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    root_logger.setLevel(log_level)
+    add_internal_log_levels()
+
+    con_cache = ModuleCache()
+    for con_name, (con_location, con_config) in connectors.items():
+        con_cache.provide(con_name, con_location, **con_config)
+    aux_cache = AuxiliaryCache(con_cache)
+    aux_cache.provide(name, aux_location, connectors=aux_connectors, **aux_config)
+
+    try:
+        aux = aux_cache.get_instance(name)
+    except Exception as e:
+        conn.send(("error", e))
+        return
+    # the test process matches the handle against the types of the auxiliary
+    conn.send(("ready", [f"{cls.__module__}.{cls.__qualname__}" for cls in type(aux).__mro__]))
+
+    try:
+        while True:
+            try:
+                action, attr, args, kwargs = conn.recv()
+            except EOFError:
+                break
+            if action == "close":
+                break
+            try:
+                if action == "call":
+                    status, result = "ok", getattr(aux, attr)(*args, **kwargs)
+                elif action == "setattr":
+                    status, result = "ok", setattr(aux, attr, args[0])
+                else:
+                    value = getattr(aux, attr)
+                    status, result = ("callable", None) if callable(value) else ("ok", value)
+                conn.send((status, result))
+            except Exception as e:
+                _send_error(conn, e)
+    finally:
+        aux_cache._stop_instances([name])
+        con_cache.delete_all_instances()
+        conn.close()
+
+
+def _send_error(conn: Connection, error: Exception) -> None:
+    """Send an exception to the test process, fall back to its
+    representation if it can't be pickled.
+
+    :param conn: child end of the pipe to the test process
+    :param error: exception to send
+    """
+    try:
+        conn.send(("error", error))
+    except Exception:
+        conn.send(("error", RuntimeError(repr(error))))
+
+
+class ProcessAuxiliary:
+    """Handle to an auxiliary running in a child process.
+
+    Public methods and attributes of the hosted auxiliary are accessed
+    as if it was running in the test process.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        aux_location: str,
+        aux_config: Dict[str, Any],
+        aux_connectors: Dict[str, str],
+        connectors: Dict[str, Tuple[str, Dict[str, Any]]],
+        start_timeout: float = PROCESS_START_TIMEOUT,
+    ) -> None:
+        """Spawn the child process and create the auxiliary in it.
+
+        :param name: auxiliary alias
+        :param aux_location: auxiliary type as 'module:Class' or
+            'path/to/file.py:Class'
+        :param aux_config: auxiliary configuration parameters
+        :param aux_connectors: connector alias attached to each
+            auxiliary parameter
+        :param connectors: location and configuration of each connector
+        :param start_timeout: time in seconds to wait for the auxiliary
+            creation
+
+        :raises AuxiliaryCreationError: if the auxiliary could not be
+            created in the child process
+        """
+        # set through __dict__ as __setattr__ is forwarded to the child process
+        self.__dict__.update(name=name, _aux_types=())
+        self.__dict__["_lock"] = threading.Lock()
+        ctx = multiprocessing.get_context("spawn")
+        conn, child_conn = ctx.Pipe()
+        log_queue = ctx.Queue()
+        self.__dict__["_conn"] = conn
+        self.__dict__["_log_listener"] = logging.handlers.QueueListener(log_queue, _ForwardHandler())
+        self._log_listener.start()
+        self.__dict__["process"] = ctx.Process(
+            target=_serve_auxiliary,
+            args=(
+                child_conn,
+                log_queue,
+                name,
+                aux_location,
+                aux_config,
+                aux_connectors,
+                connectors,
+                logging.getLogger().level,
+            ),
+            name=f"{name}_process",
+            daemon=True,
+        )
+        self.process.start()
+        # only keep the child's end open in the child process to detect its termination
+        child_conn.close()
+
+        if not conn.poll(start_timeout):
+            self.close()
+            raise AuxiliaryCreationError(name)
+        try:
+            status, result = conn.recv()
+        except EOFError:
+            status, result = "error", None
+        if status != "ready":
+            self.close()
+            raise AuxiliaryCreationError(name) from result
+        self.__dict__["_aux_types"] = tuple(result)
+        log.internal_info(f"Auxiliary {name} running in process {self.process.pid}")
+
+    def _request(self, action: str, attr: str, *args, **kwargs) -> Tuple[str, Any]:
+        """Send a request to the child process and wait for its reply.
+
+        :param action: one of "call", "getattr" or "setattr"
+        :param attr: name of the auxiliary attribute concerned
+        :param args: positional arguments of the request
+        :param kwargs: named arguments of the request
+
+        :raises RuntimeError: if the child process is not running anymore
+        :return: status and result of the request
+        """
+        with self._lock:
+            try:
+                self._conn.send((action, attr, args, kwargs))
+                status, result = self._conn.recv()
+            except (EOFError, OSError) as e:
+                raise RuntimeError(f"Process hosting auxiliary {self.name} is not running") from e
+        if status == "error":
+            raise result
+        return status, result
+
+    def _remote_method(self, attr: str) -> Callable:
+        """Create a function calling a method of the hosted auxiliary.
+
+        :param attr: name of the method
+        :return: function forwarding its arguments to the method
+        """
+
+        def remote_method(*args, **kwargs) -> Any:
+            return self._request("call", attr, *args, **kwargs)[1]
+
+        remote_method.__name__ = attr
+        return remote_method
+
+    def __getattr__(self, attr: str) -> Any:
+        if attr.startswith("__"):
+            raise AttributeError(attr)
+        # attribute values are never cached, the auxiliary's own threads
+        # may change them at any time
+        status, value = self._request("getattr", attr)
+        if status == "callable":
+            # methods stay methods, later accesses don't go through __getattr__
+            method = self.__dict__[attr] = self._remote_method(attr)
+            return method
+        return value
+
+    def __setattr__(self, attr: str, value: Any) -> None:
+        # module attributes are set by the import machinery on the handle itself
+        if attr.startswith("__"):
+            return super().__setattr__(attr, value)
+        self._request("setattr", attr, value)
+
+    def hosts(self, aux_type: Type) -> bool:
+        """Check if the hosted auxiliary is an instance of the given type.
+
+        :param aux_type: auxiliary class type
+        :return: True if the type of the hosted auxiliary is or derives
+            from aux_type
+        """
+        return f"{aux_type.__module__}.{aux_type.__qualname__}" in self._aux_types
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.name} (pid {self.process.pid})>"
+
+    def close(self, timeout: Optional[float] = PROCESS_JOIN_TIMEOUT) -> None:
+        """Stop the hosted auxiliary and terminate the child process.
+
+        :param timeout: time in seconds to wait for the child process to
+            exit before killing it
+        """
+        with self._lock:
+            try:
+                self._conn.send(("close", None, (), {}))
+            except (OSError, ValueError):
+                pass
+            self._conn.close()
+        self.process.join(timeout)
+        if self.process.is_alive():
+            log.error(f"Process hosting auxiliary {self.name} did not exit, killing it")
+            self.process.kill()
+            self.process.join()
+        if self._log_listener is not None:
+            self._log_listener.stop()
+            self.__dict__["_log_listener"] = None
+
+
+# checked as an auxiliary by the proxy auxiliary and the config registry
+AuxiliaryInterface.register(ProcessAuxiliary)
+
+
+def is_auxiliary_of_type(aux: Any, aux_type: Type) -> bool:
+    """Check if an auxiliary is an instance of a type, a handle to an
+    auxiliary running in a child process being checked against the type
+    of the hosted auxiliary.
+
+    :param aux: auxiliary instance or handle
+    :param aux_type: auxiliary class type
+    :return: True if the auxiliary is of type aux_type
+    """
+    return isinstance(aux, aux_type) or (isinstance(aux, ProcessAuxiliary) and aux.hosts(aux_type))
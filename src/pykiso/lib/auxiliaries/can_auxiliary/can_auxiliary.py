@@ -110,7 +110,7 @@ class CanAuxiliary(AuxiliaryInterface):
         try:
             rcv_data = self.channel.cc_receive(timeout=timeout_in_s)
             if rcv_data.get("msg") is not None:
-                log.internal_debug(f"received message '{rcv_data}' from {self.channel}")
+                log.internal_debug("received message '%s' from %s", rcv_data, self.channel)
                 message_name = self.parser.dbc.get_message_by_frame_id(rcv_data["remote_id"]).name
                 message_signals = self.parser.decode(rcv_data["msg"], rcv_data["remote_id"])
                 message_timestamp = float(rcv_data.get("timestamp", 0))
@@ -267,6 +267,6 @@ class CanAuxiliary(AuxiliaryInterface):
             except Exception:
                 log.exception(f"encountered error while sending message '{cmd_data}' to {self.channel}")
         elif isinstance(cmd_message, Message):
-            log.internal_debug(f"ignored command '{cmd_message} in {self}'")
+            log.internal_debug("ignored command '%s in %s'", cmd_message, self)
         else:
             log.internal_warning(f"received unknown command '{cmd_message} in {self}'")
@@ -27,10 +27,11 @@ import logging
 import queue
 import threading
 from contextlib import ContextDecorator
-from typing import Any, Optional, Tuple
+from typing import Any, Dict, Optional, Tuple, Union
 
 from pykiso import CChannel, Message
 from pykiso.auxiliary import AuxiliaryInterface, close_connector, open_connector
+from pykiso.queues import QueuePriority
 
 log = logging.getLogger(__name__)
 
@@ -106,6 +107,7 @@ class CommunicationAuxiliary(AuxiliaryInterface):
         cmd_data: Any = None,
         blocking: bool = True,
         timeout_in_s: int = None,
+        priority: Union[str, QueuePriority] = QueuePriority.BULK,
     ) -> bool:
         """Send a request by transmitting it through queue_in and
         populate queue_tx with the command verdict (successful or not).
@@ -117,17 +119,19 @@ class CommunicationAuxiliary(AuxiliaryInterface):
             blocking or not
         :param timeout_in_s: Number of time (in s) you want to wait
             for an answer
+        :param priority: lane of queue_in the command is put in, higher
+            priority commands are executed first
 
         :return: True if the request is correctly executed otherwise
             False
         """
         with self.lock:
-            log.internal_debug(f"sending command '{cmd_message}' with payload {cmd_data} using {self.name} aux.")
+            log.internal_debug("sending command '%s' with payload %s using %s aux.", cmd_message, cmd_data, self.name)
             state = None
-            self.queue_in.put((cmd_message, cmd_data))
+            self.queue_in.put((cmd_message, cmd_data), priority=priority)
             try:
                 state = self.queue_tx.get(blocking, timeout_in_s)
-                log.internal_debug(f"command '{cmd_message}' successfully sent for {self.name} aux")
+                log.internal_debug("command '%s' successfully sent for %s aux", cmd_message, self.name)
             except queue.Empty:
                 log.error(f"no feedback received regarding request {cmd_message} for {self.name} aux.")
         return state
@@ -142,17 +146,50 @@ class CommunicationAuxiliary(AuxiliaryInterface):
 
         :param blocking: wait for message till timeout elapses?
         :param timeout_in_s: maximum time in second to wait for a response
-        :param receive_timestamp: True if timestamp should be returned, False otherwise
+        :param receive_timestamp: True if timestamp should be returned,
+            False otherwise. The timestamp is always expressed on the
+            host clock (:py:func:`time.perf_counter`) shared by all
+            channels, see :py:meth:`receive_response` for the raw
+            hardware timestamp
 
         :returns: raw message
         """
+        response = self.receive_response(blocking=blocking, timeout_in_s=timeout_in_s)
+
+        # if queue.Empty exception is raised None is returned so just
+        # directly return it
+        if response is None:
+            return None
+
+        msg = response["msg"]
+        remote_id = response["remote_id"]
+
+        # stay with the old return type to not making a breaking change
+        if receive_timestamp:
+            return (msg, remote_id, response["timestamp"])
+        elif remote_id and not receive_timestamp:
+            return (msg, remote_id)
+        return msg
+
+    def receive_response(self, blocking: bool = True, timeout_in_s: float = None) -> Optional[Dict[str, Any]]:
+        """Receive a message along with its reception timestamps.
+
+        :param blocking: wait for message till timeout elapses?
+        :param timeout_in_s: maximum time in second to wait for a response
+
+        :returns: dictionary containing the message (``msg``), its
+            source (``remote_id``), its reception time on the host clock
+            (``timestamp``) and its raw hardware timestamp
+            (``hw_timestamp``, None if the connector has no hardware
+            clock), or None if no message was received
+        """
 
         # Evaluate if we are in the context manager or not
         in_ctx_manager = False
         if self.queueing_event.is_set():
             in_ctx_manager = True
 
-        log.internal_debug(f"retrieving message in {self} (blocking={blocking}, timeout={timeout_in_s})")
+        log.internal_debug("retrieving message in %s (blocking=%s, timeout=%s)", self, blocking, timeout_in_s)
         # In case we are not in the context manager, we have a enable the receiver thread (and afterwards disable it)
         if not in_ctx_manager:
             self.queueing_event.set()
@@ -160,23 +197,26 @@ class CommunicationAuxiliary(AuxiliaryInterface):
         if not in_ctx_manager:
             self.queueing_event.clear()
 
-        log.internal_debug(f"retrieved message '{response}' in {self}")
+        log.internal_debug("retrieved message '%s' in %s", response, self)
 
-        # if queue.Empty exception is raised None is returned so just
-        # directly return it
         if response is None:
             return None
 
-        msg = response.get("msg")
-        remote_id = response.get("remote_id")
-        timestamp = response.get("timestamp")
-
-        # stay with the old return type to not making a breaking change
-        if receive_timestamp:
-            return (msg, remote_id, timestamp)
-        elif remote_id and not receive_timestamp:
-            return (msg, remote_id)
-        return msg
+        timestamp = response.get("rx_timestamp")
+        hw_timestamp = response.get("timestamp")
+        if hw_timestamp is not None:
+            # prefer the hardware time converted to the host clock, which
+            # doesn't include the reception latency
+            host_time = self.channel.to_host_time(hw_timestamp)
+            if host_time is not None:
+                timestamp = host_time
+
+        return {
+            "msg": response.get("msg"),
+            "remote_id": response.get("remote_id"),
+            "timestamp": timestamp,
+            "hw_timestamp": hw_timestamp,
+        }
 
     def clear_buffer(self) -> None:
         """Clear buffer from old stacked objects"""
@@ -200,7 +240,7 @@ class CommunicationAuxiliary(AuxiliaryInterface):
             except Exception:
                 log.exception(f"encountered error while sending message '{cmd_data}' to {self.channel}")
         elif isinstance(cmd_message, Message):
-            log.internal_debug(f"ignored command '{cmd_message} in {self}'")
+            log.internal_debug("ignored command '%s in %s'", cmd_message, self)
         else:
             log.internal_warning(f"received unknown command '{cmd_message} in {self}'")
 
@@ -215,7 +255,7 @@ class CommunicationAuxiliary(AuxiliaryInterface):
         """
         try:
             rcv_data = self.channel.cc_receive(timeout=timeout_in_s)
-            log.internal_debug(f"received message '{rcv_data}' from {self.channel}")
+            log.internal_debug("received message '%s' from %s", rcv_data, self.channel)
             msg = rcv_data.get("msg")
             if msg is not None and self.queueing_event.is_set():
                 self.queue_out.put(rcv_data)
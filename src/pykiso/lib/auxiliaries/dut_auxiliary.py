@@ -28,6 +28,7 @@ from typing import Callable, Optional
 
 from pykiso import CChannel, Flasher, Message, message
 from pykiso.auxiliary import AuxiliaryInterface, close_connector, flash_target, open_connector
+from pykiso.queues import QueuePriority
 
 log = logging.getLogger(__name__)
 
@@ -152,6 +153,8 @@ def restart_aux(func: Callable) -> Callable:
 class DUTAuxiliary(AuxiliaryInterface):
     """Device Under Test(DUT) auxiliary implementation."""
 
+    correlates_responses = True
+
     def __init__(
         self,
         com: CChannel = None,
@@ -168,6 +171,7 @@ class DUTAuxiliary(AuxiliaryInterface):
         self.channel = com
         self.flash = flash
         self.current_cmd = None
+        self._framer = message.MessageFramer()
 
     @retry_command(tries=1)
     @check_acknowledgement
@@ -232,11 +236,13 @@ class DUTAuxiliary(AuxiliaryInterface):
         """
         self.current_cmd = message.Message(MESSAGE_TYPE.COMMAND, COMMAND_TYPE.ABORT)
         log.internal_info(f"send abort request: {self.current_cmd}")
+        # the abort must not wait behind already queued commands
         return self.run_command(
             cmd_message=self.current_cmd,
             cmd_data=None,
             blocking=True,
             timeout_in_s=timeout,
+            priority=QueuePriority.CONTROL,
         )
 
     def create_instance(self) -> bool:
@@ -262,6 +268,7 @@ class DUTAuxiliary(AuxiliaryInterface):
 
         :return: True if everything was successful otherwise False
         """
+        self._framer.reset()
         log.internal_info("Auxiliary instance created")
         return True
 
@@ -289,7 +296,7 @@ class DUTAuxiliary(AuxiliaryInterface):
             return True
 
         if response.get_message_type() == MESSAGE_TYPE.LOG:
-            log.internal_info(f"Logging message received from {self.name}: {response}")
+            log.internal_info("Logging message received from %s: %s", self.name, response)
             return False
 
         if response.get_message_type() == MESSAGE_TYPE.ACK:
@@ -333,6 +340,17 @@ class DUTAuxiliary(AuxiliaryInterface):
         except queue.Empty:
             return None
 
+    def _get_response_correlation_id(self, response: message.Message) -> Optional[int]:
+        """Only acknowledgements can be a reply to a submitted command.
+
+        :param response: message received from the DUT
+
+        :return: the acknowledged message token otherwise None
+        """
+        if response.msg_type == MESSAGE_TYPE.ACK:
+            return response.msg_token
+        return None
+
     def _run_command(
         self,
         cmd_message: message.Message,
@@ -350,7 +368,11 @@ class DUTAuxiliary(AuxiliaryInterface):
             log.exception(f"encountered error while sending message '{cmd_message}' to {self.channel}")
 
     def _receive_message(self, timeout_in_s: float) -> None:
-        """Get message from the device under test.
+        """Get messages from the device under test.
+
+        The received bytes don't need to be exactly one packet: they are
+        split into messages by the framer, a packet split over several
+        receptions being completed by the next ones.
 
         :param timeout_in_s: Time in seconds to wait for an answer
         """
@@ -360,10 +382,23 @@ class DUTAuxiliary(AuxiliaryInterface):
 
         if response is None:
             return
-        elif isinstance(response, str):
-            response = response.encode()
-        response = Message.parse_packet(response)
+        elif isinstance(response, Message):
+            # the connector already parsed the message
+            responses = [response]
+        else:
+            if isinstance(response, str):
+                response = response.encode()
+            responses = self._framer.feed(response)
+
+        for response in responses:
+            self._handle_response(response)
+
+    def _handle_response(self, response: message.Message) -> None:
+        """Acknowledge a received message and populate the queue_out,
+        or route it to its command future if it is an acknowledgement.
 
+        :param response: message received from the device under test
+        """
         # If a message was received just automatically acknowledge it
         # and populate the queue_out
         if response.msg_type != MESSAGE_TYPE.ACK:
@@ -372,4 +407,7 @@ class DUTAuxiliary(AuxiliaryInterface):
                 self.channel.cc_send(msg=ack_cmd.serialize())
             except Exception:
                 log.exception(f"encountered error while sending acknowledge message for {response}!")
+        elif self._resolve_command(response):
+            # acknowledgement of a submitted command, already routed to its future
+            return
         self.queue_out.put(response)
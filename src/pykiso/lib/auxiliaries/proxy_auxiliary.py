@@ -57,6 +57,7 @@ from typing import List, Optional, Tuple
 
 from pykiso import CChannel
 from pykiso.auxiliary import AuxiliaryInterface, close_connector, open_connector
+from pykiso.interfaces.process_auxiliary import ProcessAuxiliary
 from pykiso.lib.connectors.cc_proxy import CCProxy
 from pykiso.test_setup.config_registry import ConfigRegistry
 from pykiso.test_setup.dynamic_loader import PACKAGE
@@ -239,7 +240,10 @@ class ProxyAuxiliary(AuxiliaryInterface):
         :param aux: auxiliary instance to check
 
         :raises NotImplementedError: if is_proxy_capable flag is False
+            or if the auxiliary runs in a child process
         """
+        if isinstance(aux, ProcessAuxiliary):
+            raise NotImplementedError(f"Auxiliary {aux} runs in a child process, its channel can't be proxied!")
         if not aux.is_proxy_capable:
             raise NotImplementedError(f"Auxiliary {aux} is not compatible with a proxy auxiliary!")
 
@@ -351,15 +355,14 @@ class ProxyAuxiliary(AuxiliaryInterface):
             for a message
         """
         try:
-            recv_response = self.channel.cc_receive(timeout=timeout_in_s)
-            received_data = recv_response.get("msg")
-            # if data are received, populate connector's queue_out
-            if received_data is not None:
+            # drain all pending messages at once to amortize the per-message overhead
+            for recv_response in self.channel.cc_receive_many(timeout=timeout_in_s):
                 self.logger.debug(
                     "received response : data %s || channel : %s",
-                    received_data,
+                    recv_response.get("msg"),
                     self.channel.name,
                 )
+                # populate connector's queue_out
                 for conn in self.proxy_channels:
                     if conn.queue_out is not None:
                         conn.queue_out.put(recv_response)
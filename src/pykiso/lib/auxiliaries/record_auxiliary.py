@@ -167,17 +167,20 @@ class RecordAuxiliary(AuxiliaryInterface):
             if sys.getsizeof(self.get_data()) > self.max_file_size:
                 log.error("Data size too large")
 
-            recv_response = self.channel.cc_receive(timeout=self.timeout)
-
-            stream = recv_response.get("msg")
-            source = recv_response.get("remote_id")
-
-            if stream:
-                stream = self.parse_bytes(stream)
-                if source is not None:
-                    self.set_data(f"\n{source}    {stream}")
-                else:
-                    self.set_data("\n" + stream)
+            lines = []
+            for recv_response in self.channel.cc_receive_many(timeout=self.timeout):
+                stream = recv_response.get("msg")
+                source = recv_response.get("remote_id")
+
+                if stream:
+                    stream = self.parse_bytes(stream)
+                    if source is not None:
+                        lines.append(f"\n{source}    {stream}")
+                    else:
+                        lines.append("\n" + stream)
+            # store the whole batch at once
+            if lines:
+                self.set_data("".join(lines))
 
         try:
             self.channel.close()
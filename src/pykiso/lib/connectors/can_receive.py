@@ -0,0 +1,72 @@
+##########################################################################
+# Copyright (c) 2010-2022 Robert Bosch GmbH
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# http://www.eclipse.org/legal/epl-2.0.
+#
+# SPDX-License-Identifier: EPL-2.0
+##########################################################################
+
+"""
+CAN batch reception
+*******************
+
+:module: can_receive
+
+:synopsis: batch reception shared by the python-can based connectors
+
+.. currentmodule:: can_receive
+
+"""
+
+import logging
+from typing import Dict, List, Union
+
+try:
+    import can
+except ImportError as e:
+    raise ImportError(f"{e.name} dependency missing, consider installing pykiso with 'pip install pykiso[can]'")
+
+log = logging.getLogger(__name__)
+
+
+class CanReceiveMixin:
+    """Implement :meth:`_cc_receive_many` on top of the python-can bus
+    stored in the ``bus`` attribute of the connector.
+    """
+
+    def _frame_to_response(self, received_msg: can.Message) -> Dict[str, Union[bytes, int, float]]:
+        """Convert a received frame into a connector response.
+
+        :param received_msg: frame returned by the bus
+
+        :return: the received data, source can id and timestamp
+        """
+        return {
+            "msg": received_msg.data,
+            "remote_id": received_msg.arbitration_id,
+            "timestamp": received_msg.timestamp,
+        }
+
+    def _cc_receive_many(self, max_count: int, timeout: float = 0.0001) -> List[Dict[str, Union[bytes, int, None]]]:
+        """Drain the frames pending on the bus, only waiting for the
+        first one.
+
+        :param max_count: maximum number of frames to return
+        :param timeout: timeout applied on the reception of the first frame
+
+        :return: the received data, source can ids and timestamps
+        """
+        responses = []
+        try:
+            received_msg = self.bus.recv(timeout=timeout or self.timeout)
+            while received_msg is not None:
+                responses.append(self._frame_to_response(received_msg))
+                if len(responses) >= max_count:
+                    break
+                received_msg = self.bus.recv(timeout=0)
+        except can.CanError as can_error:
+            log.internal_info("encountered CAN error while receiving message: %s", can_error)
+        except Exception:
+            log.exception(f"encountered error while receiving message via {self}")
+        return responses
@@ -0,0 +1,314 @@
+##########################################################################
+# Copyright (c) 2010-2022 Robert Bosch GmbH
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# http://www.eclipse.org/legal/epl-2.0.
+#
+# SPDX-License-Identifier: EPL-2.0
+##########################################################################
+
+"""
+Traffic Capture CChannel
+************************
+
+:module: cc_capture
+
+:synopsis: CChannel wrapping another CChannel and recording all its
+    traffic to a binary capture file.
+
+Every message sent or received through the wrapped channel is written
+to the capture file together with its remote id and its time relative
+to the opening of the channel. The capture can then be replayed without
+the physical setup using
+:py:class:`~pykiso.lib.connectors.cc_replay.CCReplay`.
+
+.. code:: yaml
+
+  connectors:
+    chan1:
+      config:
+        capture_file: ./captures/can.pkcap
+        channel_type: pykiso.lib.connectors.cc_pcan_can:CCPCanCan
+        channel_config:
+          interface: pcan
+          channel: PCAN_USBBUS1
+      type: pykiso.lib.connectors.cc_capture:CCCapture
+
+The capture file starts with a header (magic and format version),
+followed by one record per message: a fixed size little-endian header
+(direction, payload kind, timestamp, remote id, payload length) and the
+payload itself.
+
+.. currentmodule:: cc_capture
+
+"""
+from __future__ import annotations
+
+import enum
+import logging
+import struct
+import threading
+import time
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional
+
+from pykiso import CChannel
+from pykiso.message import Message
+from pykiso.types import MsgType, PathType
+
+log = logging.getLogger(__name__)
+
+#: first bytes of a capture file, followed by the format version
+CAPTURE_MAGIC = b"PKCAP"
+CAPTURE_VERSION = 1
+_FILE_HEADER = struct.Struct("<5sB")
+#: direction, payload kind, timestamp, remote id (-1 if none), payload length
+_RECORD_HEADER = struct.Struct("<BBdiI")
+
+
+class Direction(enum.IntEnum):
+    """Direction of a captured message."""
+
+    TX = 0
+    RX = 1
+
+
+class PayloadKind(enum.IntEnum):
+    """Type of a captured message, used to restore it on replay."""
+
+    BYTES = 0
+    MESSAGE = 1
+    STR = 2
+
+
+class CaptureRecord(NamedTuple):
+    """Message read from a capture file."""
+
+    direction: Direction
+    timestamp: float
+    remote_id: Optional[int]
+    msg: MsgType
+
+
+def _encode_payload(msg: Any) -> Optional[tuple]:
+    """Convert a message to its payload kind and raw content.
+
+    :param msg: message to encode
+    :return: payload kind and bytes, None if the message can't be
+        captured
+    """
+    if isinstance(msg, (bytes, bytearray, memoryview)):
+        return PayloadKind.BYTES, bytes(msg)
+    if isinstance(msg, Message):
+        return PayloadKind.MESSAGE, msg.serialize()
+    if isinstance(msg, str):
+        return PayloadKind.STR, msg.encode()
+    return None
+
+
+def _decode_payload(kind: int, payload: bytes) -> MsgType:
+    """Restore a captured message.
+
+    :param kind: payload kind stored in the record
+    :param payload: raw content of the record
+    :return: the message as it was sent or received
+    """
+    if kind == PayloadKind.MESSAGE:
+        return Message.parse_packet(payload)
+    if kind == PayloadKind.STR:
+        return payload.decode()
+    return payload
+
+
+def read_capture(capture_file: PathType) -> Iterator[CaptureRecord]:
+    """Read the messages stored in a capture file.
+
+    :param capture_file: path of the capture file
+
+    :raises ValueError: if the file is not a capture file or is truncated
+    :return: iterator over the captured messages, in capture order
+    """
+    with open(capture_file, "rb") as capture:
+        magic, version = _FILE_HEADER.unpack(capture.read(_FILE_HEADER.size))
+        if magic != CAPTURE_MAGIC or version != CAPTURE_VERSION:
+            raise ValueError(f"{capture_file} is not a capture file of version {CAPTURE_VERSION}")
+        while True:
+            header = capture.read(_RECORD_HEADER.size)
+            if not header:
+                return
+            if len(header) < _RECORD_HEADER.size:
+                raise ValueError(f"Capture file {capture_file} is truncated")
+            direction, kind, timestamp, remote_id, length = _RECORD_HEADER.unpack(header)
+            payload = capture.read(length)
+            if len(payload) < length:
+                raise ValueError(f"Capture file {capture_file} is truncated")
+            yield CaptureRecord(
+                Direction(direction), timestamp, None if remote_id < 0 else remote_id, _decode_payload(kind, payload)
+            )
+
+
+class CCCapture(CChannel):
+    """Channel recording the traffic of another channel."""
+
+    def __init__(
+        self,
+        capture_file: PathType,
+        channel: Optional[CChannel] = None,
+        channel_type: Optional[str] = None,
+        channel_config: Optional[Dict[str, Any]] = None,
+        **kwargs,
+    ):
+        """Initialize attributes.
+
+        :param capture_file: path of the capture file to write, an
+            existing file is overwritten
+        :param channel: channel to wrap
+        :param channel_type: if no channel instance is given, location of
+            the channel class to wrap as 'module:Class' or
+            'path/to/file.py:Class'
+        :param channel_config: parameters of the wrapped channel
+
+        :raises ValueError: if neither channel nor channel_type is given
+        """
+        super().__init__(**kwargs)
+        if channel is None:
+            if channel_type is None:
+                raise ValueError("Either a channel or a channel_type has to be provided")
+            channel = self._create_channel(channel_type, channel_config or {})
+        self.channel = channel
+        self.capture_file = capture_file
+        self._capture = None
+        self._capture_lock = threading.Lock()
+        self._origin = 0.0
+        self._skipped_types = set()
+
+    def _create_channel(self, channel_type: str, channel_config: Dict[str, Any]) -> CChannel:
+        """Instantiate the channel to wrap.
+
+        :param channel_type: location of the channel class
+        :param channel_config: parameters of the channel
+        :return: the created channel
+        """
+        from pykiso.test_setup.dynamic_loader import ModuleCache
+
+        cache = ModuleCache()
+        cache.provide(f"{self.name}_captured", channel_type, **channel_config)
+        return cache.get_instance(f"{self.name}_captured")
+
+    def __getattr__(self, name: str) -> Any:
+        """Give access to the attributes specific to the wrapped channel.
+
+        :param name: name of the attribute to get
+        :raises AttributeError: if the wrapped channel has no such
+            attribute
+        :return: the attribute of the wrapped channel
+        """
+        if name.startswith("_") or name == "channel":
+            raise AttributeError(name)
+        return getattr(self.channel, name)
+
+    def _cc_open(self) -> None:
+        """Open the wrapped channel and start a new capture."""
+        self.channel.open()
+        self._capture = open(self.capture_file, "wb")
+        self._capture.write(_FILE_HEADER.pack(CAPTURE_MAGIC, CAPTURE_VERSION))
+        self._origin = time.perf_counter()
+        log.internal_info(f"Capturing traffic of {self.channel} to {self.capture_file}")
+
+    def _cc_close(self) -> None:
+        """Close the wrapped channel and the capture file."""
+        try:
+            self.channel.close()
+        finally:
+            with self._capture_lock:
+                if self._capture is not None:
+                    self._capture.close()
+                    self._capture = None
+
+    def shutdown(self) -> None:
+        """Uninitialize the wrapped channel."""
+        self.channel.shutdown()
+
+    def fileno(self) -> Optional[int]:
+        """Get the file descriptor of the wrapped channel.
+
+        :return: the file descriptor, None if the wrapped channel can't
+            expose its readiness
+        """
+        return self.channel.fileno()
+
+    def wait_readable(self, timeout: Optional[float] = None) -> bool:
+        """Wait until data can be received from the wrapped channel.
+
+        :param timeout: time in second to wait, None to wait forever
+        :return: True if the channel is readable, False if the timeout
+            expired
+        """
+        return self.channel.wait_readable(timeout)
+
+    def _record(self, direction: Direction, msg: Any, remote_id: Optional[int], timestamp: float) -> None:
+        """Append a message to the capture file.
+
+        :param direction: direction of the message
+        :param msg: message to record
+        :param remote_id: remote id of the message, if any
+        :param timestamp: perf_counter value at which the message was
+            sent or received
+        """
+        encoded = _encode_payload(msg)
+        if encoded is None:
+            if type(msg) not in self._skipped_types:
+                self._skipped_types.add(type(msg))
+                log.internal_warning(f"{type(msg).__name__} messages can't be captured by {self.name}, skip them")
+            return
+        kind, payload = encoded
+        header = _RECORD_HEADER.pack(
+            direction, kind, timestamp - self._origin, -1 if remote_id is None else remote_id, len(payload)
+        )
+        with self._capture_lock:
+            if self._capture is not None:
+                self._capture.write(header)
+                self._capture.write(payload)
+
+    def _cc_send(self, msg: MsgType, **kwargs) -> None:
+        """Send a message through the wrapped channel and record it.
+
+        :param msg: message to send
+        :param kwargs: named arguments forwarded to the wrapped channel
+        """
+        timestamp = time.perf_counter()
+        self.channel.cc_send(msg, **kwargs)
+        self._record(Direction.TX, msg, kwargs.get("remote_id"), timestamp)
+
+    def _cc_receive(self, timeout: float = 0.1, **kwargs) -> Dict[str, Optional[bytes]]:
+        """Receive a message from the wrapped channel and record it.
+
+        :param timeout: time in second to wait for a message
+        :param kwargs: named arguments forwarded to the wrapped channel
+        :return: the message received by the wrapped channel
+        """
+        recv_response = self.channel.cc_receive(timeout=timeout, **kwargs)
+        self._record_received(recv_response)
+        return recv_response
+
+    def _cc_receive_many(self, max_count: int, timeout: float, **kwargs) -> List[Dict[str, Optional[bytes]]]:
+        """Receive the pending messages from the wrapped channel and
+        record them.
+
+        :param max_count: maximum number of messages to return
+        :param timeout: time in second to wait for the first message
+        :param kwargs: named arguments forwarded to the wrapped channel
+        :return: the messages received by the wrapped channel
+        """
+        responses = self.channel.cc_receive_many(max_count=max_count, timeout=timeout, **kwargs)
+        for recv_response in responses:
+            self._record_received(recv_response)
+        return responses
+
+    def _record_received(self, recv_response: Dict[str, Any]) -> None:
+        """Record a message returned by the wrapped channel, if any.
+
+        :param recv_response: value returned by the wrapped channel
+        """
+        msg = recv_response.get("msg") if isinstance(recv_response, dict) else None
+        if msg is not None:
+            self._record(Direction.RX, msg, recv_response.get("remote_id"), recv_response["rx_timestamp"])
@@ -31,6 +31,9 @@ from pykiso.message import Message
 
 log = logging.getLogger(__name__)
 
+#: size of the FDX reception buffer, maximum message size accepted by Trace32
+FDX_BUFFER_SIZE = 4096
+
 
 class PracticeState(enum.IntEnum):
     """Available state for any scripts loaded into TRACE32."""
@@ -91,6 +94,10 @@ class CCFdxLauterbach(connector.CChannel):
         self.reset_flag = False
         self.safe_reset_flag = False
         self.allowed_t32_errors = 10
+        # reception buffer reused for each poll
+        self._rx_buffer = ctypes.create_string_buffer(FDX_BUFFER_SIZE)
+        self._rx_buffer_ptr = ctypes.pointer(self._rx_buffer)
+        self._rx_view = memoryview(self._rx_buffer).cast("B")
         # Initialize the super class
         super().__init__(**kwargs)
 
@@ -236,8 +243,8 @@ class CCFdxLauterbach(connector.CChannel):
 
         :return: poll length
         """
-        log.internal_debug(f"===> {msg}")
-        log.internal_debug(f"Sent on channel {self.fdxout}")
+        log.internal_debug("===> %s", msg)
+        log.internal_debug("Sent on channel %s", self.fdxout)
 
         # Create and fill the buffer with the message
         buffer = ctypes.pointer(ctypes.create_string_buffer(len(msg)))
@@ -249,49 +256,43 @@ class CCFdxLauterbach(connector.CChannel):
             log.exception(f"ERROR occurred while sending {len(msg)} bytes on {self.fdxout}")
         return poll_len
 
-    def _cc_receive(self, timeout: float = 0.1) -> Dict[str, Union[bytes, str, None]]:
-        """Receive message using the FDX channel.
+    def _poll_receive(self, timeout: float) -> int:
+        """Poll the FDX channel until a message is written into the
+        reception buffer or the timeout is reached.
 
-        :return: message
+        :param timeout: time in seconds to wait for a message
+
+        :return: size of the received message, 0 if nothing was received
         """
         # Add a small delay to allow other functions to execute
         time.sleep(0.1)
 
-        received_msg = None
         if self.reset_flag:
             # If the Reset function is called, do not attempt to read messages
-            return {"msg": received_msg}
+            return 0
 
         self.safe_reset_flag = False
 
+        received_len = 0
         # Get the current time to process the timeout
         t_start = time.perf_counter()
         # Ensure to enter into the while loop (at least one time) if timeout is set to 0
         is_timeout = False
         # Check if a message has been received within the timeout
         while not is_timeout:
-            # Create the buffer
-            buffer = ctypes.pointer(ctypes.create_string_buffer(4096))  # MaxSize = [0 ; 4096]
-
             # Check if msg available
-            poll_len = self.t32_api.T32_Fdx_ReceivePoll(
-                self.fdxin,
-                buffer,
-                len(buffer.contents[0]),
-                int(len(buffer.contents) / len(buffer.contents[0])),
-            )
+            poll_len = self.t32_api.T32_Fdx_ReceivePoll(self.fdxin, self._rx_buffer_ptr, 1, FDX_BUFFER_SIZE)
 
             # Check if T32 api got an error
             if poll_len < 0:
-                log.error(f"ERROR occurred while listening channel {self.fdxin} with buffer: {buffer.contents.value}")
+                log.error(f"ERROR occurred while listening channel {self.fdxin} with buffer: {self._rx_buffer.value}")
                 break
 
             # Check if a message has been received
             elif poll_len > 0:
-                log.internal_info(f"Message size: {poll_len}")
-                log.internal_info(f"<=== {Message.parse_packet(buffer.contents.raw[:poll_len])}")
-                log.internal_debug(f"Received on channel {self.fdxin}")
-                received_msg = Message.parse_packet(buffer.contents.raw[:poll_len])
+                log.internal_info("Message size: %d", poll_len)
+                log.internal_debug("Received on channel %s", self.fdxin)
+                received_len = poll_len
                 break
 
             # Exit the while loop once timeout is reached
@@ -299,9 +300,37 @@ class CCFdxLauterbach(connector.CChannel):
                 is_timeout = True
 
         self.safe_reset_flag = True
+        return received_len
+
+    def _cc_receive(self, timeout: float = 0.1) -> Dict[str, Union[bytes, str, None]]:
+        """Receive message using the FDX channel.
+
+        :return: message
+        """
+        received_msg = None
+        poll_len = self._poll_receive(timeout)
+        if poll_len:
+            received_msg = Message.parse_packet(self._rx_buffer.raw[:poll_len])
+            log.internal_info("<=== %s", received_msg)
         # No message received
         return {"msg": received_msg}
 
+    def _cc_receive_into(self, buffer: memoryview, timeout: float = 0.1, **kwargs) -> int:
+        """Copy the raw content of the next FDX message into the given
+        buffer, without creating any intermediate bytes object.
+
+        :param buffer: writable buffer to fill
+        :param timeout: time in seconds to wait for a message
+
+        :raises ValueError: if the message doesn't fit into the buffer
+        :return: number of bytes written into the buffer
+        """
+        poll_len = self._poll_receive(timeout)
+        if poll_len > len(buffer):
+            raise ValueError(f"Received {poll_len} bytes, buffer can only hold {len(buffer)}")
+        buffer[:poll_len] = self._rx_view[:poll_len]
+        return poll_len
+
     def start(self) -> None:
         """Override clicking on "go" in the Trace32 application.
 
@@ -46,6 +46,7 @@ except ImportError:
 
 from pykiso import CChannel
 
+from ..can_receive import CanReceiveMixin
 from .trc_handler import TRCReaderCanFD, TRCWriterCanFD, TypedMessage
 
 log = logging.getLogger(__name__)
@@ -65,7 +66,7 @@ class PcanFilter(logging.Filter):
         return not record.getMessage().startswith("Bus error: an error counter")
 
 
-class CCPCanCan(CChannel):
+class CCPCanCan(CanReceiveMixin, CChannel):
     """CAN FD channel-adapter."""
 
     def __init__(
@@ -412,6 +413,18 @@ class CCPCanCan(CChannel):
             log.exception(f"encountered error while receiving message via {self}")
             return {"msg": None}
 
+    def _frame_to_response(self, received_msg: can.Message) -> Dict[str, Union[bytes, int, float]]:
+        """Convert a received frame into a connector response, with a
+        timestamp relative to the boot time.
+
+        :param received_msg: frame returned by the bus
+
+        :return: the received data, source can id and timestamp
+        """
+        response = super()._frame_to_response(received_msg)
+        response["timestamp"] -= self.boottime_epoch
+        return response
+
     @staticmethod
     def _extract_header(trace: Path) -> str:
         """Extract data from trc file header
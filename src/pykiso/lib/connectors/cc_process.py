@@ -200,7 +200,7 @@ class CCProcess(CChannel):
         elif self._pipe_stdin:
             if self._process is None:
                 raise CCProcessError("Process is not running.")
-            log.internal_debug(f"write stdin: {msg}")
+            log.internal_debug("write stdin: %s", msg)
             self._process.stdin.write(msg)
             self._process.stdin.flush()
         else:
@@ -230,6 +230,26 @@ class CCProcess(CChannel):
         """Implement abstract method"""
         pass
 
+    def wait_readable(self, timeout: Optional[float] = None) -> bool:
+        """Wait until an output of the process was read.
+
+        The process pipes are consumed by the read threads, so no file
+        descriptor is exposed: the wait is done on the reception queue.
+
+        :param timeout: time in second to wait, None to wait forever
+
+        :return: True if an output or the process exit is available,
+            False if the timeout expired
+        """
+        if self._buffer:
+            return True
+        queue_in = self._queue_in
+        if queue_in is None:
+            return False
+        with queue_in.not_empty:
+            # qsize() can't be used as it takes the lock held by not_empty
+            return queue_in.not_empty.wait_for(lambda: queue_in._qsize() > 0, timeout)
+
     def _read_existing(self) -> Optional[ProcessMessage]:
         """Read buffered messages that where already received from the process.
         Messages from the same stream are combined.
@@ -27,9 +27,10 @@ from __future__ import annotations
 import logging
 import queue
 import threading
-from typing import TYPE_CHECKING, Any, Callable
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
 
 from pykiso.connector import CChannel
+from pykiso.queues import MonitoredQueue, QueuePolicy
 
 if TYPE_CHECKING:
     from pykiso.lib.auxiliaries.proxy_auxiliary import ProxyAuxiliary
@@ -48,9 +49,17 @@ class CCProxy(CChannel):
     _proxy: ProxyAuxiliary = None
     _physical_channel: CChannel = None
 
-    def __init__(self, **kwargs):
-        """Initialize attributes."""
+    def __init__(self, queue_size: int = 0, queue_policy: str = QueuePolicy.BLOCK, **kwargs):
+        """Initialize attributes.
+
+        :param queue_size: capacity of the reception queue, 0 means
+            unbounded
+        :param queue_policy: behaviour of the reception queue once full,
+            one of "block", "drop-oldest" or "drop-newest"
+        """
         super().__init__(**kwargs)
+        self.queue_size = queue_size
+        self.queue_policy = QueuePolicy(queue_policy)
         self.queue_out = None
         self.timeout = 1
         self._lock = threading.Lock()
@@ -119,13 +128,21 @@ class CCProxy(CChannel):
     def _cc_open(self) -> None:
         """Open proxy channel."""
         log.internal_info("Open proxy channel")
-        self.queue_out = queue.Queue()
+        self.queue_out = MonitoredQueue(self.queue_size, self.queue_policy)
 
     def _cc_close(self) -> None:
         """Close proxy channel."""
         log.internal_debug("Close proxy channel")
         self.queue_out = None
 
+    def get_queue_stats(self) -> Optional[Dict[str, Any]]:
+        """Get the fill level and overflow counters of the reception queue.
+
+        :return: the queue statistics or None if the channel is closed
+        """
+        queue_out = self.queue_out
+        return queue_out.stats() if queue_out is not None else None
+
     def _cc_send(self, *args: Any, **kwargs: Any) -> None:
         """Call the attached ProxyAuxiliary's transmission callback
         with the provided arguments.
@@ -133,7 +150,7 @@ class CCProxy(CChannel):
         :param args: positionnal arguments to pass to the callback
         :param kwargs: named arguments to pass to the callback
         """
-        log.internal_debug(f"put at proxy level: {args} {kwargs}")
+        log.internal_debug("put at proxy level: %s %s", args, kwargs)
         if self._tx_callback is not None:
             # call the attached ProxyAuxiliary's run_command method
             self._tx_callback(self, *args, **kwargs)
@@ -148,7 +165,27 @@ class CCProxy(CChannel):
         """
         try:
             return_response = self.queue_out.get(True, self.timeout)
-            log.internal_debug(f"received at proxy level : {return_response}")
+            log.internal_debug("received at proxy level : %s", return_response)
             return return_response
         except queue.Empty:
             return {"msg": None}
+
+    def _cc_receive_many(self, max_count: int, timeout: float = 0.1) -> List[ProxyReturn]:
+        """Depopulate the queue out of the proxy connector, only waiting
+        for the first message.
+
+        :param max_count: maximum number of messages to return
+        :param timeout: not used
+
+        :return: the queued messages, empty if the queue timeout is
+            reached
+        """
+        responses = []
+        try:
+            responses.append(self.queue_out.get(True, self.timeout))
+            while len(responses) < max_count:
+                responses.append(self.queue_out.get_nowait())
+        except queue.Empty:
+            pass
+        log.internal_debug("received at proxy level : %s", responses)
+        return responses
@@ -19,7 +19,6 @@ Loopback CChannel
 
 """
 import threading
-import time
 from collections import deque
 from typing import Dict, Optional
 
@@ -38,6 +37,7 @@ class CCLoopback(CChannel):
         super().__init__(**kwargs)
         self._loopback_buffer = None
         self.lock = threading.Lock()
+        self._message_available = threading.Condition(self.lock)
 
     def _cc_open(self) -> None:
         """Open loopback channel."""
@@ -45,7 +45,9 @@ class CCLoopback(CChannel):
 
     def _cc_close(self) -> None:
         """Close loopback channel."""
-        self._loopback_buffer = None
+        with self.lock:
+            self._loopback_buffer = None
+            self._message_available.notify_all()
 
     def _cc_send(self, msg: MsgType) -> None:
         """Send a message by simply putting message in deque.
@@ -54,6 +56,7 @@ class CCLoopback(CChannel):
         """
         with self.lock:
             self._loopback_buffer.append(msg)
+            self._message_available.notify()
 
     def _cc_receive(self, timeout: float) -> Dict[str, Optional[bytes]]:
         """Read message by simply removing an element from the left side of deque.
@@ -63,12 +66,8 @@ class CCLoopback(CChannel):
         :return: dictionary containing the received bytes if successful, otherwise None
         """
         with self.lock:
-            # Simulate a blocking on receive
-            start = time.time_ns()
-            while (time.time_ns() - start) < timeout * 1e9:
-                try:
-                    recv_msg = self._loopback_buffer.popleft()
-                    return {"msg": recv_msg}
-                except IndexError:
-                    time.sleep(0.1)
+            # the lock is released while waiting, so that messages can
+            # be sent in the meantime
+            if self._message_available.wait_for(lambda: self._loopback_buffer, timeout):
+                return {"msg": self._loopback_buffer.popleft()}
             return {"msg": None}
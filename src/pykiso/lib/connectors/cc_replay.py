@@ -0,0 +1,185 @@
+##########################################################################
+# Copyright (c) 2010-2022 Robert Bosch GmbH
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# http://www.eclipse.org/legal/epl-2.0.
+#
+# SPDX-License-Identifier: EPL-2.0
+##########################################################################
+
+"""
+Capture Replay CChannel
+***********************
+
+:module: cc_replay
+
+:synopsis: CChannel replaying the messages received in a capture file
+    recorded with :py:class:`~pykiso.lib.connectors.cc_capture.CCCapture`.
+
+The received messages of the capture are returned by ``cc_receive``
+with their original timing, scaled by ``speed``, or as fast as possible
+if ``speed`` is 0.
+
+With ``follow_sends`` enabled, each transmission recorded in the capture
+waits for a message to be sent through the replay channel, and the
+messages received after it are delivered relative to that send. The
+responses of a DUT are then never delivered before their request was
+sent, whatever the execution speed of the test. The sends exceeding the
+transmissions left in the capture are ignored.
+
+.. code:: yaml
+
+  connectors:
+    chan1:
+      config:
+        capture_file: ./captures/can.pkcap
+        speed: 0
+      type: pykiso.lib.connectors.cc_replay:CCReplay
+
+.. currentmodule:: cc_replay
+
+"""
+import collections
+import logging
+import threading
+import time
+from typing import Dict, List, Optional
+
+from pykiso import CChannel
+from pykiso.types import MsgType, PathType
+
+from .cc_capture import CaptureRecord, Direction, read_capture
+
+log = logging.getLogger(__name__)
+
+
+class CCReplay(CChannel):
+    """Channel delivering the messages of a capture file."""
+
+    def __init__(
+        self,
+        capture_file: PathType,
+        speed: float = 1.0,
+        follow_sends: bool = True,
+        loop: bool = False,
+        **kwargs,
+    ):
+        """Initialize attributes.
+
+        :param capture_file: path of the capture file to replay
+        :param speed: factor applied to the original timing, 0 to
+            deliver the messages as fast as possible
+        :param follow_sends: wait for a message to be sent in place of
+            each captured transmission
+        :param loop: restart from the beginning of the capture once all
+            messages were delivered
+
+        :raises ValueError: if speed is negative
+        """
+        super().__init__(**kwargs)
+        if speed < 0:
+            raise ValueError(f"Replay speed must be positive, got {speed}")
+        self.capture_file = capture_file
+        self.speed = speed
+        self.follow_sends = follow_sends
+        self.loop = loop
+        self.records: List[CaptureRecord] = []
+        self._index = 0
+        self._origin = 0.0
+        self._send_times = collections.deque()
+        self._tx_count = 0
+        self._tx_remaining = 0
+        self._sent = threading.Condition()
+
+    def _cc_open(self) -> None:
+        """Load the capture and start the replay."""
+        self.records = list(read_capture(self.capture_file))
+        if not self.follow_sends:
+            self.records = [record for record in self.records if record.direction == Direction.RX]
+        self._tx_count = sum(1 for record in self.records if record.direction == Direction.TX)
+        self._restart()
+        self._origin = time.perf_counter()
+        log.internal_info(f"Replaying {len(self.records)} messages from {self.capture_file}")
+
+    def _cc_close(self) -> None:
+        """Stop the replay."""
+        self.records = []
+        self._tx_count = 0
+        self._restart()
+
+    def _restart(self) -> None:
+        """Go back to the beginning of the capture, forgetting the
+        sends not matched with a captured transmission yet.
+        """
+        self._index = 0
+        self._send_times.clear()
+        self._tx_remaining = self._tx_count
+
+    def _cc_send(self, msg: MsgType, **kwargs) -> None:
+        """Release the next captured transmission.
+
+        :param msg: message sent, not checked against the capture
+        :param kwargs: not used
+        """
+        if not self.follow_sends:
+            return
+        with self._sent:
+            if len(self._send_times) >= self._tx_remaining:
+                log.internal_debug("no captured transmission left for the message sent through %s", self)
+                return
+            self._send_times.append(time.perf_counter())
+            self._sent.notify_all()
+
+    def _due_time(self, record: CaptureRecord) -> float:
+        """Get the time at which a captured message has to be delivered.
+
+        :param record: captured message
+        :return: perf_counter value
+        """
+        if not self.speed:
+            return self._origin
+        return self._origin + record.timestamp / self.speed
+
+    def _cc_receive(self, timeout: float = 0.1) -> Dict[str, Optional[bytes]]:
+        """Get the next captured message once it is due.
+
+        :param timeout: time in second to wait for a message
+        :return: dictionary containing the captured message and its
+            remote id, the message is None if none was due in time
+        """
+        deadline = time.perf_counter() + timeout
+        with self._sent:
+            while True:
+                now = time.perf_counter()
+                if self._index >= len(self.records):
+                    if not (self.loop and self.records):
+                        break
+                    self._restart()
+                    self._origin = now
+                record = self.records[self._index]
+                if record.direction == Direction.TX:
+                    if self._send_times:
+                        # deliver the following messages relative to the actual send
+                        send_time = self._send_times.popleft()
+                        self._origin = send_time - (record.timestamp / self.speed if self.speed else 0)
+                        self._index += 1
+                        self._tx_remaining -= 1
+                        continue
+                    wait_until = deadline
+                else:
+                    due = self._due_time(record)
+                    if due <= now:
+                        self._index += 1
+                        response = {"msg": record.msg}
+                        if record.remote_id is not None:
+                            response["remote_id"] = record.remote_id
+                        return response
+                    wait_until = min(due, deadline)
+                if now >= deadline:
+                    break
+                self._sent.wait(wait_until - now)
+        # nothing due within the timeout, let other threads run
+        remaining = deadline - time.perf_counter()
+        if remaining > 0:
+            time.sleep(remaining)
+        return {"msg": None}
@@ -184,6 +184,30 @@ class CCSerial(connector.CChannel):
         """Close serial port"""
         self.serial.close()
 
+    def fileno(self) -> Optional[int]:
+        """Get the file descriptor of the serial port.
+
+        :return: the port's file descriptor, None if the port is closed
+            or if the platform doesn't provide one (Windows)
+        """
+        try:
+            fileno = self.serial.fileno()
+        except (AttributeError, serial.SerialException):
+            return None
+        return fileno if isinstance(fileno, int) and fileno >= 0 else None
+
+    def wait_readable(self, timeout: Optional[float] = None) -> bool:
+        """Wait until bytes are available on the serial port.
+
+        :param timeout: time in second to wait, None to wait forever
+
+        :return: True if bytes are available, False if the timeout
+            expired
+        """
+        if self.serial.is_open and self.serial.in_waiting > 0:
+            return True
+        return super().wait_readable(timeout)
+
     def _cc_send(self, msg: Union[ByteString, str], timeout: float = None, **kwargs) -> None:
         """Sends data to the serial port
 
@@ -227,3 +251,47 @@ class CCSerial(connector.CChannel):
             received += self.serial.read(in_waiting)
 
         return {"msg": received}
+
+    def _cc_receive_into(self, buffer: memoryview, timeout: float = 0.00001) -> int:
+        """Read bytes from the serial port directly into the given buffer.
+        Wait for the first byte in blocking mode, then read the remaining
+        bytes that fit into the buffer without a blocking call.
+
+        Bytes that don't fit into the buffer are kept in the serial input
+        buffer for the next reception.
+
+        :param buffer: writable buffer to fill
+        :param timeout: timeout in seconds applied on the first byte
+        :return: number of bytes written into the buffer
+        """
+        if not len(buffer):
+            return 0
+
+        self.serial.timeout = timeout
+        received = self.serial.readinto(buffer[:1])
+        if not received:
+            return 0
+
+        # We have waited already so set the timeout to non blocking
+        self.serial.timeout = 0
+
+        to_read = min(self.serial.in_waiting, len(buffer) - 1)
+        if to_read > 0:
+            received += self.serial.readinto(buffer[1 : 1 + to_read])
+
+        return received
+
+    def _cc_receive_many(self, max_count: int, timeout: float = 0.00001) -> List[Dict[str, Optional[bytes]]]:
+        """Read all bytes pending on the serial port at once.
+
+        As the serial port delivers a byte stream, everything available
+        in the input buffer is returned as a single message.
+
+        :param max_count: maximum number of messages to return
+        :param timeout: timeout in seconds applied on the first byte
+
+        :return: list containing the received bytes, empty if nothing
+            was received
+        """
+        recv_response = self._cc_receive(timeout=timeout)
+        return [recv_response] if recv_response["msg"] and max_count > 0 else []
@@ -33,6 +33,7 @@ except ImportError as e:
 
 
 from pykiso import CChannel, Message
+from pykiso.lib.connectors.can_receive import CanReceiveMixin
 from pykiso.lib.connectors.cc_socket_can.socketcan_to_trc import SocketCan2Trc, can
 
 MessageType = Union[Message, bytes]
@@ -48,7 +49,7 @@ def os_name() -> str:
     return platform.system()
 
 
-class CCSocketCan(CChannel):
+class CCSocketCan(CanReceiveMixin, CChannel):
     """CAN FD channel-adapter."""
 
     def __init__(
@@ -143,6 +144,18 @@ class CCSocketCan(CChannel):
             del self.logger
             self.logger = None
 
+    def fileno(self) -> Optional[int]:
+        """Get the file descriptor of the CAN raw socket.
+
+        :return: the socket's file descriptor, None if the bus is closed
+        """
+        if self.bus is None:
+            return None
+        try:
+            return self.bus.fileno()
+        except NotImplementedError:
+            return None
+
     def _cc_send(self, msg: MessageType, remote_id: Optional[int] = None, **kwargs) -> None:
         """Send a CAN message at the configured id.
         If remote_id parameter is not given take configured ones
@@ -162,14 +175,15 @@ class CCSocketCan(CChannel):
         )
         self.bus.send(can_msg)
 
-        log.internal_debug(f"{self} sent CAN Message: {can_msg}, data: {msg}")
+        log.internal_debug("%s sent CAN Message: %s, data: %s", self, can_msg, msg)
 
     def _cc_receive(self, timeout: float = 0.0001) -> Dict[str, Union[bytes, int]]:
         """Receive a can message using configured filters.
 
         :param timeout: timeout applied on reception
 
-        :return: tuple containing the received data and the source can id
+        :return: dictionary containing the received data, the source can
+            id and the timestamp
         """
         try:  # Catch bus errors & rcv.data errors when no messages where received
             received_msg = self.bus.recv(timeout=timeout or self.timeout)
@@ -179,11 +193,11 @@ class CCSocketCan(CChannel):
                 timestamp = received_msg.timestamp
 
                 log.internal_debug("received CAN Message: {}, {}, {}".format(frame_id, payload, timestamp))
-                return {"msg": payload, "remote_id": frame_id}
+                return {"msg": payload, "remote_id": frame_id, "timestamp": timestamp}
             else:
                 return {"msg": None}
         except can.CanError as can_error:
-            log.internal_debug(f"encountered can error: {can_error}")
+            log.internal_debug("encountered can error: %s", can_error)
             return {"msg": None}
         except Exception:
             log.exception(f"encountered error while receiving message via {self}")
@@ -58,6 +58,16 @@ class CCTcpip(CChannel):
         log.internal_info(f"Disconnect from socket at address {self.dest_ip}, port {self.dest_port}")
         self.socket.close()
 
+    def fileno(self) -> Optional[int]:
+        """Get the file descriptor of the connected socket.
+
+        :return: the socket's file descriptor, None if it is closed
+        """
+        if self.socket is None:
+            return None
+        fileno = self.socket.fileno()
+        return fileno if fileno >= 0 else None
+
     def _cc_send(self, msg: bytes or str, **kwargs) -> None:
         """Send a message via socket.
 
@@ -66,7 +76,7 @@ class CCTcpip(CChannel):
         """
         if isinstance(msg, str):
             msg = msg.encode()
-        log.internal_debug(f"Sending {msg} via socket to {self.dest_ip}")
+        log.internal_debug("Sending %s via socket to %s", msg, self.dest_ip)
         self.socket.send(msg)
 
     def _cc_receive(self, timeout=0.01) -> Dict[str, Optional[bytes]]:
@@ -80,12 +90,35 @@ class CCTcpip(CChannel):
 
         try:
             msg_received = self.socket.recv(self.max_msg_size)
-            log.internal_debug(f"Socket at {self.dest_ip} received: {msg_received}")
+            log.internal_debug("Socket at %s received: %s", self.dest_ip, msg_received)
         except socket.timeout:
-            log.exception(f"encountered timeout error while receiving message via {self}")
+            log.internal_debug("encountered timeout error while receiving message via %s", self)
             return {"msg": None}
         except Exception:
             log.exception(f"encountered error while receiving message via {self}")
             return {"msg": None}
 
         return {"msg": msg_received}
+
+    def _cc_receive_into(self, buffer: memoryview, timeout: float = 0.01) -> int:
+        """Read bytes from the socket directly into the given buffer.
+
+        :param buffer: writable buffer to fill, the bytes that don't fit
+            into it are kept in the socket for the next reception
+        :param timeout: time in second to wait for reading a message
+
+        :return: number of bytes written into the buffer
+        """
+        self.socket.settimeout(timeout or self.timeout)
+
+        try:
+            received = self.socket.recv_into(buffer, min(len(buffer), self.max_msg_size))
+            log.internal_debug("Socket at %s received %d bytes", self.dest_ip, received)
+        except socket.timeout:
+            log.internal_debug("encountered timeout error while receiving message via %s", self)
+            return 0
+        except Exception:
+            log.exception(f"encountered error while receiving message via {self}")
+            return 0
+
+        return received
@@ -29,6 +29,7 @@ except ImportError as e:
     raise ImportError(f"{e.name} dependency missing, consider installing pykiso with 'pip install pykiso[serial]'")
 
 from pykiso import connector, message
+from pykiso.crc import crc16
 
 
 class IncompleteCCMsgError(Exception):
@@ -154,19 +155,4 @@ class CCUart(connector.CChannel):
         return
 
     def _calculate_crc32(self, buffer):
-        crc = 0
-
-        CRC_BIT_SHIFT_4 = 4
-        CRC_BIT_SHIFT_5 = 5
-        CRC_BIT_SHIFT_8 = 8
-        CRC_BIT_SHIFT_12 = 12
-        CRC_BYTE_MASK = 0xFF
-
-        for aByte in buffer:
-            crc = ((crc >> (CRC_BIT_SHIFT_8)) | (crc << (CRC_BIT_SHIFT_8))) & 0xFFFF
-            crc = (crc ^ (aByte & CRC_BYTE_MASK)) & 0xFFFF
-            crc = (crc ^ (crc & (CRC_BYTE_MASK)) >> (CRC_BIT_SHIFT_4)) & 0xFFFF
-            crc = (crc ^ ((crc << (CRC_BIT_SHIFT_12)) & 0xFFFF)) & 0xFFFF
-            crc = (crc ^ (crc & (CRC_BYTE_MASK)) << (CRC_BIT_SHIFT_5)) & 0xFFFF
-
-        return crc & 0xFFFF
+        return crc16(buffer)
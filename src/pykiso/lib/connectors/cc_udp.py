@@ -23,7 +23,7 @@ Communication Channel Via Udp
 
 import logging
 import socket
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 from pykiso import connector
 
@@ -60,6 +60,16 @@ class CCUdp(connector.CChannel):
         """Close the udp socket."""
         self.udp_socket.close()
 
+    def fileno(self) -> Optional[int]:
+        """Get the file descriptor of the UDP socket.
+
+        :return: the socket's file descriptor, None if it is closed
+        """
+        if self.udp_socket is None:
+            return None
+        fileno = self.udp_socket.fileno()
+        return fileno if fileno >= 0 else None
+
     def _cc_send(self, msg: bytes, **kwargs) -> None:
         """Send message using udp socket
 
@@ -83,13 +93,67 @@ class CCUdp(connector.CChannel):
 
         # catch the errors linked to the socket timeout without blocking
         except BlockingIOError:
-            log.internal_debug(f"encountered error while receiving message via {self}")
+            log.internal_debug("encountered error while receiving message via %s", self)
             return {"msg": None}
         except socket.timeout:
-            log.internal_debug(f"encountered error while receiving message via {self}")
+            log.internal_debug("encountered error while receiving message via %s", self)
             return {"msg": None}
         except BaseException:
             log.exception(f"encountered error while receiving message via {self}")
             return {"msg": None}
 
         return {"msg": msg_received}
+
+    def _cc_receive_into(self, buffer: memoryview, timeout: float = 0.0000001) -> int:
+        """Read a datagram from the socket directly into the given buffer.
+
+        :param buffer: writable buffer to fill, the part of a datagram
+            that doesn't fit into it is discarded
+        :param timeout: timeout applied on receive event
+
+        :return: number of bytes written into the buffer
+        """
+        self.udp_socket.settimeout(timeout or self.timeout)
+
+        try:
+            received, self.source_addr = self.udp_socket.recvfrom_into(buffer)
+
+        # catch the errors linked to the socket timeout without blocking
+        except (BlockingIOError, socket.timeout):
+            log.internal_debug("encountered error while receiving message via %s", self)
+            return 0
+        except BaseException:
+            log.exception(f"encountered error while receiving message via {self}")
+            return 0
+
+        return received
+
+    def _cc_receive_many(self, max_count: int, timeout: float = 0.0000001) -> List[Dict[str, Optional[bytes]]]:
+        """Read the datagrams pending on the socket, only waiting for the
+        first one.
+
+        :param max_count: maximum number of datagrams to return
+        :param timeout: timeout applied on the reception of the first
+            datagram
+
+        :return: list of dictionaries containing the received bytes
+        """
+        previous_timeout = self.udp_socket.gettimeout()
+        self.udp_socket.settimeout(timeout or self.timeout)
+        responses = []
+        try:
+            msg_received, self.source_addr = self.udp_socket.recvfrom(self.max_msg_size)
+            responses.append({"msg": msg_received})
+            # the following datagrams are only read if already available
+            self.udp_socket.setblocking(False)
+            while len(responses) < max_count:
+                msg_received, self.source_addr = self.udp_socket.recvfrom(self.max_msg_size)
+                responses.append({"msg": msg_received})
+        except (BlockingIOError, socket.timeout):
+            pass
+        except BaseException:
+            log.exception(f"encountered error while receiving message via {self}")
+        finally:
+            # leave the socket blocking for the following sends and receptions
+            self.udp_socket.settimeout(previous_timeout)
+        return responses
@@ -0,0 +1,95 @@
+##########################################################################
+# Copyright (c) 2010-2022 Robert Bosch GmbH
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# http://www.eclipse.org/legal/epl-2.0.
+#
+# SPDX-License-Identifier: EPL-2.0
+##########################################################################
+
+"""
+Asyncio Communication Channel Via Udp
+*************************************
+
+:module: cc_udp_async
+
+:synopsis: Udp communication channel for asynchronous auxiliaries
+
+Counterpart of :py:mod:`~pykiso.lib.connectors.cc_udp` whose socket is
+served by the event loop shared by the asynchronous auxiliaries, so that
+waiting for a datagram doesn't occupy a thread.
+
+.. currentmodule:: cc_udp_async
+
+"""
+
+import asyncio
+import logging
+from typing import Dict, Optional, Tuple
+
+from pykiso import connector
+
+log = logging.getLogger(__name__)
+
+
+class _DatagramQueue(asyncio.DatagramProtocol):
+    """Protocol storing the received datagrams in a queue."""
+
+    def __init__(self) -> None:
+        self.datagrams: asyncio.Queue = asyncio.Queue()
+
+    def datagram_received(self, data: bytes, addr: Tuple[str, int]) -> None:
+        self.datagrams.put_nowait((data, addr))
+
+    def error_received(self, exc: Exception) -> None:
+        log.internal_debug("encountered error while receiving datagram: %s", exc)
+
+
+class CCUdpAsync(connector.AsyncCChannel):
+    """Asyncio based UDP implementation of the coordination channel."""
+
+    def __init__(self, dest_ip: str, dest_port: int, **kwargs):
+        """Initialize attributes.
+
+        :param dest_ip: destination ip address
+        :param dest_port: destination port
+        """
+        super().__init__(**kwargs)
+        self.dest_ip = dest_ip
+        self.dest_port = dest_port
+        self.transport: Optional[asyncio.DatagramTransport] = None
+        self.protocol: Optional[_DatagramQueue] = None
+        self.source_addr = None
+
+    async def _cc_open(self) -> None:
+        """Open the udp socket on the running event loop."""
+        loop = asyncio.get_running_loop()
+        self.transport, self.protocol = await loop.create_datagram_endpoint(_DatagramQueue, local_addr=("0.0.0.0", 0))
+
+    async def _cc_close(self) -> None:
+        """Close the udp socket."""
+        if self.transport is not None:
+            self.transport.close()
+        self.transport = self.protocol = None
+
+    async def _cc_send(self, msg: bytes, **kwargs) -> None:
+        """Send message using udp socket
+
+        :param msg: message to send, should bytes.
+        :param kwargs: not used
+        """
+        self.transport.sendto(msg, (self.dest_ip, self.dest_port))
+
+    async def _cc_receive(self, timeout: float = 0.1, **kwargs) -> Dict[str, Optional[bytes]]:
+        """Wait for a datagram without blocking the event loop.
+
+        :param timeout: time in second to wait for a datagram
+        :param kwargs: not used
+
+        :return: dictionary containing the received bytes if successful, otherwise None
+        """
+        try:
+            msg_received, self.source_addr = await asyncio.wait_for(self.protocol.datagrams.get(), timeout)
+        except asyncio.TimeoutError:
+            return {"msg": None}
+        return {"msg": msg_received}
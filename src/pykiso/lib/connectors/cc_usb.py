@@ -26,6 +26,7 @@ try:
 except ImportError as e:
     raise ImportError(f"{e.name} dependency missing, consider installing pykiso with 'pip install pykiso[serial]'")
 
+from pykiso.crc import crc16
 from pykiso.lib.connectors import cc_uart
 
 
@@ -34,8 +35,8 @@ class CCUsb(cc_uart.CCUart):
         super().__init__(serial_port, baudrate=9600)
 
     def _cc_send(self, msg):
-        raw_packet = msg.serialize()
-        crc = self._calculate_crc32(raw_packet)
+        raw_packet = bytearray(msg.serialize())
+        crc = crc16(raw_packet)
 
         raw_packet.insert(0, ((crc >> 8) & 0xFF))
         raw_packet.insert(1, (crc & 0xFF))
@@ -33,12 +33,14 @@ except ImportError as e:
 
 from pykiso import CChannel, Message
 
+from .can_receive import CanReceiveMixin
+
 MessageType = Union[Message, bytes]
 
 log = logging.getLogger(__name__)
 
 
-class CCVectorCan(CChannel):
+class CCVectorCan(CanReceiveMixin, CChannel):
     """CAN FD channel-adapter."""
 
     def __init__(
@@ -145,7 +147,7 @@ class CCVectorCan(CChannel):
         )
         self.bus.send(can_msg)
 
-        log.internal_debug(f"sent CAN Message: {can_msg}")
+        log.internal_debug("sent CAN Message: %s", can_msg)
 
     def _cc_receive(self, timeout=0.0001) -> Dict[str, Union[MessageType, int]]:
         """Receive a can message using configured filters.
@@ -162,7 +164,7 @@ class CCVectorCan(CChannel):
                 payload = received_msg.data
                 timestamp = received_msg.timestamp
 
-                log.internal_debug(f"received CAN Message: {frame_id}, {payload}")
+                log.internal_debug("received CAN Message: %s, %s", frame_id, payload)
 
                 return {
                     "msg": payload,
@@ -29,10 +29,12 @@ try:
 except ImportError as e:
     raise ImportError(f"{e.name} dependency missing, consider installing pykiso with 'pip install pykiso[can]'")
 
+from .can_receive import CanReceiveMixin
+
 log = logging.getLogger(__name__)
 
 
-class CCVirtualCan(connector.CChannel):
+class CCVirtualCan(CanReceiveMixin, connector.CChannel):
     def __init__(
         self,
         channel: UdpMulticastBus = UdpMulticastBus.DEFAULT_GROUP_IPv4,
@@ -84,7 +84,7 @@ class VISAChannel(CChannel):
         except Exception as e:
             log.exception(f"Request {request}: {request_data} failed!\n{e}")
         else:
-            log.internal_debug(f"Response received: {recv}")
+            log.internal_debug("Response received: %s", recv)
         finally:
             response = {"msg": str(recv)}
             return response
@@ -96,7 +96,7 @@ class VISAChannel(CChannel):
         """
         msg = msg.decode()
 
-        log.internal_debug(f"Writing {msg} to {self.resource_name}")
+        log.internal_debug("Writing %s to %s", msg, self.resource_name)
         self.resource.write(msg)
 
     def _cc_receive(self, timeout: float = 0.1) -> Dict[str, Optional[bytes]]:
@@ -200,5 +200,5 @@ class CCGrpcClient(connector.CChannel):
         try:
             return {"msg": self.list_of_received_messages.pop(0)}
         except IndexError:
-            log.debug(f"no message received via {self}")
+            log.debug("no message received via %s", self)
             return {"msg": None}
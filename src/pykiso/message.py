@@ -25,10 +25,33 @@ import enum
 import itertools
 import logging
 import struct
-from typing import Dict, Optional, Union
+import sys
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .crc import CRC16_SIZE, crc16, crc16_array
 
 msg_cnt = itertools.cycle(range(256))  # Will be used as token. It increases each time a Message is created
 
+#: fields of the structured array returned by Message.parse_many
+PACKET_FIELDS = (
+    ("offset", "i8"),
+    ("size", "u2"),
+    ("msg_type", "u1"),
+    ("msg_token", "u1"),
+    ("sub_type", "u1"),
+    ("error_code", "u1"),
+    ("test_suite", "u1"),
+    ("test_case", "u1"),
+    ("payload_length", "u1"),
+    ("crc_valid", "?"),
+)
+
 log = logging.getLogger(__name__)
 
 
@@ -108,6 +131,50 @@ type_sub_type_dict = {
 }
 
 
+class TlvDict(Mapping):
+    """Read-only mapping of the TLV elements of a parsed packet.
+
+    Only the position of each value in the raw packet is stored, the
+    value itself is copied to bytes when accessed. The raw packet must
+    therefore not be modified while the message is in use.
+    """
+
+    __slots__ = ("_raw_packet", "_offsets")
+
+    def __init__(self, raw_packet: Union[bytes, bytearray, memoryview], offsets: Dict[TlvKnownTags, Tuple[int, int]]):
+        """Initialize attributes.
+
+        :param raw_packet: packet containing the TLV elements
+        :param offsets: start index and length of each value in the
+            raw packet
+        """
+        self._raw_packet = raw_packet
+        self._offsets = offsets
+
+    def __getitem__(self, tag: TlvKnownTags) -> bytes:
+        start, length = self._offsets[tag]
+        return bytes(self._raw_packet[start : start + length])
+
+    def __iter__(self) -> Iterator[TlvKnownTags]:
+        return iter(self._offsets)
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({dict(self)})"
+
+    def get_text(self, tag: TlvKnownTags, encoding: str = "latin-1") -> str:
+        """Decode the value of a TLV element to a string.
+
+        :param tag: tag of the TLV element
+        :param encoding: encoding of the value
+
+        :return: the decoded value
+        """
+        return self[tag].decode(encoding)
+
+
 class Message:
     """A message who fit testApp protocol.
 
@@ -115,11 +182,28 @@ class Message:
     TYPE: msg_type | message_token | sub_type | errorCode |
     """
 
+    __slots__ = (
+        "msg_type",
+        "msg_token",
+        "sub_type",
+        "error_code",
+        "reserved",
+        "test_suite",
+        "test_case",
+        "tlv_dict",
+    )
+
     crc_byte_size = 2
     header_size = 8
     max_payload_size = 0xFF
     max_message_size = header_size + max_payload_size + crc_byte_size
-    reserved = 0
+
+    #: msg_type, msg_token, sub_type, error_code, reserved, test_suite,
+    #: test_case and payload_length
+    _header_struct = struct.Struct("BBBBBBBB")
+    _crc_struct = struct.Struct("H")
+    _byte_struct = struct.Struct("B")
+    _tlv_int_struct = struct.Struct("H")
 
     def __init__(
         self,
@@ -155,6 +239,7 @@ class Message:
         self.msg_token = next(msg_cnt)
         self.sub_type = sub_type
         self.error_code = error_code
+        self.reserved = 0
         self.test_suite = test_suite
         self.test_case = test_case
         self.tlv_dict = tlv_dict
@@ -185,10 +270,39 @@ class Message:
 
         :return: bytes representing the Message object
         """
-        raw_packet = b""
+        payload = self._serialize_tlv()
+        raw_packet = bytearray(self.header_size + len(payload) + self.crc_byte_size)
+        self._pack_into(raw_packet, 0, payload)
+        return bytes(raw_packet)
+
+    def serialize_into(self, buffer: Union[bytearray, memoryview], offset: int = 0) -> int:
+        """Serialize message into a preallocated buffer, see :py:meth:`serialize`.
+
+        :param buffer: writable buffer to write the raw packet to
+        :param offset: index of the buffer at which the packet starts
 
-        raw_packet += struct.pack(
-            "BBBBBBB",
+        :raises ValueError: if the packet doesn't fit in the buffer
+        :return: number of bytes written
+        """
+        payload = self._serialize_tlv()
+        size = self.header_size + len(payload) + self.crc_byte_size
+        if len(buffer) - offset < size:
+            raise ValueError(f"{size} bytes packet doesn't fit in buffer of size {len(buffer)} at offset {offset}")
+        return self._pack_into(buffer, offset, payload)
+
+    def _pack_into(self, buffer: Union[bytearray, memoryview], offset: int, payload: bytes) -> int:
+        """Write the header, payload and CRC of the packet into a buffer
+        large enough to contain it.
+
+        :param buffer: writable buffer to write the raw packet to
+        :param offset: index of the buffer at which the packet starts
+        :param payload: serialized TLV elements
+
+        :return: number of bytes written
+        """
+        self._header_struct.pack_into(
+            buffer,
+            offset,
             ((int(self.msg_type) << 4) | (1 << 6)),
             self.msg_token,
             int(self.sub_type),
@@ -196,61 +310,73 @@ class Message:
             self.reserved,
             self.test_suite,
             self.test_case,
+            len(payload),
         )
+        crc_offset = offset + self.header_size + len(payload)
+        buffer[offset + self.header_size : crc_offset] = payload
+        crc = crc16(memoryview(buffer)[offset:crc_offset])
+        self._crc_struct.pack_into(buffer, crc_offset, crc)
+        return crc_offset + self.crc_byte_size - offset
 
-        # Calculate and convert the dictionaries tlv elements into bytes
-        if self.tlv_dict is not None:
-            payload = b""
-            for key, value in self.tlv_dict.items():
-                # Check first if it the dict is conform
+    def _serialize_tlv(self) -> bytes:
+        """Convert the dictionary's TLV elements into bytes.
+
+        :return: the serialized TLV elements, empty if there is none
+        """
+        if not self.tlv_dict:
+            return b""
+
+        elements = []
+        for key, value in self.tlv_dict.items():
+            # Check first if it the dict is conform
+            if isinstance(key, TlvKnownTags):
+                parsed_key = self._byte_struct.pack(int(key))
+            else:
                 parsed_key = b""
-                if isinstance(key, TlvKnownTags):
-                    parsed_key = struct.pack("B", int(key))
-                else:
-                    log.internal_warning("{} is not a supported format".format(key))
+                log.internal_warning("{} is not a supported format".format(key))
+            if isinstance(value, str):  # If string given
+                parsed_value = value.encode("latin-1")
+            elif isinstance(value, int):
+                parsed_value = self._tlv_int_struct.pack(value)  # TODO check endianness later on
+            elif isinstance(value, bytes):
+                parsed_value = value
+            else:
                 parsed_value = b""
-                if isinstance(value, str):  # If string given
-                    parsed_value = parsed_value.join([struct.pack("B", ord(val)) for val in value])
-                elif isinstance(value, int):
-                    parsed_value = struct.pack("H", value)  # TODO check endianness later on
-                elif isinstance(value, bytes):
-                    parsed_value = value
-                else:
-                    log.internal_warning("{} is not a supported format".format(value))
-                # Add the TLV element:
-                payload += parsed_key
-                payload += struct.pack("B", len(parsed_value))
-                payload += parsed_value
-            # Add the tlvs elements within the raw_packet
-            raw_packet += struct.pack("B", len(payload))
-            raw_packet += payload
-        else:
-            # Add the payload length to 0
-            raw_packet += struct.pack("B", 0)
-
-        # Add crc to raw_packet
-        raw_packet += struct.pack("H", self.get_crc(raw_packet, self.crc_byte_size))
-
-        return raw_packet
+                log.internal_warning("{} is not a supported format".format(value))
+            # Add the TLV element:
+            elements.append(parsed_key)
+            elements.append(self._byte_struct.pack(len(parsed_value)))
+            elements.append(parsed_value)
+        return b"".join(elements)
 
     @classmethod
-    def parse_packet(cls, raw_packet: bytes) -> Message:
+    def parse_packet(cls, raw_packet: Union[bytes, bytearray, memoryview], check_crc: bool = True) -> Message:
         """Factory function to create a Message object from raw data.
 
+        The raw packet is not copied: the TLV values are only extracted
+        from it on access, see :py:class:`TlvDict`.
+
         :param raw_packet: array of a received message
+        :param check_crc: False if the CRC of the packet was already
+            verified
 
         :return: itself
         """
         msg = cls()
-        if (not isinstance(raw_packet, bytes)) and (len(raw_packet) < (msg.header_size + msg.crc_byte_size)):
+        packet_size = len(raw_packet)
+        if (not isinstance(raw_packet, bytes)) and (packet_size < (msg.header_size + msg.crc_byte_size)):
             log.error("Packet is not understandable")
 
         # Check the CRC
-        crc = cls.get_crc(raw_packet[: -msg.crc_byte_size], msg.crc_byte_size)
-        if crc != struct.unpack("H", raw_packet[-msg.crc_byte_size :])[0]:
-            log.error(f"CRC check failed {crc} != {struct.unpack('H', raw_packet[-msg.crc_byte_size:])[0]}")
+        crc_offset = packet_size - msg.crc_byte_size
+        if check_crc:
+            with memoryview(raw_packet) as packet_view:
+                crc = crc16(packet_view[:crc_offset])
+            (expected_crc,) = cls._crc_struct.unpack_from(raw_packet, crc_offset)
+            if crc != expected_crc:
+                log.error(f"CRC check failed {crc} != {expected_crc}")
 
-        unpack_header = struct.unpack("BBBBBBB", raw_packet[:7])
+        unpack_header = cls._header_struct.unpack_from(raw_packet)
 
         msg.msg_type = (MessageType)(int((unpack_header[0] & 0x30) >> 4))
         msg.msg_token = int(unpack_header[1])
@@ -260,32 +386,104 @@ class Message:
         msg.reserved = int(unpack_header[4])
         msg.test_suite = int(unpack_header[5])
         msg.test_case = int(unpack_header[6])
-        payload_length = int(raw_packet[7])
+        payload_length = int(unpack_header[7])
         # Create payload based on known tlvs
         if payload_length != 0:
-            msg.tlv_dict = {}
-            for tag, value in cls._parse_tlv(raw_packet[msg.header_size : -msg.crc_byte_size]):
-                msg.tlv_dict[TlvKnownTags(tag)] = value
+            msg.tlv_dict = TlvDict(raw_packet, cls._parse_tlv(raw_packet, msg.header_size, crc_offset))
 
         return msg
 
     @classmethod
-    def _parse_tlv(cls, tlv_packet: bytes) -> tuple:
-        """Generator used to parse TLV formatted bytes array.
+    def _parse_tlv(
+        cls, raw_packet: Union[bytes, bytearray, memoryview], start: int, end: int
+    ) -> Dict[TlvKnownTags, Tuple[int, int]]:
+        """Locate the TLV elements of a raw packet.
 
-        :param tlv_packet: raw TLV formatted bytes array
+        :param raw_packet: packet containing the TLV elements
+        :param start: index of the first TLV element
+        :param end: index following the last TLV element
 
-        :return: tuple containing the extract tag(int) and value(list)
+        :return: start index and length of each value, by tag
         """
-        tlv_iterator = iter(tlv_packet)
-        while True:
-            try:
-                tag = int(next(itertools.islice(tlv_iterator, 1)))
-                length = int(next(itertools.islice(tlv_iterator, 1)))
-                value = [val for val in itertools.islice(tlv_iterator, length)]
-                yield (tag, value)
-            except StopIteration:
+        offsets = {}
+        index = start
+        while index + 1 < end:
+            tag = raw_packet[index]
+            length = raw_packet[index + 1]
+            index += 2
+            # a truncated value is cut at the end of the payload
+            offsets[TlvKnownTags(tag)] = (index, min(length, end - index))
+            index += length
+        return offsets
+
+    @classmethod
+    def parse_many(cls, buffer: Union[bytes, bytearray, memoryview]) -> "np.ndarray":
+        """Decode the headers of all packets of a recorded stream at once.
+
+        The packets must directly follow each other in the buffer. Each
+        one is described by a record of a NumPy structured array, with
+        the fields of :py:data:`PACKET_FIELDS`: position and size of the
+        packet in the buffer, header values and CRC validity. Only the
+        packets of interest then need to be parsed as Message:
+
+        .. code:: python
+
+            packets = Message.parse_many(recording)
+            reports = packets[(packets["msg_type"] == MessageType.REPORT) & packets["crc_valid"]]
+            offset, size = reports["offset"][0], reports["size"][0]
+            msg = Message.parse_packet(recording[offset : offset + size])
+
+        :param buffer: concatenated raw packets, an incomplete trailing
+            packet is ignored
+
+        :raises ImportError: if NumPy is not installed
+        :return: one record per packet
+        """
+        if np is None:
+            raise ImportError("numpy dependency missing, consider installing pykiso with 'pip install pykiso[analysis]'")
+
+        data = np.frombuffer(buffer, dtype=np.uint8)
+        buffer_size = len(data)
+        # packet boundaries only depend on the payload length byte of
+        # each header, the rest is decoded for all packets at once
+        min_size = cls.header_size + cls.crc_byte_size
+        payload_length_index = cls.header_size - 1
+        raw = memoryview(buffer).cast("B")
+        offsets = []
+        offset = 0
+        while offset + min_size <= buffer_size:
+            next_offset = offset + min_size + raw[offset + payload_length_index]
+            if next_offset > buffer_size:
                 break
+            offsets.append(offset)
+            offset = next_offset
+        if offset != buffer_size:
+            log.internal_warning(f"Ignored {buffer_size - offset} bytes of incomplete packet at offset {offset}")
+
+        packets = np.zeros(len(offsets), dtype=list(PACKET_FIELDS))
+        if not offsets:
+            return packets
+
+        offsets = np.array(offsets, dtype=np.int64)
+        header = data[offsets[:, np.newaxis] + np.arange(cls.header_size)]
+        packets["offset"] = offsets
+        packets["payload_length"] = header[:, payload_length_index]
+        packets["size"] = packets["payload_length"].astype(np.uint16) + min_size
+        packets["msg_type"] = (header[:, 0] & 0x30) >> 4
+        packets["msg_token"] = header[:, 1]
+        packets["sub_type"] = header[:, 2]
+        packets["error_code"] = header[:, 3]
+        packets["test_suite"] = header[:, 5]
+        packets["test_case"] = header[:, 6]
+
+        crc_offsets = offsets + cls.header_size + packets["payload_length"]
+        crc_bytes = data[crc_offsets[:, np.newaxis] + np.arange(cls.crc_byte_size)].astype(np.uint16)
+        if sys.byteorder == "little":
+            expected_crc = crc_bytes[:, 0] | (crc_bytes[:, 1] << 8)
+        else:
+            expected_crc = (crc_bytes[:, 0] << 8) | crc_bytes[:, 1]
+        packets["crc_valid"] = crc16_array(data, offsets, crc_offsets - offsets) == expected_crc
+        return packets
 
     def generate_ack_message(self, ack_type: int) -> Union[Message, None]:
         """Generate acknowledgement to send out.
@@ -349,6 +547,9 @@ class Message:
         :return: CRC checksum
         """
 
+        if crc_byte_size == CRC16_SIZE:
+            return crc16(serialized_msg)
+
         crc = 0
         crc_mask = 255
         crc_size = (2 ** (crc_byte_size * 8)) - 1
@@ -360,3 +561,85 @@ class Message:
             crc ^= (crc << 12) & crc_size
             crc ^= ((crc & crc_mask) << 5) & crc_size
         return crc
+
+
+class MessageFramer:
+    """Split a byte stream into messages.
+
+    Stream connectors return chunks of arbitrary size, which may contain
+    part of a packet or several of them. The framer accumulates the
+    chunks and uses the payload length of each header to find the packet
+    boundaries:
+
+    .. code:: python
+
+        framer = MessageFramer()
+        for msg in framer.feed(chunk):
+            ...
+
+    A packet with an invalid header or CRC means that the framer lost
+    track of the boundaries, in which case it drops one byte after the
+    other until a valid packet starts the buffer again.
+    """
+
+    #: protocol version bits of the first header byte, the other ones
+    #: are ignored like in :py:meth:`Message.parse_packet`
+    _HEADER_MASK = 0xC0
+    _HEADER_VERSION = 0x40
+
+    def __init__(self) -> None:
+        """Initialize attributes."""
+        self._buffer = bytearray()
+        self._in_sync = True
+        #: number of bytes dropped to resynchronize on the stream
+        self.discarded = 0
+
+    @property
+    def pending(self) -> int:
+        """Number of received bytes not yet part of a message."""
+        return len(self._buffer)
+
+    def reset(self) -> None:
+        """Drop the bytes of the incomplete packet, e.g. on reconnection."""
+        self._buffer.clear()
+        self._in_sync = True
+
+    def feed(self, chunk: Union[bytes, bytearray, memoryview]) -> List[Message]:
+        """Add received bytes to the stream and extract the complete
+        messages.
+
+        :param chunk: bytes read from the connector
+
+        :return: the messages completed by this chunk, possibly none
+        """
+        buffer = self._buffer
+        buffer += chunk
+        messages = []
+        header_size = Message.header_size
+        crc_size = Message.crc_byte_size
+        while len(buffer) >= header_size + crc_size:
+            crc_offset = header_size + buffer[header_size - 1]
+            # a byte which can't start a packet is dropped right away
+            # instead of waiting for the payload length it would announce
+            if buffer[0] & self._HEADER_MASK == self._HEADER_VERSION:
+                if len(buffer) < crc_offset + crc_size:
+                    break
+                # parsed messages keep a reference to their packet, so it
+                # must not be a view on the reused buffer
+                packet = bytes(buffer[: crc_offset + crc_size])
+                (expected_crc,) = Message._crc_struct.unpack_from(packet, crc_offset)
+                if crc16(memoryview(packet)[:crc_offset]) == expected_crc:
+                    self._in_sync = True
+                    del buffer[: len(packet)]
+                    try:
+                        messages.append(Message.parse_packet(packet, check_crc=False))
+                    except ValueError:
+                        log.internal_warning(f"Dropped packet with unknown content: {packet.hex()}")
+                    continue
+
+            if self._in_sync:
+                log.internal_warning("Invalid packet received, resynchronizing on the received stream")
+                self._in_sync = False
+            del buffer[:1]
+            self.discarded += 1
+        return messages
@@ -0,0 +1,251 @@
+##########################################################################
+# Copyright (c) 2010-2022 Robert Bosch GmbH
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# http://www.eclipse.org/legal/epl-2.0.
+#
+# SPDX-License-Identifier: EPL-2.0
+##########################################################################
+
+"""
+Performance Metrics
+*******************
+
+:module: metrics
+
+:synopsis: lightweight counters, gauges and histograms recorded by
+    auxiliaries and channels, collected in a process-wide registry.
+
+Each auxiliary and each channel owns a :py:class:`Metrics` instance
+available under its ``metrics`` attribute:
+
+.. code:: python
+
+    snapshot = aux.metrics.snapshot()
+    print(snapshot["histograms"]["run_command_latency"]["mean"])
+
+.. currentmodule:: metrics
+
+"""
+from __future__ import annotations
+
+import bisect
+import itertools
+import json
+import math
+import threading
+import weakref
+from typing import Any, Callable, Dict, Optional, Sequence
+
+from .types import PathType
+
+#: default histogram bucket upper bounds, in seconds
+DEFAULT_BUCKETS = (1e-5, 1e-4, 5e-4, 1e-3, 5e-3, 1e-2, 5e-2, 1e-1, 5e-1, 1.0, 5.0)
+
+
+class Histogram:
+    """Distribution of observed values over fixed buckets."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        """Initialize attributes.
+
+        :param buckets: sorted upper bounds of the buckets, an overflow
+            bucket is always added
+        """
+        self.bounds = tuple(buckets)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def observe(self, value: float) -> None:
+        """Record a value.
+
+        :param value: value to record
+        """
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get the current state of the histogram.
+
+        :return: count, sum, min, max and mean of the observed values
+            and the number of values per bucket
+        """
+        labels = [f"<={bound:g}" for bound in self.bounds] + ["+inf"]
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+            "mean": self.sum / self.count if self.count else None,
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
+class Metrics:
+    """Set of named counters, gauges and histograms of one component."""
+
+    _instance_count = itertools.count()
+
+    def __init__(self, name: str) -> None:
+        """Initialize attributes and add the instance to the registry.
+
+        :param name: name of the measured component, not necessarily
+            unique
+        """
+        self.name = name
+        #: creation order, used to tell apart components with the same name
+        self.index = next(self._instance_count)
+        self._lock = threading.Lock()
+        self._counters: Dict[str, int] = {}
+        self._histograms: Dict[str, Histogram] = {}
+        self._gauges: Dict[str, Callable[[], Any]] = {}
+        self._children: Dict[str, Callable[[], Optional[Metrics]]] = {}
+        registry.add(self)
+
+    def increment(self, key: str, value: int = 1) -> None:
+        """Increase a counter.
+
+        :param key: name of the counter
+        :param value: amount to add
+        """
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, key: str, value: float) -> None:
+        """Record a value in a histogram.
+
+        :param key: name of the histogram
+        :param value: value to record
+        """
+        with self._lock:
+            self._observe(key, value)
+
+    def record(
+        self, observations: Optional[Dict[str, float]] = None, counters: Optional[Dict[str, int]] = None
+    ) -> None:
+        """Record values and increase counters at once, taking the lock
+        only once on hot paths.
+
+        :param observations: value to record by histogram name
+        :param counters: amount to add by counter name
+        """
+        with self._lock:
+            if observations:
+                for key, value in observations.items():
+                    self._observe(key, value)
+            if counters:
+                for key, value in counters.items():
+                    self._counters[key] = self._counters.get(key, 0) + value
+
+    def _observe(self, key: str, value: float) -> None:
+        """Record a value in a histogram, the lock being already held.
+
+        :param key: name of the histogram
+        :param value: value to record
+        """
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            histogram = self._histograms[key] = Histogram()
+        histogram.observe(value)
+
+    def register_gauge(self, key: str, getter: Callable[[], Any]) -> None:
+        """Register a gauge, evaluated each time a snapshot is taken.
+
+        :param key: name of the gauge
+        :param getter: callable returning the current value
+        """
+        self._gauges[key] = getter
+
+    def register_child(self, key: str, getter: Callable[[], Optional[Metrics]]) -> None:
+        """Nest the metrics of another component in the snapshots.
+
+        :param key: name under which the child's snapshot is stored
+        :param getter: callable returning the child's metrics or None
+        """
+        self._children[key] = getter
+
+    def reset(self) -> None:
+        """Clear all counters and histograms."""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get the current value of all metrics.
+
+        :return: dictionary containing the counters, the gauges, the
+            histograms and the snapshots of the nested metrics
+        """
+        with self._lock:
+            snapshot = {
+                "counters": dict(self._counters),
+                "histograms": {key: hist.snapshot() for key, hist in self._histograms.items()},
+            }
+        gauges = {}
+        for key, getter in self._gauges.items():
+            try:
+                gauges[key] = getter()
+            except Exception:
+                gauges[key] = None
+        snapshot["gauges"] = gauges
+        for key, getter in self._children.items():
+            child = getter()
+            if child is not None:
+                snapshot[key] = child.snapshot()
+        return snapshot
+
+
+class MetricsRegistry:
+    """Collection of all living :py:class:`Metrics` instances."""
+
+    def __init__(self) -> None:
+        self._metrics: weakref.WeakSet = weakref.WeakSet()
+        self._lock = threading.Lock()
+
+    def add(self, metrics: Metrics) -> None:
+        """Add metrics to the registry.
+
+        :param metrics: metrics to add
+        """
+        with self._lock:
+            self._metrics.add(metrics)
+
+    def snapshot_all(self) -> Dict[str, Dict[str, Any]]:
+        """Take a snapshot of every registered component.
+
+        Components sharing the same name are suffixed with ``#2``,
+        ``#3``... in their creation order.
+
+        :return: snapshots sorted by component name
+        """
+        with self._lock:
+            metrics = list(self._metrics)
+        snapshots = {}
+        for name, group in itertools.groupby(sorted(metrics, key=lambda m: (m.name, m.index)), lambda m: m.name):
+            for rank, component in enumerate(group, 1):
+                snapshots[name if rank == 1 else f"{name}#{rank}"] = component.snapshot()
+        return snapshots
+
+    def dump_json(self, path: PathType, snapshot: Optional[Dict[str, Any]] = None) -> None:
+        """Write a snapshot to a JSON file.
+
+        :param path: path of the JSON file to write
+        :param snapshot: snapshot to write, defaults to a snapshot of
+            every registered component
+        """
+        if snapshot is None:
+            snapshot = self.snapshot_all()
+        with open(path, "w") as metrics_file:
+            json.dump(snapshot, metrics_file, indent=2)
+
+
+#: process-wide metrics registry
+registry = MetricsRegistry()
@@ -0,0 +1,234 @@
+##########################################################################
+# Copyright (c) 2010-2022 Robert Bosch GmbH
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# http://www.eclipse.org/legal/epl-2.0.
+#
+# SPDX-License-Identifier: EPL-2.0
+##########################################################################
+
+"""
+Bounded Queues
+**************
+
+:module: queues
+
+:synopsis: thread-safe queues with a configurable capacity, overflow
+    policy and fill level monitoring, optionally split into priority
+    lanes.
+
+.. currentmodule:: queues
+
+"""
+import collections
+import enum
+import queue
+import time
+from typing import Any, Dict, Optional, Union
+
+from .metrics import Histogram
+
+
+class QueuePolicy(str, enum.Enum):
+    """Behaviour of a bounded queue when an item is put while it is full."""
+
+    #: wait until a slot is available (standard queue behaviour)
+    BLOCK = "block"
+    #: discard the oldest queued item to make room for the new one
+    DROP_OLDEST = "drop-oldest"
+    #: discard the item that is being put
+    DROP_NEWEST = "drop-newest"
+
+
+class QueuePriority(str, enum.Enum):
+    """Lanes of a :py:class:`PriorityLaneQueue`, from highest to lowest
+    priority.
+    """
+
+    #: commands controlling the auxiliary itself (abort, stop...)
+    CONTROL = "control"
+    #: time-critical commands, e.g. cyclic keep-alive messages
+    REALTIME = "realtime"
+    #: all other commands
+    BULK = "bulk"
+
+
+class MonitoredQueue(queue.Queue):
+    """FIFO queue with a selectable overflow policy that keeps track of
+    the number of dropped items and of its high-water mark.
+    """
+
+    def __init__(self, maxsize: int = 0, policy: Union[str, QueuePolicy] = QueuePolicy.BLOCK) -> None:
+        """Initialize attributes.
+
+        :param maxsize: capacity of the queue, 0 or less means unbounded
+        :param policy: overflow policy applied once the capacity is reached
+
+        :raises ValueError: if the given policy doesn't exist
+        """
+        super().__init__(maxsize)
+        self.policy = QueuePolicy(policy)
+        self.dropped = 0
+        self.high_water_mark = 0
+
+    def _put(self, item: Any) -> None:
+        """Put an item and update the high-water mark.
+
+        .. note:: called with the queue mutex held
+
+        :param item: item to put in the queue
+        """
+        super()._put(item)
+        self._update_high_water_mark()
+
+    def _update_high_water_mark(self) -> None:
+        """Update the high-water mark with the current size.
+
+        .. note:: called with the queue mutex held
+        """
+        size = self._qsize()
+        if size > self.high_water_mark:
+            self.high_water_mark = size
+
+    def _drop_oldest(self) -> None:
+        """Discard the oldest item to make room for a new one.
+
+        .. note:: called with the queue mutex held
+        """
+        self._get()
+
+    def put(self, item: Any, block: bool = True, timeout: Optional[float] = None) -> None:
+        """Put an item into the queue according to the overflow policy.
+
+        With the :py:attr:`QueuePolicy.BLOCK` policy, this behaves exactly
+        like :py:meth:`queue.Queue.put`. With a dropping policy, this
+        never blocks.
+
+        :param item: item to put in the queue
+        :param block: wait for a free slot (blocking policy only)
+        :param timeout: maximum time to wait for a free slot (blocking
+            policy only)
+        """
+        if self.policy is QueuePolicy.BLOCK or self.maxsize <= 0:
+            return super().put(item, block, timeout)
+
+        with self.not_full:
+            if self._qsize() >= self.maxsize:
+                self.dropped += 1
+                if self.policy is QueuePolicy.DROP_NEWEST:
+                    return
+                # replace the oldest item, the number of unfinished tasks is unchanged
+                self._drop_oldest()
+            else:
+                self.unfinished_tasks += 1
+            self._put(item)
+            self.not_empty.notify()
+
+    def stats(self) -> Dict[str, Union[int, str]]:
+        """Get the current fill level and overflow counters.
+
+        :return: dictionary containing the current size, the capacity,
+            the overflow policy, the number of dropped items and the
+            high-water mark
+        """
+        with self.mutex:
+            return {
+                "size": self._qsize(),
+                "capacity": self.maxsize,
+                "policy": self.policy.value,
+                "dropped": self.dropped,
+                "high_water_mark": self.high_water_mark,
+            }
+
+
+class PriorityLaneQueue(MonitoredQueue):
+    """Queue split into one FIFO lane per :py:class:`QueuePriority`.
+
+    Items are always taken from the highest priority lane holding any,
+    so that e.g. an abort command doesn't wait behind a burst of bulk
+    commands. The capacity and the overflow policy apply to the total
+    number of items, the drop-oldest policy discards the oldest item of
+    the lowest priority lane.
+
+    The time each item spent in its lane is recorded per lane.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 0,
+        policy: Union[str, QueuePolicy] = QueuePolicy.BLOCK,
+        default_priority: Union[str, QueuePriority] = QueuePriority.BULK,
+    ) -> None:
+        """Initialize attributes.
+
+        :param maxsize: capacity of the queue, 0 or less means unbounded
+        :param policy: overflow policy applied once the capacity is reached
+        :param default_priority: lane of the items put without priority
+
+        :raises ValueError: if the given policy or priority doesn't exist
+        """
+        self.default_priority = QueuePriority(default_priority)
+        self.latencies = {lane: Histogram() for lane in QueuePriority}
+        super().__init__(maxsize, policy)
+
+    def _init(self, maxsize: int) -> None:
+        self.lanes = {lane: collections.deque() for lane in QueuePriority}
+
+    def _qsize(self) -> int:
+        return sum(len(lane) for lane in self.lanes.values())
+
+    def _put(self, entry: tuple) -> None:
+        self.lanes[entry[0]].append(entry)
+        self._update_high_water_mark()
+
+    def _get(self) -> Any:
+        for priority, lane in self.lanes.items():
+            if lane:
+                _, put_time, item = lane.popleft()
+                self.latencies[priority].observe(time.perf_counter() - put_time)
+                return item
+        raise IndexError("get from an empty lane queue")
+
+    def _drop_oldest(self) -> None:
+        for lane in reversed(self.lanes.values()):
+            if lane:
+                lane.popleft()
+                return
+
+    def put(
+        self,
+        item: Any,
+        block: bool = True,
+        timeout: Optional[float] = None,
+        priority: Optional[Union[str, QueuePriority]] = None,
+    ) -> None:
+        """Put an item into the lane of the given priority.
+
+        :param item: item to put in the queue
+        :param block: wait for a free slot (blocking policy only)
+        :param timeout: maximum time to wait for a free slot (blocking
+            policy only)
+        :param priority: lane to put the item in, defaults to the
+            queue's default priority
+
+        :raises ValueError: if the given priority doesn't exist
+        """
+        lane = self.default_priority if priority is None else QueuePriority(priority)
+        super().put((lane, time.perf_counter(), item), block, timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the current fill level, the overflow counters and the
+        statistics of each lane.
+
+        :return: the :py:meth:`MonitoredQueue.stats` dictionary with an
+            additional "lanes" entry containing the size of each lane
+            and the distribution of the time spent by its items in the
+            queue, in seconds
+        """
+        stats = super().stats()
+        with self.mutex:
+            stats["lanes"] = {
+                priority.value: {"size": len(lane), "latency": self.latencies[priority].snapshot()}
+                for priority, lane in self.lanes.items()
+            }
+        return stats
@@ -25,7 +25,7 @@ from __future__ import annotations
 import functools
 import logging
 import unittest
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Type, Union
 
 import lxml
 import lxml.etree
@@ -35,6 +35,7 @@ import pykiso.test_result.assert_step_report as step_report
 from .. import message
 from ..auxiliary import AuxiliaryInterface
 from ..logging_initializer import get_logging_options, initialize_logging
+from ..tracing import tracer
 from .test_message_handler import test_app_interaction
 
 if TYPE_CHECKING:
@@ -113,6 +114,44 @@ class BasicTest(unittest.TestCase):
         """Closure hook method to execute code after each test method."""
         pass
 
+    def run(self, result: Optional[unittest.TestResult] = None) -> Optional[unittest.TestResult]:
+        """Run the test, recording a span for each phase when tracing.
+
+        The fixtures and the test method are shadowed by traced wrappers
+        on the instance for the duration of the run.
+
+        :param result: result object collecting the test outcome
+
+        :return: the result object
+        """
+        if not tracer.enabled:
+            return super().run(result)
+        phases = ("setUp", self._testMethodName, "tearDown")
+        for phase in phases:
+            setattr(self, phase, self._traced_phase(phase, getattr(self, phase)))
+        try:
+            return super().run(result)
+        finally:
+            for phase in phases:
+                self.__dict__.pop(phase, None)
+
+    def _traced_phase(self, name: str, method: Callable) -> Callable:
+        """Wrap a test phase into a tracer span.
+
+        :param name: name of the span
+        :param method: bound fixture or test method
+
+        :return: wrapper keeping the attributes set by the unittest
+            decorators (e.g. skip)
+        """
+
+        @functools.wraps(method)
+        def traced(*args: Any, **kwargs: Any) -> Any:
+            with tracer.span(name, "test", test=self.id()):
+                return method(*args, **kwargs)
+
+        return traced
+
     @property
     def properties(self):
         return self._properties
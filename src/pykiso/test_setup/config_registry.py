@@ -22,7 +22,7 @@ from __future__ import annotations
 
 from collections import defaultdict
 from contextlib import contextmanager
-from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Tuple, Type
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple, Type
 
 from ..exceptions import PykisoError
 from .dynamic_loader import DynamicImportLinker
@@ -31,6 +31,9 @@ if TYPE_CHECKING:
     from pykiso import AuxiliaryInterface
     from pykiso.types import AuxiliaryAlias, AuxiliaryConfig, ConfigDict, ConnectorAlias, ConnectorConfig
 
+# auxiliary parameters forwarded to the proxy channel replacing its communication channel
+PROXY_CHANNEL_QUEUE_PARAMS = ("queue_size", "queue_policy")
+
 
 class ConfigRegistry:
     """Register auxiliaries with connectors to provide systemwide import
@@ -45,12 +48,15 @@ class ConfigRegistry:
     @staticmethod
     def _make_proxy_channel_config(
         aux_name: AuxiliaryConfig,
+        aux_config: Optional[Dict[str, Any]] = None,
     ) -> Tuple[ConnectorAlias, ConnectorConfig]:
         """Craft the configuration dictionary for a proxy communication
         channel to attach to the auxiliary instead of the 'physical' channel.
 
         :param aux_name: name of the auxiliary to which the proxy channel
             should be plugged.
+        :param aux_config: configuration of this auxiliary, its queue
+            settings are applied to the proxy channel's reception queue.
         :return: the resulting proxy channel name and its configuration as
             as a tuple.
         """
@@ -58,8 +64,9 @@ class ConfigRegistry:
 
         cchannel_class = CCProxy
         name = f"proxy_channel_{aux_name}"
+        queue_config = {key: value for key, value in (aux_config or {}).items() if key in PROXY_CHANNEL_QUEUE_PARAMS}
         config = {
-            "config": None,
+            "config": queue_config or None,
             "type": f"{cchannel_class.__module__}:{cchannel_class.__name__}",
         }
         return name, config
@@ -111,13 +118,41 @@ class ConfigRegistry:
             cchannel_to_auxiliaries[cchannel].append(auxiliary)
         return cchannel_to_auxiliaries
 
+    @staticmethod
+    def _check_process_auxiliaries(config: ConfigDict) -> None:
+        """Ensure that the connectors of auxiliaries running in a child
+        process are not shared with any other auxiliary.
+
+        :param config: dictionary containing yaml configuration content
+
+        :raises ValueError: if a connector of such an auxiliary is shared
+        """
+        connector_users = defaultdict(list)
+        for auxiliary, aux_details in config["auxiliaries"].items():
+            for connector in (aux_details.get("connectors") or dict()).values():
+                connector_users[connector].append(auxiliary)
+
+        for auxiliary, aux_details in config["auxiliaries"].items():
+            if not (aux_details.get("config") or dict()).get("process"):
+                continue
+            for connector in (aux_details.get("connectors") or dict()).values():
+                if len(connector_users[connector]) > 1:
+                    raise ValueError(
+                        f"Auxiliary {auxiliary} cannot run in a child process: "
+                        f"its connector {connector} is shared with {', '.join(connector_users[connector])}"
+                    )
+
     @classmethod
-    def register_aux_con(cls, config: ConfigDict) -> None:
+    def register_aux_con(cls, config: ConfigDict, parallel_start: bool = False) -> None:
         """Create import hooks. Register auxiliaries and connectors.
 
         :param config: dictionary containing yaml configuration content
+        :param parallel_start: if True, create and start all auxiliaries
+            immediately, independent auxiliaries being started
+            concurrently. Otherwise, auxiliaries are created on import.
         """
         # 1. Detect required proxy setups
+        cls._check_process_auxiliaries(config)
         cchannel_to_auxiliaries = cls._link_cchannel_to_auxiliaries(config)
         proxies = []
 
@@ -137,14 +172,17 @@ class ConfigRegistry:
                 if auto_start:
                     break
 
-            # create a proxy auxiliary config for this shared channel
-            proxy_aux_name, proxy_aux_cfg = cls._make_proxy_aux_config(channel_name, auxiliaries, auto_start)
+            # create a proxy auxiliary config for this shared channel, the proxy
+            # is started eagerly as lazy auxiliaries rely on it once used
+            proxy_aux_name, proxy_aux_cfg = cls._make_proxy_aux_config(channel_name, auxiliaries, bool(auto_start))
             config["auxiliaries"][proxy_aux_name] = proxy_aux_cfg
             proxies.append(proxy_aux_name)
 
             # create a proxy channel config for each of the auxiliaries sharing the channel
             for aux_name in auxiliaries:
-                cc_proxy_name, cc_proxy_cfg = cls._make_proxy_channel_config(aux_name)
+                cc_proxy_name, cc_proxy_cfg = cls._make_proxy_channel_config(
+                    aux_name, config["auxiliaries"][aux_name].get("config")
+                )
                 config["auxiliaries"][aux_name]["connectors"]["com"] = cc_proxy_name
                 config["connectors"][cc_proxy_name] = cc_proxy_cfg
 
@@ -167,13 +205,15 @@ class ConfigRegistry:
             )
 
         # 5. Finally, import required ProxyAuxiliary instances so that user doesn't have to
-        for proxy_aux in proxies:
-            try:
+        try:
+            if parallel_start:
+                cls._linker.start_auxiliaries()
+            for proxy_aux in proxies:
                 cls.get_aux_by_alias(proxy_aux)
-            except PykisoError:
-                # ensure that the created ProxyAuxiliary is stopped if its creation fails
-                cls.delete_aux_con()
-                raise
+        except PykisoError:
+            # ensure that the created auxiliaries are stopped if a creation fails
+            cls.delete_aux_con()
+            raise
 
     @classmethod
     def delete_aux_con(cls) -> None:
@@ -185,17 +225,19 @@ class ConfigRegistry:
 
     @classmethod
     @contextmanager
-    def provide_auxiliaries(cls, config: ConfigDict) -> Iterator[None]:
+    def provide_auxiliaries(cls, config: ConfigDict, parallel_start: bool = False) -> Iterator[None]:
         """Context manager that registers importable auxiliary
         aliases and cleans them up at exit.
 
         :param config: config dictionary from the YAML configuration
             file.
+        :param parallel_start: start all auxiliaries concurrently at
+            registration instead of on import.
 
         :yield: None
         """
         try:
-            cls.register_aux_con(config)
+            cls.register_aux_con(config, parallel_start)
             yield
         finally:
             cls.delete_aux_con()
@@ -217,8 +259,10 @@ class ConfigRegistry:
 
         :return: dictionary with alias as keys and instances as values
         """
+        from ..interfaces.process_auxiliary import is_auxiliary_of_type
+
         all_auxes = cls._linker._aux_cache.instances
-        return {alias: inst for alias, inst in all_auxes.items() if isinstance(inst, aux_type)}
+        return {alias: inst for alias, inst in all_auxes.items() if is_auxiliary_of_type(inst, aux_type)}
 
     @classmethod
     def get_aux_by_alias(cls, alias: AuxiliaryAlias) -> AuxiliaryInterface:
@@ -27,14 +27,18 @@ import importlib.util
 import logging
 import pathlib
 import sys
+import threading
+import time
 import types
-from typing import TYPE_CHECKING, Type, Union
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Dict, List, Optional, Type, Union
 
-from pykiso.exceptions import ConnectorRequiredError
+from pykiso.exceptions import AuxiliaryStartupError, ConnectorRequiredError
 
 if TYPE_CHECKING:
     from ..auxiliary import AuxiliaryInterface
     from ..connector import Connector
+    from ..interfaces.process_auxiliary import ProcessAuxiliary
 
 PACKAGE = __package__.split(".")[0]
 
@@ -42,6 +46,13 @@ __all__ = ["DynamicImportLinker"]
 
 log = logging.getLogger(__name__)
 
+#: global time budget in seconds for stopping all auxiliaries, unless an
+#: auxiliary configures its own ``shutdown_timeout``
+AUX_SHUTDOWN_TIMEOUT = 10
+#: time in seconds to wait for the channel of an overdue auxiliary to be
+#: released and for the auxiliary to stop once its channel was closed
+FORCED_CLOSE_GRACE_PERIOD = 1
+
 
 class DynamicFinder(importlib.abc.MetaPathFinder):
     """A MetaPathFinder that delegates everything to the loader."""
@@ -169,6 +180,8 @@ class ModuleCache:
         self.configs = dict()
         self.modules = dict()
         self.instances = dict()
+        self._lock = threading.Lock()
+        self._instance_locks: Dict[str, threading.RLock] = dict()
 
     def provide(self, name: str, module: str, **config_params):
         """Provide an aliased instance.
@@ -204,19 +217,25 @@ class ModuleCache:
         log.internal_debug(f"loaded {_class} as {name} from {location}")
         return cls
 
+    def _get_instance_lock(self, name: str) -> threading.RLock:
+        """Get the lock serializing the creation of the instance <name>."""
+        with self._lock:
+            return self._instance_locks.setdefault(name, threading.RLock())
+
     def get_instance(self, name: str) -> Union[AuxiliaryInterface, Connector]:
         """Get an instance of alias <name> (create and configure one of not existed)."""
-        if name in self.instances:
-            log.internal_debug(f"instance for {name} found ({self.instances[name]})")
-            return self.instances[name]
-        if name not in self.modules:
-            log.internal_debug(f"module for {name} not found, loading...")
-            self.modules[name] = self._import(name)
-        log.internal_debug(f"instantiating {name}: {self.modules[name]}({self.configs[name]})")
-        inst = self.modules[name](name=name, **self.configs[name])
-        self.instances[name] = inst
-        log.internal_debug(f"instantiated {name}")
-        return inst
+        with self._get_instance_lock(name):
+            if name in self.instances:
+                log.internal_debug(f"instance for {name} found ({self.instances[name]})")
+                return self.instances[name]
+            if name not in self.modules:
+                log.internal_debug(f"module for {name} not found, loading...")
+                self.modules[name] = self._import(name)
+            log.internal_debug(f"instantiating {name}: {self.modules[name]}({self.configs[name]})")
+            inst = self.modules[name](name=name, **self.configs[name])
+            self.instances[name] = inst
+            log.internal_debug(f"instantiated {name}")
+            return inst
 
     def delete_all_instances(self) -> None:
         """Call shutdown method if it exists"""
@@ -240,47 +259,191 @@ class AuxiliaryCache(ModuleCache):
         super().__init__()
         self.con_cache = con_cache
         self.connectors = dict()
-
-    def provide(self, name: str, module: str, connectors=None, **config_params):
+        self.processes = dict()
+        self.shutdown_timeouts = dict()
+
+    def provide(
+        self,
+        name: str,
+        module: str,
+        connectors=None,
+        process: bool = False,
+        shutdown_timeout: Optional[float] = None,
+        **config_params,
+    ):
         """Provide an aliased instance.
 
         :param name: the instance alias
         :param module: either 'python-file-path:Class' or 'module:Class' of the class we want
         :param connectors: list of connector aliases
             to provide
+        :param process: if True, the auxiliary and its connectors are
+            created in a child process
+        :param shutdown_timeout: time budget in seconds for stopping the
+            auxiliary, replacing the global one of the session (e.g. for
+            a flasher finishing its job)
         """
         self.connectors[name] = connectors
+        self.processes[name] = process
+        if shutdown_timeout is not None:
+            self.shutdown_timeouts[name] = shutdown_timeout
         super().provide(name, module, **config_params)
 
     def get_instance(self, name: str) -> AuxiliaryInterface:
         """Get an instance of alias <name> (create and configure one of not existed)."""
-        for cn, con in self.connectors.get(name, dict()).items():
-            # add connector-instances as configs
-            self.configs[name][cn] = self.con_cache.get_instance(con)
-        inst = super().get_instance(name)
-
-        if getattr(inst, "connector_required", True) and not getattr(inst, "channel", False):
-            self.instances.pop(name)
-            raise ConnectorRequiredError(name)
-        # if auto start is needed start the auxiliary otherwise store
-        # the created instance
-        auto_start = getattr(inst, "auto_start", True)
-
-        if not inst.is_instance and auto_start:
-            inst.start()
-            inst.create_instance()
-            # Can't used the CChannel typing here due to cyclic import
-            if hasattr(inst, "channel") and inst.channel is not None and inst.channel.auto_open:
-                inst.channel.open()
-            log.internal_debug(f"called create_instance on {name}")
+        from ..auxiliary import AUTO_START_LAZY
+
+        with self._get_instance_lock(name):
+            if self.processes.get(name):
+                return self._get_process_instance(name)
+            for cn, con in self.connectors.get(name, dict()).items():
+                # add connector-instances as configs
+                self.configs[name][cn] = self.con_cache.get_instance(con)
+            inst = super().get_instance(name)
+
+            if getattr(inst, "connector_required", True) and not getattr(inst, "channel", False):
+                self.instances.pop(name)
+                raise ConnectorRequiredError(name)
+            # if auto start is needed start the auxiliary otherwise store
+            # the created instance, a lazy auxiliary starts on first use
+            auto_start = getattr(inst, "auto_start", True)
+
+            if not inst.is_instance and auto_start and auto_start != AUTO_START_LAZY:
+                inst.start()
+                inst.create_instance()
+                # Can't used the CChannel typing here due to cyclic import
+                if hasattr(inst, "channel") and inst.channel is not None and inst.channel.auto_open:
+                    inst.channel.open()
+                log.internal_debug(f"called create_instance on {name}")
+            self.instances[name] = inst
+            return inst
+
+    def _get_process_instance(self, name: str) -> ProcessAuxiliary:
+        """Get the handle to the auxiliary <name> running in a child
+        process (create the process if not existed).
+        """
+        from ..interfaces.process_auxiliary import ProcessAuxiliary
+
+        if name in self.instances:
+            return self.instances[name]
+        aux_connectors = self.connectors.get(name) or dict()
+        connectors = {
+            con: (self.con_cache.locations[con], self.con_cache.configs[con]) for con in aux_connectors.values()
+        }
+        log.internal_debug(f"instantiating {name} in a child process")
+        inst = ProcessAuxiliary(name, self.locations[name], self.configs[name], aux_connectors, connectors)
         self.instances[name] = inst
         return inst
 
-    def _stop_auxiliaries(self):
-        """Elegant workaround to shut down all the auxiliaries."""
-        for alias, aux in self.instances.items():
-            log.internal_debug(f"issuing stop for auxiliary '{aux}'")
-            aux.stop()
+    def _get_startup_layers(self) -> List[List[str]]:
+        """Sort the provided auxiliaries in layers that can be started
+        concurrently.
+
+        An auxiliary depends on the auxiliaries of its ``aux_list``
+        (proxy auxiliaries) and on the previously provided auxiliaries
+        sharing one of its connectors.
+
+        :raises ValueError: if the auxiliaries depend on each other
+        :return: auxiliary aliases, grouped by layer in start order
+        """
+        dependencies = {name: set() for name in self.locations}
+        connector_users = dict()
+        for name, deps in dependencies.items():
+            for dep in self.configs[name].get("aux_list") or ():
+                if dep in dependencies:
+                    deps.add(dep)
+            for con in (self.connectors.get(name) or dict()).values():
+                if con in connector_users:
+                    deps.add(connector_users[con])
+                connector_users[con] = name
+
+        layers = []
+        while dependencies:
+            layer = [name for name, deps in dependencies.items() if not deps]
+            if not layer:
+                raise ValueError(f"Circular dependency between auxiliaries {', '.join(dependencies)}")
+            for name in layer:
+                del dependencies[name]
+            for deps in dependencies.values():
+                deps.difference_update(layer)
+            layers.append(layer)
+        return layers
+
+    def start_all(self, max_workers: Optional[int] = None) -> None:
+        """Create and start all provided auxiliaries, independent
+        auxiliaries being started concurrently.
+
+        If any auxiliary fails, the auxiliaries created so far are
+        stopped again and the failed ones are removed from the cache
+        before raising.
+
+        :param max_workers: maximum number of auxiliaries started at
+            the same time, defaults to the thread pool default
+
+        :raises AuxiliaryStartupError: if at least one auxiliary failed
+        """
+        created = []
+        for layer in self._get_startup_layers():
+            errors = dict()
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="aux_startup") as executor:
+                futures = {executor.submit(self.get_instance, name): name for name in layer}
+                for future in as_completed(futures):
+                    name = futures[future]
+                    try:
+                        future.result()
+                    except Exception as e:
+                        log.error(f"auxiliary {name} failed to start: {e!r}")
+                        errors[name] = e
+            created.extend(name for name in layer if name in self.instances)
+            if errors:
+                self._stop_instances(reversed(created))
+                # the failed auxiliaries were cached before being started
+                for name in errors:
+                    self.instances.pop(name, None)
+                raise AuxiliaryStartupError(errors)
+
+    def _stop_instances(self, names: List[str]) -> None:
+        """Stop the given auxiliaries, ignoring any error.
+
+        :param names: aliases of the auxiliaries to stop, in stop order
+        """
+        for name in names:
+            try:
+                self.instances[name].stop()
+            except Exception:
+                log.exception(f"failed to stop auxiliary {name}")
+
+    def _stop_auxiliaries(self, timeout: float = AUX_SHUTDOWN_TIMEOUT) -> List[str]:
+        """Shut down all the auxiliaries concurrently within a global
+        deadline.
+
+        Auxiliaries are stopped before the proxy auxiliaries they are
+        attached to. The channel of any auxiliary that is still stopping
+        once its deadline is reached is forcibly closed.
+
+        The auxiliaries configured with a ``shutdown_timeout`` get their
+        own budget instead of the global one, and proxy auxiliaries
+        always get at least the budget of the auxiliaries stopped
+        before them.
+
+        :param timeout: global time budget in seconds
+        :return: aliases of the auxiliaries that exceeded their deadline
+        """
+        start = time.monotonic()
+        budgets = {alias: self.shutdown_timeouts.get(alias, timeout) for alias in self.instances}
+        proxies = [alias for alias in self.instances if self.configs.get(alias, dict()).get("aux_list") is not None]
+        others = [alias for alias in self.instances if alias not in proxies]
+        latest = max((budgets[alias] for alias in others), default=timeout)
+        for alias in proxies:
+            budgets[alias] = max(budgets[alias], latest)
+        overdue = []
+        for aliases in (others, proxies):
+            overdue.extend(self._stop_concurrently(aliases, start, budgets))
+        for alias, inst in self.instances.items():
+            if self.processes.get(alias):
+                inst.close()
+
+        for alias in self.instances:
             aux_mod = f"{AuxLinkLoader._COMMON_PREFIX}.{alias}"
             # ensure that the module was created
             if sys.modules.get(aux_mod) is not None:
@@ -291,6 +454,71 @@ class AuxiliaryCache(ModuleCache):
         # path finder -> loader -> module
         if AuxLinkLoader._COMMON_PREFIX in sys.modules:
             sys.modules.pop(AuxLinkLoader._COMMON_PREFIX)
+        return overdue
+
+    def _stop_concurrently(self, aliases: List[str], start: float, budgets: Dict[str, float]) -> List[str]:
+        """Stop the given auxiliaries, each one in its own thread, and
+        escalate to a forced channel close for those exceeding their
+        deadline.
+
+        :param aliases: aliases of the auxiliaries to stop
+        :param start: time (as returned by :py:func:`time.monotonic`)
+            at which the shutdown started
+        :param budgets: time budget in seconds of each auxiliary,
+            counted from the start of the shutdown
+        :return: aliases of the auxiliaries that exceeded their deadline
+        """
+        threads = dict()
+        for alias in aliases:
+            log.internal_debug(f"issuing stop for auxiliary '{self.instances[alias]}'")
+            thread = threading.Thread(
+                target=self._stop_instances, args=([alias],), name=f"{alias}_shutdown", daemon=True
+            )
+            thread.start()
+            threads[alias] = thread
+
+        overdue = []
+        for alias, thread in threads.items():
+            thread.join(max(start + budgets[alias] - time.monotonic(), 0))
+            if thread.is_alive():
+                overdue.append(alias)
+
+        for alias in overdue:
+            log.error(
+                f"auxiliary {alias} exceeded the shutdown budget of {budgets[alias]}s, forcing its channel to close"
+            )
+            self._force_close_channel(alias)
+        for alias in overdue:
+            threads[alias].join(FORCED_CLOSE_GRACE_PERIOD)
+            if threads[alias].is_alive():
+                log.error(f"auxiliary {alias} could not be stopped, thread {threads[alias].name} is left running")
+        return overdue
+
+    def _force_close_channel(self, alias: str) -> None:
+        """Close the channel of an auxiliary whose stop thread is stuck
+        elsewhere than in the channel, e.g. waiting for its own threads.
+
+        The channel is only closed once released by the stop thread, as
+        closing it concurrently to a transfer or to its own close is
+        unsafe.
+
+        :param alias: alias of the auxiliary
+        """
+        if self.processes.get(alias):
+            # the channel lives in the child process, terminate it instead
+            self.instances[alias].process.kill()
+            return
+        channel = getattr(self.instances[alias], "channel", None)
+        if channel is None:
+            return
+        try:
+            close_when_idle = getattr(channel, "close_when_idle", None)
+            if close_when_idle is None:
+                channel.close()
+            elif not close_when_idle(FORCED_CLOSE_GRACE_PERIOD):
+                log.error(f"channel of auxiliary {alias} is still in use, it is left open")
+        except Exception:
+            log.exception(f"failed to close the channel of auxiliary {alias}")
 
 
 class DynamicImportLinker:
@@ -333,10 +561,23 @@ class DynamicImportLinker:
         self._aux_cache.provide(name, module, connectors=aux_cons, **config_params)
         self._aux_loader.provide(name)
 
-    def uninstall(self):
-        """Deregister the import hooks, close all running threads, delete all instances."""
+    def start_auxiliaries(self, max_workers: Optional[int] = None) -> None:
+        """Create and start all provided auxiliaries concurrently.
+
+        :param max_workers: maximum number of auxiliaries started at
+            the same time
+        """
+        log.internal_debug("starting all auxiliaries concurrently")
+        self._aux_cache.start_all(max_workers)
+
+    def uninstall(self, timeout: float = AUX_SHUTDOWN_TIMEOUT):
+        """Deregister the import hooks, close all running threads, delete all instances.
+
+        :param timeout: global time budget in seconds for stopping all
+            auxiliaries
+        """
         log.internal_debug("closing and uninstalling all dynamic modules and loaders")
-        self._stop_auxiliaries()
+        self._stop_auxiliaries(timeout)
         self._con_cache.delete_all_instances()
         del self._con_cache
         del self._aux_cache
@@ -344,6 +585,9 @@ class DynamicImportLinker:
         for finder in self._finders:
             sys.meta_path.remove(finder)
 
-    def _stop_auxiliaries(self):
-        """Elegant workaround to shut down all the auxiliaries."""
-        self._aux_cache._stop_auxiliaries()
+    def _stop_auxiliaries(self, timeout: float = AUX_SHUTDOWN_TIMEOUT):
+        """Elegant workaround to shut down all the auxiliaries.
+
+        :param timeout: global time budget in seconds
+        """
+        self._aux_cache._stop_auxiliaries(timeout)
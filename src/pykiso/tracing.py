@@ -0,0 +1,180 @@
+##########################################################################
+# Copyright (c) 2010-2022 Robert Bosch GmbH
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# http://www.eclipse.org/legal/epl-2.0.
+#
+# SPDX-License-Identifier: EPL-2.0
+##########################################################################
+
+"""
+Timeline Tracing
+****************
+
+:module: tracing
+
+:synopsis: opt-in recording of timed spans on each thread, exported in
+    the Chrome trace event format.
+
+When enabled, auxiliaries, channels and test cases record a span for each
+command, reception, transmission and test fixture phase. The resulting
+file can be opened with ``chrome://tracing`` or https://ui.perfetto.dev
+to see where the time went between the test, the queues, the proxy and
+the bus.
+
+.. code:: python
+
+    from pykiso.tracing import tracer
+
+    tracer.enable()
+    with tracer.span("my_step", category="test"):
+        ...
+    tracer.dump_json("timeline.json")
+
+.. currentmodule:: tracing
+
+"""
+from __future__ import annotations
+
+import collections
+import contextlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, ContextManager, Deque, Dict, List
+
+from .types import PathType
+
+log = logging.getLogger(__name__)
+
+_NO_SPAN = contextlib.nullcontext()
+
+#: number of spans kept in memory, the oldest ones are discarded first
+TRACE_MAX_EVENTS = 1_000_000
+
+
+class _Span:
+    """Context manager recording a complete event on exit."""
+
+    __slots__ = ("tracer", "name", "category", "args", "start")
+
+    def __init__(self, tracer: Tracer, name: str, category: str, args: Dict[str, Any]) -> None:
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+        self.start = 0.0
+
+    def __enter__(self) -> _Span:
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.tracer._record(self.name, self.category, self.start, time.perf_counter(), self.args)
+
+
+class Tracer:
+    """Collector of the spans recorded by all threads.
+
+    Only the last ``max_events`` spans are kept so that tracing a long
+    test session does not grow the memory without bound, the number of
+    discarded spans is available in :attr:`dropped`.
+    """
+
+    def __init__(self, max_events: int = TRACE_MAX_EVENTS) -> None:
+        """Initialize attributes.
+
+        :param max_events: maximum number of spans kept in memory
+        """
+        self.enabled = False
+        self.dropped = 0
+        self._lock = threading.Lock()
+        self._events: Deque[Dict[str, Any]] = collections.deque(maxlen=max_events)
+        self._thread_names: Dict[int, str] = {}
+        self._origin = time.perf_counter()
+
+    def enable(self) -> None:
+        """Clear the recorded spans and start recording."""
+        with self._lock:
+            self._events.clear()
+            self._thread_names.clear()
+            self.dropped = 0
+            self._origin = time.perf_counter()
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Stop recording, already recorded spans are kept."""
+        self.enabled = False
+
+    def span(self, name: str, category: str = "pykiso", **args: Any) -> ContextManager:
+        """Create a context manager timing the enclosed block.
+
+        :param name: name of the span
+        :param category: category of the span, used for filtering in
+            the trace viewer
+        :param args: additional information attached to the span, the
+            values are converted to strings on export
+
+        :return: the span, or a no-op context manager if tracing is
+            disabled
+        """
+        if not self.enabled:
+            return _NO_SPAN
+        return _Span(self, name, category, args)
+
+    def _record(self, name: str, category: str, start: float, end: float, args: Dict[str, Any]) -> None:
+        """Store a complete event for the current thread.
+
+        :param name: name of the span
+        :param category: category of the span
+        :param start: perf_counter value at the beginning of the span
+        :param end: perf_counter value at the end of the span
+        :param args: additional information attached to the span
+        """
+        tid = threading.get_ident()
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": (start - self._origin) * 1e6,
+            "dur": (end - start) * 1e6,
+            "pid": os.getpid(),
+            "tid": tid,
+        }
+        if args:
+            event["args"] = {key: str(value) for key, value in args.items()}
+        with self._lock:
+            if tid not in self._thread_names:
+                self._thread_names[tid] = threading.current_thread().name
+            if len(self._events) == self._events.maxlen:
+                self.dropped += 1
+            self._events.append(event)
+
+    def events(self) -> List[Dict[str, Any]]:
+        """Get the recorded spans and the thread name metadata.
+
+        :return: trace events in the Chrome trace event format
+        """
+        pid = os.getpid()
+        with self._lock:
+            metadata = [
+                {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+                for tid, name in self._thread_names.items()
+            ]
+            return metadata + list(self._events)
+
+    def dump_json(self, path: PathType) -> None:
+        """Write the recorded spans to a Chrome trace file.
+
+        :param path: path of the JSON file to write
+        """
+        if self.dropped:
+            log.warning(f"Trace timeline truncated, {self.dropped} oldest spans were discarded")
+        with open(path, "w") as trace_file:
+            json.dump({"traceEvents": self.events(), "displayTimeUnit": "ms"}, trace_file)
+
+
+#: process-wide tracer, disabled by default
+tracer = Tracer()
@@ -31,6 +31,8 @@ SOURCE_DIR = ROOT_DIR / "src"
 DOCS_DIR = ROOT_DIR / "docs"
 DOCS_BUILD_DIR = DOCS_DIR / "_build"
 DOCS_INDEX = DOCS_BUILD_DIR / "index.html"
+BENCH_DIR = ROOT_DIR / "benchmarks"
+BENCH_REPORT = ROOT_DIR / "reports" / "bench_connectors.json"
 PYTHON_DIRS = [str(d) for d in [SOURCE_DIR, TEST_DIR]]
 
 COPYRIGHT = """\
@@ -97,6 +99,14 @@ def test(c):
     c.run("pytest")
 
 
+@task
+def bench(c, output=str(BENCH_REPORT)):
+    """
+    Run the connector benchmarks and write their results as JSON
+    """
+    c.run(f"python {BENCH_DIR / 'bench_connectors.py'} --output {output}")
+
+
 @task
 def docs(c):
     """
@@ -0,0 +1,157 @@
+##########################################################################
+# Copyright (c) 2010-2022 Robert Bosch GmbH
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# http://www.eclipse.org/legal/epl-2.0.
+#
+# SPDX-License-Identifier: EPL-2.0
+##########################################################################
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from pykiso.connector import AsyncCChannel
+from pykiso.exceptions import AuxiliaryCreationError, AuxiliaryNotStarted
+from pykiso.interfaces.async_auxiliary import AsyncAuxiliaryInterface, SharedEventLoop
+
+
+class AsyncLoopback(AsyncCChannel):
+    async def _cc_open(self):
+        self.buffer = asyncio.Queue()
+
+    async def _cc_close(self):
+        self.buffer = None
+
+    async def _cc_send(self, msg, **kwargs):
+        await self.buffer.put(msg)
+
+    async def _cc_receive(self, timeout, **kwargs):
+        try:
+            return {"msg": await asyncio.wait_for(self.buffer.get(), timeout)}
+        except asyncio.TimeoutError:
+            return {"msg": None}
+
+
+class EchoAux(AsyncAuxiliaryInterface):
+    def __init__(self, com, created=True, **kwargs):
+        super().__init__(**kwargs)
+        self.channel = com
+        self.created = created
+
+    async def _create_auxiliary_instance(self):
+        await self.channel.open_async()
+        return self.created
+
+    async def _delete_auxiliary_instance(self):
+        await self.channel.close_async()
+        return True
+
+    async def _run_command(self, cmd_message, cmd_data):
+        await self.channel.cc_send(msg=cmd_data)
+
+    async def _receive_message(self, timeout_in_s):
+        response = await self.channel.cc_receive(timeout=timeout_in_s)
+        if response["msg"] is not None:
+            await self.queue_out.put(response["msg"])
+
+
+@pytest.fixture
+def echo_aux():
+    aux = EchoAux(com=AsyncLoopback(name="loopback"), name="echo")
+    yield aux
+    aux.delete_instance()
+
+
+def test_sync_facade(echo_aux):
+    echo_aux.create_instance()
+
+    assert echo_aux.is_instance
+    assert echo_aux.run_command("send", b"\x01\x02", timeout_in_s=1) == b"\x01\x02"
+    assert echo_aux.receive(blocking=False) is None
+
+    assert echo_aux.delete_instance()
+    assert not SharedEventLoop.is_running()
+
+
+def test_awaitable_api_from_event_loop(echo_aux):
+    echo_aux.create_instance()
+
+    async def exchange():
+        # the blocking facade must not be usable from the event loop itself
+        with pytest.raises(RuntimeError):
+            echo_aux.run_command("send", b"\x00")
+        return await echo_aux.run_command_async("send", b"\x03", timeout_in_s=1)
+
+    future = asyncio.run_coroutine_threadsafe(exchange(), echo_aux._loop)
+
+    assert future.result(timeout=2) == b"\x03"
+
+
+def test_many_auxiliaries_share_one_thread():
+    thread_count = threading.active_count()
+    auxes = [EchoAux(com=AsyncLoopback(), name=f"echo_{idx}") for idx in range(50)]
+
+    for aux in auxes:
+        aux.create_instance()
+
+    assert threading.active_count() == thread_count + 1
+    assert all(aux.run_command("send", idx, timeout_in_s=1) == idx for idx, aux in enumerate(auxes))
+
+    for aux in auxes:
+        aux.delete_instance()
+
+    assert threading.active_count() == thread_count
+
+
+def test_creation_failure():
+    aux = EchoAux(com=AsyncLoopback(), created=False, name="failing")
+
+    with pytest.raises(AuxiliaryCreationError):
+        aux.create_instance()
+
+    assert not SharedEventLoop.is_running()
+
+
+def test_run_command_not_started(echo_aux):
+    with pytest.raises(AuxiliaryNotStarted):
+        echo_aux.run_command("send", b"\x01")
+
+
+def test_run_command_timeout(echo_aux):
+    echo_aux.rx_task_on = False
+    echo_aux.create_instance()
+
+    assert echo_aux.run_command("send", b"\x01", timeout_in_s=0.1, timeout_result="timeout") == "timeout"
+
+
+def test_async_channel_sync_open_close():
+    channel = AsyncLoopback()
+
+    channel.open()
+    assert isinstance(channel.buffer, asyncio.Queue)
+    channel.close()
+
+    assert channel.buffer is None
+    assert not SharedEventLoop.is_running()
+
+
+def test_reception_failures_back_off(mocker, caplog):
+    aux = EchoAux(com=AsyncLoopback(), name="failing_rx")
+    calls = []
+
+    async def broken_receive(timeout_in_s):
+        calls.append(timeout_in_s)
+        raise ConnectionError("link down")
+
+    mocker.patch.object(aux, "_receive_message", side_effect=broken_receive)
+    mocker.patch("pykiso.interfaces.async_auxiliary.RECEPTION_RETRY_DELAY", 0.02)
+    aux.create_instance()
+    time.sleep(0.3)
+    aux.delete_instance()
+
+    # 0.02 + 0.04 + 0.08 + 0.16 seconds of backoff at most
+    assert 2 <= len(calls) <= 5
+    assert caplog.text.count("encountered error while receiving message") == 1
@@ -94,6 +94,14 @@ def test_suspend_running_aux(mock_aux):
     mock_aux.delete_instance.assert_called_once()
 
 
+def test_suspend_running_aux_warm(mock_aux):
+    mock_aux.is_instance = True
+    mock_aux.warm_suspend = True
+    mock_aux.suspend()
+    mock_aux.delete_instance.assert_not_called()
+    assert mock_aux.is_suspended
+
+
 @pytest.mark.parametrize(
     "cmd, data, blocking, timeout",
     [
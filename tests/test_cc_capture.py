@@ -0,0 +1,91 @@
+##########################################################################
+# Copyright (c) 2010-2022 Robert Bosch GmbH
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# http://www.eclipse.org/legal/epl-2.0.
+#
+# SPDX-License-Identifier: EPL-2.0
+##########################################################################
+
+import logging
+
+import pytest
+
+from pykiso.lib.connectors.cc_capture import CCCapture, Direction, read_capture
+from pykiso.lib.connectors.cc_raw_loopback import CCLoopback
+from pykiso.message import Message, MessageCommandType, MessageType
+
+
+def test_capture_roundtrip(tmp_path, cchannel_inst):
+    capture_file = tmp_path / "traffic.pkcap"
+    message = Message(MessageType.COMMAND, MessageCommandType.PING)
+    cchannel_inst._cc_receive.side_effect = [
+        {"msg": b"\x01\x02", "remote_id": 0x123},
+        {"msg": None},
+        {"msg": "text"},
+    ]
+
+    with CCCapture(capture_file, channel=cchannel_inst, name="capture") as capture:
+        capture.cc_send(message)
+        capture.cc_send(b"\x03", remote_id=0x456)
+        response = capture.cc_receive(timeout=0.5)
+        capture.cc_receive()
+        capture.cc_receive()
+
+    assert response["msg"] == b"\x01\x02"
+    cchannel_inst._cc_open.assert_called_once()
+    cchannel_inst._cc_close.assert_called_once()
+    cchannel_inst._cc_send.assert_any_call(msg=b"\x03", remote_id=0x456)
+    cchannel_inst._cc_receive.assert_any_call(timeout=0.5)
+
+    records = list(read_capture(capture_file))
+    assert [(r.direction, r.remote_id) for r in records] == [
+        (Direction.TX, None),
+        (Direction.TX, 0x456),
+        (Direction.RX, 0x123),
+        (Direction.RX, None),
+    ]
+    assert records[0].msg.serialize() == message.serialize()
+    assert [r.msg for r in records[1:]] == [b"\x03", b"\x01\x02", "text"]
+    assert all(0 <= a.timestamp <= b.timestamp for a, b in zip(records, records[1:]))
+
+
+def test_capture_receive_many_and_unsupported_type(mocker, tmp_path, cchannel_inst, caplog):
+    capture_file = tmp_path / "traffic.pkcap"
+    cchannel_inst._cc_receive.side_effect = [{"msg": b"\x01"}, {"msg": {"exit": 0}}, {"msg": None}]
+    mocker.patch.object(cchannel_inst, "fileno", return_value=3)
+    mocker.patch.object(cchannel_inst, "wait_readable", return_value=True)
+
+    with caplog.at_level(logging.INTERNAL_WARNING):
+        with CCCapture(capture_file, channel=cchannel_inst, name="capture") as capture:
+            responses = capture.cc_receive_many(max_count=10)
+
+    assert [response["msg"] for response in responses] == [b"\x01", {"exit": 0}]
+    assert [record.msg for record in read_capture(capture_file)] == [b"\x01"]
+    assert "dict messages can't be captured by capture" in caplog.text
+
+
+def test_capture_channel_type(tmp_path):
+    capture = CCCapture(
+        tmp_path / "traffic.pkcap", channel_type="pykiso.lib.connectors.cc_raw_loopback:CCLoopback", name="capture"
+    )
+
+    assert isinstance(capture.channel, CCLoopback)
+    # attributes specific to the wrapped channel are forwarded
+    assert capture.lock is capture.channel.lock
+    with pytest.raises(AttributeError):
+        capture.unknown
+
+
+def test_capture_without_channel(tmp_path):
+    with pytest.raises(ValueError):
+        CCCapture(tmp_path / "traffic.pkcap")
+
+
+@pytest.mark.parametrize("content", [b"NOTCAP\x01", b"PKCAP\x01\x01\x00"])
+def test_read_capture_invalid(tmp_path, content):
+    capture_file = tmp_path / "invalid.pkcap"
+    capture_file.write_bytes(content)
+
+    with pytest.raises(ValueError):
+        list(read_capture(capture_file))
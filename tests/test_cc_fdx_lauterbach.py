@@ -540,6 +540,37 @@ def test_receive():
     assert response["msg"].serialize() == msg_received
 
 
+def test_receive_into():
+    """Test receive message into a buffer using t32 api"""
+
+    lauterbach_inst = CCFdxLauterbach(
+        "PATH/TO/T32_EXE.exe",
+        "C:/PATH_OF_T32_CONFIG.t32",
+        "C:/PATH_OF_fdx.cmm",
+        "C:/PATH_OF_reset.cmm",
+        "C:/PATH_OF_fdx_clear.cmm",
+        "C:/PATH_OF_inTest_reset.cmm",
+        "C:/T32/demo/api/capi/dll/t32api.dll",
+        "20000",
+        "localhost",
+        "1024",
+        1,
+    )
+
+    msg_received = Message().serialize()
+    mock_t32_api = Mock_t32_api()
+    mock_t32_api.t32_Fdx_ReceivePoll_msg = msg_received
+    lauterbach_inst.t32_api = mock_t32_api
+    buffer = bytearray(64)
+
+    size = lauterbach_inst.cc_receive_into(buffer)
+
+    assert size == len(msg_received)
+    assert buffer[:size] == msg_received
+    with pytest.raises(ValueError):
+        lauterbach_inst.cc_receive_into(bytearray(2))
+
+
 @pytest.mark.parametrize(
     "side_effect, reset_Flag",
     [
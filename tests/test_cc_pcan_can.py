@@ -775,6 +775,23 @@ def test_can_recv_can_error_exception(caplog, mocker, mock_can_bus, mock_PCANBas
     assert "encountered CAN error while receiving message: Invalid Message" in caplog.text
 
 
+def test_can_recv_many(mocker, mock_can_bus, mock_PCANBasic):
+    frames = [
+        python_can.Message(data=b"\x01", arbitration_id=0x1, timestamp=12.0),
+        python_can.Message(data=b"\x02", arbitration_id=0x2, timestamp=13.0),
+        None,
+    ]
+    mocker.patch("can.interface.Bus.recv", side_effect=frames)
+
+    with CCPCanCan() as can:
+        can.boottime_epoch = 10.0
+        responses = can._cc_receive_many(max_count=10, timeout=0.0001)
+
+    assert responses == [
+        {"msg": b"\x01", "remote_id": 0x1, "timestamp": 2.0},
+        {"msg": b"\x02", "remote_id": 0x2, "timestamp": 3.0},
+    ]
+
 def test_extract_header(trc_files):
     header_data = """;$FILEVERSION=2.0
 ;$STARTTIME=55555.0000000000
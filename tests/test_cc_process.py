@@ -7,13 +7,14 @@
 # SPDX-License-Identifier: EPL-2.0
 ##########################################################################
 
+import queue
 import sys
 import time
 from pathlib import Path
 
 import pytest
 
-from pykiso.lib.connectors.cc_process import CCProcess, CCProcessError
+from pykiso.lib.connectors.cc_process import CCProcess, CCProcessError, ProcessMessage
 
 
 @pytest.mark.slow
@@ -181,3 +182,16 @@ def test_process_terminate(mocker):
     # Check if the process was terminated in time
     elapsed_time = time.time() - start
     assert elapsed_time < 1
+
+
+def test_wait_readable():
+    cc_process = CCProcess(executable="python")
+
+    assert cc_process.wait_readable(timeout=0) is False
+
+    cc_process._queue_in = queue.Queue()
+    assert cc_process.wait_readable(timeout=0.01) is False
+
+    cc_process._queue_in.put(ProcessMessage("stdout", "hello"))
+    assert cc_process.wait_readable(timeout=0) is True
+    assert cc_process.fileno() is None
@@ -71,6 +71,17 @@ def test_cc_receive_timeout():
         assert response.get("remote_id") is None
 
 
+def test_cc_receive_many():
+    with CCProxy() as proxy_inst:
+        proxy_inst.timeout = 0.01
+        for item in range(3):
+            proxy_inst.queue_out.put({"msg": item})
+
+        assert proxy_inst._cc_receive_many(max_count=2) == [{"msg": 0}, {"msg": 1}]
+        assert proxy_inst._cc_receive_many(max_count=2) == [{"msg": 2}]
+        assert proxy_inst._cc_receive_many(max_count=2) == []
+
+
 def test_detached_tx_callback():
     with CCProxy() as proxy_inst:
         proxy_inst._tx_callback = True
@@ -95,3 +106,16 @@ def test_attached_tx_callback_replace():
         proxy_inst.attach_tx_callback(func_2)
         assert proxy_inst._tx_callback != func_1
         assert proxy_inst._tx_callback == func_2
+
+
+def test_bounded_queue():
+    with CCProxy(queue_size=1, queue_policy="drop-oldest") as proxy_inst:
+        proxy_inst.queue_out.put({"msg": b"\x01"})
+        proxy_inst.queue_out.put({"msg": b"\x02"})
+
+        assert proxy_inst.get_queue_stats()["dropped"] == 1
+        response = proxy_inst.cc_receive()
+        assert response["msg"] == b"\x02"
+        assert "rx_timestamp" in response
+
+    assert proxy_inst.get_queue_stats() is None
@@ -0,0 +1,54 @@
+##########################################################################
+# Copyright (c) 2010-2022 Robert Bosch GmbH
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# http://www.eclipse.org/legal/epl-2.0.
+#
+# SPDX-License-Identifier: EPL-2.0
+##########################################################################
+
+import threading
+import time
+
+import pytest
+
+from pykiso.lib.connectors.cc_raw_loopback import CCLoopback
+
+
+@pytest.fixture
+def loopback():
+    channel = CCLoopback(name="loopback")
+    channel._cc_open()
+    yield channel
+    channel._cc_close()
+
+
+def test_send_and_receive(loopback):
+    loopback._cc_send(b"\x01")
+    loopback._cc_send(b"\x02")
+
+    assert loopback._cc_receive(timeout=0) == {"msg": b"\x01"}
+    assert loopback._cc_receive(timeout=0) == {"msg": b"\x02"}
+    assert loopback._cc_receive(timeout=0.01) == {"msg": None}
+
+
+def test_receive_wakes_up_on_send(loopback):
+    sender = threading.Timer(0.05, loopback._cc_send, args=(b"\x01",))
+    sender.start()
+
+    start = time.perf_counter()
+    response = loopback._cc_receive(timeout=5)
+    elapsed = time.perf_counter() - start
+    sender.join()
+
+    assert response == {"msg": b"\x01"}
+    # the sender is not blocked by the waiting reception
+    assert elapsed < 1
+
+
+def test_close_while_receiving(loopback):
+    closer = threading.Timer(0.05, loopback._cc_close)
+    closer.start()
+
+    assert loopback._cc_receive(timeout=0.2) == {"msg": None}
+    closer.join()
@@ -0,0 +1,140 @@
+##########################################################################
+# Copyright (c) 2010-2022 Robert Bosch GmbH
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# http://www.eclipse.org/legal/epl-2.0.
+#
+# SPDX-License-Identifier: EPL-2.0
+##########################################################################
+
+import threading
+import time
+
+import pytest
+
+from pykiso.lib.connectors.cc_capture import (
+    _FILE_HEADER,
+    _RECORD_HEADER,
+    CAPTURE_MAGIC,
+    CAPTURE_VERSION,
+    CCCapture,
+    Direction,
+    PayloadKind,
+)
+from pykiso.lib.connectors.cc_replay import CCReplay
+
+
+@pytest.fixture
+def capture_file(tmp_path):
+    """Capture of a request sent at 0.1s, answered at 0.15s and
+    followed by a notification at 0.2s.
+    """
+    records = [
+        (Direction.RX, 0.0, 0x10, b"\x00"),
+        (Direction.TX, 0.1, -1, b"\x01"),
+        (Direction.RX, 0.15, 0x11, b"\x02"),
+        (Direction.RX, 0.2, -1, b"\x03"),
+    ]
+    path = tmp_path / "traffic.pkcap"
+    with open(path, "wb") as capture:
+        capture.write(_FILE_HEADER.pack(CAPTURE_MAGIC, CAPTURE_VERSION))
+        for direction, timestamp, remote_id, payload in records:
+            capture.write(_RECORD_HEADER.pack(direction, PayloadKind.BYTES, timestamp, remote_id, len(payload)))
+            capture.write(payload)
+    return path
+
+
+def test_replay_as_fast_as_possible(capture_file):
+    with CCReplay(capture_file, speed=0, follow_sends=False) as replay:
+        responses = [replay.cc_receive(timeout=0) for _ in range(4)]
+
+    assert [response["msg"] for response in responses] == [b"\x00", b"\x02", b"\x03", None]
+    assert responses[0]["remote_id"] == 0x10
+    assert "remote_id" not in responses[2]
+
+
+
+def test_replay_ignores_sends(capture_file):
+    with CCReplay(capture_file, speed=0, follow_sends=False) as replay:
+        for _ in range(3):
+            replay.cc_send(b"\x01")
+
+        assert not replay._send_times
+
+def test_replay_waits_for_sends(capture_file):
+    with CCReplay(capture_file, speed=0) as replay:
+        assert replay.cc_receive(timeout=0)["msg"] == b"\x00"
+        # the response is only delivered once the request was sent
+        assert replay.cc_receive(timeout=0.05)["msg"] is None
+
+        threading.Timer(0.05, replay.cc_send, args=(b"\x01",)).start()
+        assert replay.cc_receive(timeout=1)["msg"] == b"\x02"
+        assert replay.cc_receive(timeout=0)["msg"] == b"\x03"
+
+
+def test_replay_original_timing(capture_file):
+    with CCReplay(capture_file, speed=2) as replay:
+        assert replay.cc_receive(timeout=0)["msg"] == b"\x00"
+        replay.cc_send(b"\x01")
+        start = time.perf_counter()
+        # delivered 0.05s after the send in the capture, twice as fast here
+        assert replay.cc_receive(timeout=0.001)["msg"] is None
+        assert replay.cc_receive(timeout=1)["msg"] == b"\x02"
+
+    assert 0.02 <= time.perf_counter() - start < 0.5
+
+
+def test_replay_loop(capture_file):
+    with CCReplay(capture_file, speed=0, follow_sends=False, loop=True) as replay:
+        messages = [replay.cc_receive(timeout=0)["msg"] for _ in range(6)]
+
+    assert messages == [b"\x00", b"\x02", b"\x03", b"\x00", b"\x02", b"\x03"]
+
+
+def test_replay_ignores_sends_beyond_capture(capture_file):
+    with CCReplay(capture_file, speed=0) as replay:
+        for _ in range(3):
+            replay.cc_send(b"\x01")
+
+        # only one transmission was captured
+        assert len(replay._send_times) == 1
+        assert [replay.cc_receive(timeout=0)["msg"] for _ in range(4)] == [b"\x00", b"\x02", b"\x03", None]
+
+        # the capture is exhausted
+        replay.cc_send(b"\x01")
+        assert not replay._send_times
+
+
+def test_replay_loop_forgets_pending_sends(capture_file):
+    with CCReplay(capture_file, speed=0, loop=True) as replay:
+        assert replay.cc_receive(timeout=0)["msg"] == b"\x00"
+        replay.cc_send(b"\x01")
+        assert [replay.cc_receive(timeout=0)["msg"] for _ in range(3)] == [b"\x02", b"\x03", b"\x00"]
+        replay.cc_send(b"\x01")
+        assert [replay.cc_receive(timeout=0)["msg"] for _ in range(2)] == [b"\x02", b"\x03"]
+
+        # a send left unmatched at the end of the capture is not carried over
+        replay._send_times.append(time.perf_counter())
+        assert replay.cc_receive(timeout=0)["msg"] == b"\x00"
+        assert not replay._send_times
+        assert replay.cc_receive(timeout=0.01)["msg"] is None
+
+
+def test_replay_invalid_speed(capture_file):
+    with pytest.raises(ValueError):
+        CCReplay(capture_file, speed=-1)
+
+
+def test_replay_recorded_capture(tmp_path, cchannel_inst):
+    capture_file = tmp_path / "recorded.pkcap"
+    cchannel_inst._cc_receive.side_effect = [{"msg": b"\x02", "remote_id": 0x11}]
+
+    with CCCapture(capture_file, channel=cchannel_inst, name="capture") as capture:
+        capture.cc_send(b"\x01")
+        capture.cc_receive()
+
+    with CCReplay(capture_file, speed=0) as replay:
+        replay.cc_send(b"\x01")
+        response = replay.cc_receive(timeout=0)
+
+    assert (response["msg"], response["remote_id"]) == (b"\x02", 0x11)
@@ -134,6 +134,63 @@ def test_receive_multiple_bytes(mocker):
     assert cc_serial.serial.read.call_count == 2
 
 
+def test_receive_into(mocker):
+
+    serial_mock = mocker.patch("serial.Serial")
+
+    def readinto(buffer):
+        data = b"1" if len(buffer) == 1 else b"234"
+        buffer[: len(data)] = data
+        return len(data)
+
+    cc_serial = CCSerial("com666")
+    cc_serial.serial.readinto.side_effect = readinto
+    cc_serial.serial.in_waiting = 10
+    buffer = bytearray(4)
+
+    size = cc_serial.cc_receive_into(buffer, timeout=0.5)
+
+    assert size == 4
+    assert buffer == b"1234"
+    assert [len(call.args[0]) for call in cc_serial.serial.readinto.call_args_list] == [1, 3]
+    assert cc_serial.serial.timeout == 0
+
+
+def test_receive_into_nothing(mocker):
+
+    serial_mock = mocker.patch("serial.Serial")
+
+    cc_serial = CCSerial("com666")
+    cc_serial.serial.readinto.return_value = 0
+
+    assert cc_serial.cc_receive_into(bytearray(4), timeout=0.5) == 0
+    cc_serial.serial.readinto.assert_called_once()
+    assert cc_serial.serial.timeout == 0.5
+
+
+@pytest.mark.parametrize("side_effect, expected_fileno", [([7], 7), (AttributeError, None)])
+def test_fileno(mocker, side_effect, expected_fileno):
+
+    serial_mock = mocker.patch("serial.Serial")
+
+    cc_serial = CCSerial("com666")
+    cc_serial.serial.fileno.side_effect = side_effect
+
+    assert cc_serial.fileno() == expected_fileno
+
+
+def test_wait_readable_bytes_pending(mocker):
+
+    serial_mock = mocker.patch("serial.Serial")
+
+    cc_serial = CCSerial("com666")
+    cc_serial.serial.is_open = True
+    cc_serial.serial.in_waiting = 2
+
+    assert cc_serial.wait_readable(timeout=0) is True
+    cc_serial.serial.fileno.assert_not_called()
+
+
 def test_send(mocker):
 
     serial_mock = mocker.patch("serial.Serial")
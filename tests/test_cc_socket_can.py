@@ -58,6 +58,7 @@ def mock_can_bus(mocker):
         shutdown = mocker.stub(name="shutdown")
         send = mocker.stub(name="send")
         recv = mocker.stub(name="recv")
+        fileno = mocker.stub(name="fileno")
 
     mocker.patch(
         "pykiso.lib.connectors.cc_socket_can.cc_socket_can.os_name",
@@ -260,7 +261,7 @@ def test_cc_send(mock_can_bus, message, remote_id):
 def test_can_recv(mocker, mock_can_bus, raw_data, can_id, timeout, raw, expected_type):
     mock_bus_recv = mocker.patch(
         "can.interface.Bus.recv",
-        return_value=python_can.Message(data=raw_data, arbitration_id=can_id),
+        return_value=python_can.Message(data=raw_data, arbitration_id=can_id, timestamp=12.5),
     )
     with CCSocketCan() as can:
         response = can._cc_receive(timeout)
@@ -271,10 +272,51 @@ def test_can_recv(mocker, mock_can_bus, raw_data, can_id, timeout, raw, expected
         msg_received = Message.parse_packet(msg_received)
     assert isinstance(msg_received, expected_type)
     assert id_received == can_id
+    assert response.get("timestamp") == 12.5
     mock_can_bus.Bus.recv.assert_called_once_with(timeout=timeout or 1e-6)
     mock_can_bus.Bus.shutdown.assert_called_once()
 
 
+def test_can_recv_many(mocker, mock_can_bus):
+    frames = [
+        python_can.Message(data=b"\x01", arbitration_id=0x1, timestamp=1.5),
+        python_can.Message(data=b"\x02", arbitration_id=0x2, timestamp=2.5),
+    ]
+    mocker.patch("can.interface.Bus.recv", side_effect=[*frames, None])
+
+    with CCSocketCan() as can:
+        responses = can._cc_receive_many(max_count=10, timeout=0.5)
+
+    assert responses == [
+        {"msg": b"\x01", "remote_id": 0x1, "timestamp": 1.5},
+        {"msg": b"\x02", "remote_id": 0x2, "timestamp": 2.5},
+    ]
+    assert mock_can_bus.Bus.recv.call_args_list == [
+        mocker.call(timeout=0.5),
+        mocker.call(timeout=0),
+        mocker.call(timeout=0),
+    ]
+
+
+@pytest.mark.parametrize("side_effect, expected_fileno", [([7], 7), (NotImplementedError, None)])
+def test_can_fileno(mocker, mock_can_bus, side_effect, expected_fileno):
+    mocker.patch("can.interface.Bus.fileno", side_effect=side_effect)
+    can = CCSocketCan()
+
+    assert can.fileno() is None
+    can.open()
+    assert can.fileno() == expected_fileno
+
+
+def test_can_recv_many_max_count_and_error(mocker, mock_can_bus):
+    frame = python_can.Message(data=b"\x01", arbitration_id=0x1)
+    mocker.patch("can.interface.Bus.recv", side_effect=[frame, python_can.CanError])
+
+    with CCSocketCan() as can:
+        assert can._cc_receive_many(max_count=1) == [{"msg": b"\x01", "remote_id": 0x1, "timestamp": 0.0}]
+        assert can._cc_receive_many(max_count=1) == []
+
+
 @pytest.mark.parametrize(
     "raw_state",
     [
@@ -36,6 +36,7 @@ def mock_socket(mocker):
         close = mocker.stub(name="close")
         send = mocker.stub(name="send")
         settimeout = mocker.stub(name="settimeout")
+        fileno = mocker.stub(name="fileno")
 
         def recv(self, max_msg_size):
             # the max_msg_size parameter is used to trigger different scenarios
@@ -49,6 +50,11 @@ def mock_socket(mocker):
                 response = example_response
             return response.encode()
 
+        def recv_into(self, buffer, nbytes):
+            response = example_response.encode()[:nbytes]
+            buffer[: len(response)] = response
+            return len(response)
+
     mocker.patch.object(cc_tcp_ip.socket, "socket", new=MockSocket)
     return cc_tcp_ip
 
@@ -161,3 +167,31 @@ def test__cc_receive_with_errors(
     for err in errors_to_catch:
         socket_connector.max_msg_size = err
         assert socket_connector._cc_receive() == {"msg": None}
+
+
+@pytest.mark.parametrize("buffer_size, expected_size", [(100, len(example_response)), (7, 7)])
+def test__cc_receive_into(mock_socket, buffer_size, expected_size):
+    socket_connector = cc_tcp_ip.CCTcpip(*constructor_params.values())
+    buffer = bytearray(buffer_size)
+
+    size = socket_connector._cc_receive_into(memoryview(buffer), timeout=0.5)
+
+    assert size == expected_size
+    assert buffer[:size] == example_response.encode()[:expected_size]
+    socket_connector.socket.settimeout.assert_called_once_with(0.5)
+
+
+@pytest.mark.parametrize("error", [socket.timeout, Exception])
+def test__cc_receive_into_with_errors(mocker, mock_socket, error):
+    socket_connector = cc_tcp_ip.CCTcpip(*constructor_params.values())
+    mocker.patch.object(socket_connector.socket, "recv_into", side_effect=error)
+
+    assert socket_connector._cc_receive_into(memoryview(bytearray(10))) == 0
+
+
+@pytest.mark.parametrize("socket_fileno, expected_fileno", [(7, 7), (-1, None)])
+def test_fileno(mock_socket, socket_fileno, expected_fileno):
+    socket_connector = cc_tcp_ip.CCTcpip(*constructor_params.values())
+    socket_connector.socket.fileno.return_value = socket_fileno
+
+    assert socket_connector.fileno() == expected_fileno
@@ -52,7 +52,11 @@ def mock_udp_socket(mocker):
         close = mocker.stub(name="close")
         sendto = mocker.stub(name="sendto")
         settimeout = mocker.stub(name="settimeout")
+        gettimeout = mocker.MagicMock(name="gettimeout", return_value=None)
         recvfrom = mocker.stub(name="recvfrom")
+        recvfrom_into = mocker.stub(name="recvfrom_into")
+        fileno = mocker.stub(name="fileno")
+        setblocking = mocker.stub(name="setblocking")
 
     mocker.patch.object(socket, "socket", new=MockSocket)
     return socket
@@ -163,3 +167,72 @@ def test_udp_recv_valid(
     assert udp_inst.source_addr == raw_data[1]
     mock_udp_socket.socket.settimeout.assert_called_once_with(cc_receive_param or 1e-6)
     mock_udp_socket.socket.recvfrom.assert_called_once()
+
+
+def test_udp_recv_many(mocker, mock_udp_socket):
+    mocker.patch(
+        "socket.socket.recvfrom",
+        side_effect=[(b"\x01", 36), (b"\x02", 37), BlockingIOError],
+    )
+
+    with CCUdp("120.0.0.7", 5005) as udp_inst:
+        responses = udp_inst._cc_receive_many(max_count=10, timeout=0.5)
+
+    assert responses == [{"msg": b"\x01"}, {"msg": b"\x02"}]
+    assert udp_inst.source_addr == 37
+    assert mock_udp_socket.socket.settimeout.call_args_list == [mocker.call(0.5), mocker.call(None)]
+    mock_udp_socket.socket.setblocking.assert_called_once_with(False)
+
+
+def test_udp_recv_many_timeout(mocker, mock_udp_socket):
+    mocker.patch("socket.socket.recvfrom", side_effect=socket.timeout)
+
+    with CCUdp("120.0.0.7", 5005) as udp_inst:
+        assert udp_inst._cc_receive_many(max_count=10) == []
+
+
+def test_udp_recv_into(mocker, mock_udp_socket):
+    def recvfrom_into(buffer):
+        buffer[:2] = b"\x01\x02"
+        return 2, 36
+
+    mocker.patch("socket.socket.recvfrom_into", side_effect=recvfrom_into)
+    buffer = bytearray(8)
+
+    with CCUdp("120.0.0.7", 5005) as udp_inst:
+        size = udp_inst.cc_receive_into(buffer, timeout=0.5)
+
+    assert size == 2
+    assert buffer[:size] == b"\x01\x02"
+    assert udp_inst.source_addr == 36
+    mock_udp_socket.socket.settimeout.assert_called_once_with(0.5)
+
+
+@pytest.mark.parametrize("exception", [BlockingIOError, socket.timeout, OSError])
+def test_udp_recv_into_nothing(mocker, mock_udp_socket, exception):
+    mocker.patch("socket.socket.recvfrom_into", side_effect=exception)
+
+    with CCUdp("120.0.0.7", 5005) as udp_inst:
+        assert udp_inst.cc_receive_into(bytearray(8)) == 0
+
+
+def test_udp_fileno(mocker, mock_udp_socket):
+    mocker.patch("socket.socket.fileno", return_value=7)
+    udp_inst = CCUdp("120.0.0.7", 5005)
+
+    assert udp_inst.fileno() is None
+    udp_inst.open()
+    assert udp_inst.fileno() == 7
+
+
+def test_udp_recv_many_keeps_socket_blocking():
+    sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+    with CCUdp("127.0.0.1", 5005) as udp_inst:
+        udp_inst.udp_socket.bind(("127.0.0.1", 0))
+        udp_inst.udp_socket.settimeout(2.0)
+        sender.sendto(b"\x01", udp_inst.udp_socket.getsockname())
+
+        assert udp_inst._cc_receive_many(max_count=10, timeout=0.5) == [{"msg": b"\x01"}]
+        assert udp_inst.udp_socket.gettimeout() == 2.0
+    sender.close()
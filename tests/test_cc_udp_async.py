@@ -0,0 +1,101 @@
+##########################################################################
+# Copyright (c) 2010-2022 Robert Bosch GmbH
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# http://www.eclipse.org/legal/epl-2.0.
+#
+# SPDX-License-Identifier: EPL-2.0
+##########################################################################
+
+import asyncio
+import socket
+
+import pytest
+
+from pykiso.interfaces.async_auxiliary import AsyncAuxiliaryInterface, SharedEventLoop
+from pykiso.lib.connectors.cc_udp_async import CCUdpAsync
+
+
+class UdpEchoAux(AsyncAuxiliaryInterface):
+    def __init__(self, com, **kwargs):
+        super().__init__(**kwargs)
+        self.channel = com
+
+    async def _create_auxiliary_instance(self):
+        await self.channel.open_async()
+        return True
+
+    async def _delete_auxiliary_instance(self):
+        await self.channel.close_async()
+        return True
+
+    async def _run_command(self, cmd_message, cmd_data):
+        await self.channel.cc_send(msg=cmd_data)
+
+    async def _receive_message(self, timeout_in_s):
+        response = await self.channel.cc_receive(timeout=timeout_in_s)
+        if response["msg"] is not None:
+            await self.queue_out.put(response["msg"])
+
+
+@pytest.fixture
+def peer():
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.bind(("127.0.0.1", 0))
+    sock.settimeout(1)
+    yield sock
+    sock.close()
+
+
+@pytest.fixture
+def udp_aux(peer):
+    aux = UdpEchoAux(com=CCUdpAsync("127.0.0.1", peer.getsockname()[1], name="udp"), name="udp_aux")
+    aux.recv_timeout = 0.05
+    yield aux
+    aux.delete_instance()
+
+
+def test_udp_async_exchange(udp_aux, peer):
+    udp_aux.create_instance()
+
+    udp_aux.run_command("send", b"\x01\x02", blocking=False)
+    msg, addr = peer.recvfrom(256)
+    peer.sendto(msg + b"\x03", addr)
+
+    assert msg == b"\x01\x02"
+    assert udp_aux.receive(timeout_in_s=1) == b"\x01\x02\x03"
+    assert udp_aux.channel.source_addr == peer.getsockname()
+
+
+def test_udp_async_receive_timeout(udp_aux):
+    udp_aux.rx_task_on = False
+    udp_aux.create_instance()
+
+    future = asyncio.run_coroutine_threadsafe(udp_aux.channel.cc_receive(timeout=0.05), udp_aux._loop)
+
+    assert future.result(timeout=1) == {"msg": None}
+
+
+def test_udp_async_close(udp_aux):
+    udp_aux.create_instance()
+    transport = udp_aux.channel.transport
+
+    udp_aux.delete_instance()
+
+    assert transport.is_closing()
+    assert udp_aux.channel.transport is None
+    assert not SharedEventLoop.is_running()
+
+
+def test_udp_async_sync_calls_from_event_loop(udp_aux):
+    udp_aux.create_instance()
+
+    async def blocking_calls():
+        for call in (udp_aux.delete_instance, udp_aux.stop, udp_aux.create_instance, udp_aux.channel.close):
+            with pytest.raises(RuntimeError, match="would deadlock"):
+                call()
+
+    asyncio.run_coroutine_threadsafe(blocking_calls(), udp_aux._loop).result(timeout=2)
+
+    assert udp_aux.is_instance
+    assert udp_aux.delete_instance()
@@ -54,6 +54,7 @@ def mock_udp_socket(mocker):
         sendto = mocker.stub(name="sendto")
         settimeout = mocker.stub(name="settimeout")
         recvfrom = mocker.stub(name="recvfrom")
+        fileno = mocker.stub(name="fileno")
 
     mocker.patch.object(socket, "socket", new=MockSocket)
     return socket
@@ -171,3 +172,11 @@ def test_udp_recv_invalid(mocker, mock_udp_socket, side_effect_mock, caplog):
 
     assert msg_received["msg"] is None
     assert udp_server.address is None
+
+
+@pytest.mark.parametrize("socket_fileno, expected_fileno", [(7, 7), (-1, None)])
+def test_udp_server_fileno(mocker, mock_udp_socket, socket_fileno, expected_fileno):
+    mocker.patch("socket.socket.fileno", return_value=socket_fileno)
+    udp_server = CCUdpServer("120.0.0.7", 5005)
+
+    assert udp_server.fileno() == expected_fileno
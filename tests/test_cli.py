@@ -7,6 +7,8 @@
 # SPDX-License-Identifier: EPL-2.0
 ##########################################################################
 
+import json
+
 import click
 import pytest
 from click.testing import CliRunner
@@ -146,3 +148,39 @@ def test_active_threads(mocker):
     mocker.patch("threading.enumerate", return_value=[main_thread, other_thread])
     actual = cli.active_threads()
     assert actual == ["Thread-1"]
+
+
+def test_main_metrics_output(runner, mocker, tmp_path):
+    mocker.patch("pykiso.cli.parse_config", return_value={})
+    mocker.patch("pykiso.cli.initialize_logging")
+    mocker.patch("pykiso.cli.check_and_handle_unresolved_threads")
+    mocker.patch.object(cli.ConfigRegistry, "provide_auxiliaries")
+    mocker.patch.object(cli.test_execution, "execute", return_value=0)
+    mocker.patch.object(cli.metrics_registry, "snapshot_all", return_value={"auxiliary.aux": {"counters": {}}})
+    output = tmp_path / "metrics.json"
+
+    result = runner.invoke(cli.main, ["-c", "examples/acroname.yaml", "--metrics-output", str(output)])
+
+    assert result.exit_code == 0
+    assert json.loads(output.read_text()) == {"acroname": {"auxiliary.aux": {"counters": {}}}}
+
+
+def test_main_trace_timeline(runner, mocker, tmp_path):
+    mocker.patch("pykiso.cli.parse_config", return_value={})
+    mocker.patch("pykiso.cli.initialize_logging")
+    mocker.patch("pykiso.cli.check_and_handle_unresolved_threads")
+    mocker.patch.object(cli.ConfigRegistry, "provide_auxiliaries")
+
+    def execute(*args, **kwargs):
+        with cli.tracer.span("test_run", "test"):
+            return 0
+
+    mocker.patch.object(cli.test_execution, "execute", side_effect=execute)
+    output = tmp_path / "timeline.json"
+
+    result = runner.invoke(cli.main, ["-c", "examples/acroname.yaml", "--trace-timeline", str(output)])
+
+    assert result.exit_code == 0
+    assert cli.tracer.enabled is False
+    events = json.loads(output.read_text())["traceEvents"]
+    assert [event["name"] for event in events if event["ph"] == "X"] == ["test_run"]
@@ -8,6 +8,7 @@
 ##########################################################################
 
 import logging
+import time
 
 import pytest
 
@@ -111,16 +112,31 @@ def test_com_aux_receive_with_timestamp_messaging_without_contextmanager(caplog,
     msg = {"timestamp": 1005, "msg": "test"}
     mocker.patch.object(com_aux_inst.channel, "_cc_receive", return_value=msg)
 
+    before = time.perf_counter()
     com_aux_inst.create_instance()
 
     payload, remote_id, timestamp = com_aux_inst.receive_message(receive_timestamp=True)
 
     assert payload == msg["msg"]
-    assert timestamp == msg["timestamp"]
+    # the hardware timestamp is converted to the host clock
+    assert before <= timestamp <= time.perf_counter()
     assert remote_id == None
     com_aux_inst.delete_instance()
 
 
+def test_com_aux_receive_with_host_timestamp(com_aux_inst, mocker):
+    mocker.patch.object(com_aux_inst.channel, "_cc_receive", return_value={"msg": b"\x01"})
+    before = time.perf_counter()
+
+    com_aux_inst.create_instance()
+    payload, remote_id, timestamp = com_aux_inst.receive_message(receive_timestamp=True)
+    com_aux_inst.delete_instance()
+
+    assert payload == b"\x01"
+    assert remote_id is None
+    assert before <= timestamp <= time.perf_counter()
+
+
 def test_com_aux_receive_full_messaging_with_contextmanager(
     caplog, com_aux_inst, mocker
 ):
@@ -129,13 +145,24 @@ def test_com_aux_receive_full_messaging_with_contextmanager(
     com_aux_inst.create_instance()
 
     with com_aux_inst.collect_messages():
-        payload, remote_id, timestamp = com_aux_inst.receive_message(receive_timestamp=True)
+        response = com_aux_inst.receive_response()
 
-    assert payload == msg["msg"]
-    assert remote_id == msg["remote_id"]
-    assert timestamp == msg["timestamp"]
+    assert response["msg"] == msg["msg"]
+    assert response["remote_id"] == msg["remote_id"]
+    assert response["hw_timestamp"] == msg["timestamp"]
+    assert response["timestamp"] == com_aux_inst.channel.to_host_time(msg["timestamp"])
+    com_aux_inst.delete_instance()
+
+
+def test_com_aux_receive_response_without_hw_timestamp(com_aux_inst, mocker):
+    mocker.patch.object(com_aux_inst.channel, "_cc_receive", return_value={"msg": b"\x01", "rx_timestamp": 1.5})
+
+    com_aux_inst.create_instance()
+    response = com_aux_inst.receive_response()
     com_aux_inst.delete_instance()
 
+    assert response == {"msg": b"\x01", "remote_id": None, "timestamp": 1.5, "hw_timestamp": None}
+
 
 def test_create_auxiliary_instance(com_aux_inst):
     state = com_aux_inst._create_auxiliary_instance()
@@ -231,3 +258,25 @@ def test_clear_buffer(com_aux_inst):
     com_aux_inst.clear_buffer()
 
     assert com_aux_inst.queue_out.empty()
+
+
+def test__receive_message_no_formatting_when_debug_disabled(caplog, com_aux_inst, mocker):
+    class FormatCounter:
+        calls = 0
+
+        def __repr__(self):
+            FormatCounter.calls += 1
+            return "FormatCounter"
+
+        __str__ = __repr__
+
+        def get(self, key):
+            return None
+
+    mocker.patch.object(com_aux_inst.channel, "cc_receive", return_value=FormatCounter())
+
+    with caplog.at_level(logging.INFO):
+        com_aux_inst._receive_message(timeout_in_s=0)
+
+    assert FormatCounter.calls == 0
+    assert caplog.records == []
@@ -144,6 +144,16 @@ def test_test_execution_with_user_tags(tmp_test, capsys):
     assert exit_code == test_execution.ExitCode.ALL_TESTS_SUCCEEDED
 
 
+@pytest.mark.parametrize("tmp_test", [("aux_par1", "aux_par2", False)], indirect=True)
+def test_config_registry_parallel_start(tmp_test):
+    cfg = parse_config(tmp_test)
+
+    with ConfigRegistry.provide_auxiliaries(cfg, parallel_start=True):
+        all_auxes = ConfigRegistry._linker._aux_cache.instances
+        assert set(all_auxes) == {"aux_par1", "aux_par2"}
+        assert all(aux.is_instance for aux in all_auxes.values())
+
+
 def test_config_registry_context_manager(tmp_test, mocker):
     mock_register_aux_con = mocker.patch.object(ConfigRegistry, "register_aux_con")
     mocker_delete_aux_con = mocker.patch.object(ConfigRegistry, "delete_aux_con")
@@ -153,7 +163,7 @@ def test_config_registry_context_manager(tmp_test, mocker):
     with ConfigRegistry.provide_auxiliaries(cfg):
         pass
 
-    mock_register_aux_con.assert_called_once_with(cfg)
+    mock_register_aux_con.assert_called_once_with(cfg, False)
     mocker_delete_aux_con.assert_called_once_with()
 
 
@@ -1164,3 +1174,18 @@ def test_stop_pcan_trace_decorator(mocker: MockerFixture):
 
     assert returned_value == "value"
     pcan_mock.stop_pcan_trace.assert_called_once_with()
+
+
+def test_config_registry_proxy_channel_queue_config(mocker: MockerFixture, sample_config):
+    mock_linker = mocker.MagicMock()
+    mocker.patch(
+        "pykiso.test_setup.config_registry.DynamicImportLinker",
+        return_value=mock_linker,
+    )
+    config, *_ = sample_config
+    config["auxiliaries"]["aux1"]["config"].update({"queue_size": 100, "queue_policy": "drop-oldest"})
+
+    ConfigRegistry.register_aux_con(config)
+
+    assert config["connectors"]["proxy_channel_aux1"]["config"] == {"queue_size": 100, "queue_policy": "drop-oldest"}
+    assert config["connectors"]["proxy_channel_aux2"]["config"] is None
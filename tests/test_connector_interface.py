@@ -8,7 +8,9 @@
 ##########################################################################
 
 import logging
+import socket
 import threading
+from unittest.mock import call as mocker_call
 
 import pytest
 
@@ -51,6 +53,38 @@ def test_channel_constructor_thread(channel_obj):
     assert isinstance(cc_inst._lock, type(threading.Lock()))
 
 
+def test_channel_close_when_idle(channel_obj):
+    cc_inst = channel_obj(name="thread-channel")
+
+    assert cc_inst.close_when_idle(timeout=0.1) is True
+
+    cc_inst._cc_close.assert_called_once()
+
+
+def test_channel_close_when_idle_in_use(channel_obj):
+    cc_inst = channel_obj(name="thread-channel")
+    rx_locked = threading.Event()
+    release = threading.Event()
+
+    def receive():
+        with cc_inst._lock_rx:
+            rx_locked.set()
+            release.wait(5)
+
+    receiver = threading.Thread(target=receive)
+    receiver.start()
+    rx_locked.wait(5)
+
+    assert cc_inst.close_when_idle(timeout=0.1) is False
+    release.set()
+    receiver.join()
+
+    cc_inst._cc_close.assert_not_called()
+    # every lock taken meanwhile got released
+    assert cc_inst._lock.acquire(blocking=False)
+    cc_inst._lock.release()
+
+
 def test_channel_context_manager(channel_obj):
     cc_inst = channel_obj(name="thread-channel")
 
@@ -97,6 +131,159 @@ def test_channel_cc_receive(channel_obj):
     cc_inst._cc_receive.assert_called_with(timeout=0.1)
 
 
+def test_channel_cc_send_many(channel_obj):
+    cc_inst = channel_obj(name="thread-channel")
+
+    cc_inst.cc_send_many((msg for msg in [b"\x01", b"\x02\x03"]), remote_id=0x12)
+
+    assert cc_inst._cc_send.call_args_list == [
+        mocker_call(msg=b"\x01", remote_id=0x12),
+        mocker_call(msg=b"\x02\x03", remote_id=0x12),
+    ]
+    assert cc_inst.metrics.snapshot()["counters"] == {"send_calls": 2, "send_bytes": 3}
+
+
+@pytest.mark.parametrize(
+    "received, max_count, expected_count",
+    [
+        ([{"msg": b"\x01"}, {"msg": b"\x02"}, {"msg": None}], 10, 2),
+        ([{"msg": b"\x01"}, {"msg": b"\x02"}, {"msg": b"\x03"}], 2, 2),
+        ([{"msg": b"\x01"}, {"msg": b""}], 10, 1),
+        ([{"msg": None}], 10, 0),
+    ],
+)
+def test_channel_cc_receive_many(mocker, channel_obj, received, max_count, expected_count):
+    cc_inst = channel_obj(name="thread-channel")
+    cc_inst._cc_receive.side_effect = received
+    mocker.patch.object(cc_inst, "fileno", return_value=3)
+    wait_readable = mocker.patch.object(cc_inst, "wait_readable", return_value=True)
+
+    responses = cc_inst.cc_receive_many(max_count=max_count, timeout=0.5)
+
+    assert responses == received[:expected_count]
+    assert all(call == mocker_call(timeout=0.5) for call in cc_inst._cc_receive.call_args_list)
+    assert all(call == mocker_call(0) for call in wait_readable.call_args_list)
+
+
+def test_channel_cc_receive_many_stops_when_not_readable(mocker, channel_obj):
+    cc_inst = channel_obj(name="thread-channel")
+    cc_inst._cc_receive.side_effect = [{"msg": b"\x01"}, {"msg": b"\x02"}]
+    mocker.patch.object(cc_inst, "fileno", return_value=3)
+    mocker.patch.object(cc_inst, "wait_readable", return_value=False)
+
+    assert [response["msg"] for response in cc_inst.cc_receive_many(max_count=10, timeout=0.5)] == [b"\x01"]
+    cc_inst._cc_receive.assert_called_once()
+
+
+def test_channel_cc_receive_many_without_readiness(channel_obj):
+    cc_inst = channel_obj(name="thread-channel")
+    cc_inst._cc_receive.side_effect = [{"msg": b"\x01"}, {"msg": b"\x02"}]
+
+    # without file descriptor, pending messages can't be detected without polling
+    assert [response["msg"] for response in cc_inst.cc_receive_many(max_count=10, timeout=0.5)] == [b"\x01"]
+
+
+@pytest.mark.parametrize(
+    "received, expected_size",
+    [
+        ({"msg": b"\x01\x02\x03"}, 3),
+        ({"msg": None}, 0),
+    ],
+)
+def test_channel_cc_receive_into(channel_obj, received, expected_size):
+    cc_inst = channel_obj(name="thread-channel")
+    cc_inst._cc_receive.return_value = received
+    buffer = bytearray(4)
+
+    size = cc_inst.cc_receive_into(buffer, timeout=0.5)
+
+    assert size == expected_size
+    assert buffer[:size] == (received["msg"] or b"")
+    cc_inst._cc_receive.assert_called_once_with(timeout=0.5)
+    expected_counters = {"receive_data": 1, "receive_bytes": 3} if size else {"receive_empty": 1}
+    assert cc_inst.metrics.snapshot()["counters"] == expected_counters
+
+
+@pytest.mark.parametrize(
+    "received, expected_exception",
+    [
+        ({"msg": b"\x01\x02\x03"}, ValueError),
+        ({"msg": "not bytes"}, TypeError),
+    ],
+)
+def test_channel_cc_receive_into_invalid(channel_obj, received, expected_exception):
+    cc_inst = channel_obj(name="thread-channel")
+    cc_inst._cc_receive.return_value = received
+
+    with pytest.raises(expected_exception):
+        cc_inst.cc_receive_into(bytearray(2))
+
+
+def test_channel_cc_receive_timestamps(mocker, channel_obj):
+    cc_inst = channel_obj(name="thread-channel")
+    cc_inst._cc_receive.side_effect = [
+        {"msg": b"\x01", "timestamp": 10.0},
+        {"msg": b"\x02", "timestamp": 11.0},
+        {"msg": b"\x03"},
+        {"msg": None},
+    ]
+    mocker.patch("time.perf_counter", side_effect=[0, 100.5, 0, 101.0, 0, 102.0, 0, 103.0])
+
+    first, second, third, empty = (cc_inst.cc_receive() for _ in range(4))
+
+    assert (first["rx_timestamp"], second["rx_timestamp"], third["rx_timestamp"]) == (100.5, 101.0, 102.0)
+    assert (first["timestamp"], second["timestamp"]) == (10.0, 11.0)
+    assert "rx_timestamp" not in empty
+    # the lowest latency frame defines the offset between both clocks
+    assert cc_inst.hw_clock_offset == 90.0
+    assert cc_inst.to_host_time(12.0) == 102.0
+
+    cc_inst.open()
+    assert cc_inst.hw_clock_offset is None
+    assert cc_inst.to_host_time(12.0) is None
+
+
+
+def test_channel_hw_clock_offset_follows_drift(channel_obj):
+    cc_inst = channel_obj(name="thread-channel")
+
+    cc_inst._calibrate_hw_clock(0.0, 100.0)
+    cc_inst._calibrate_hw_clock(1.0, 101.5)
+    assert cc_inst.hw_clock_offset == 100.0
+
+    # the lowest latency sample leaves the window, newer ones take over
+    cc_inst._calibrate_hw_clock(10.0, 110.2)
+    cc_inst._calibrate_hw_clock(11.0, 111.1)
+    assert cc_inst.hw_clock_offset == 100.1
+
+def test_channel_cc_receive_keeps_connector_rx_timestamp(channel_obj):
+    cc_inst = channel_obj(name="thread-channel")
+    cc_inst._cc_receive.return_value = {"msg": b"\x01", "rx_timestamp": 1.0}
+
+    assert cc_inst.cc_receive()["rx_timestamp"] == 1.0
+
+
+def test_channel_readiness_without_fileno(channel_obj):
+    cc_inst = channel_obj(name="thread-channel")
+
+    assert cc_inst.fileno() is None
+    assert cc_inst.wait_readable(timeout=0) is True
+
+
+def test_channel_wait_readable(mocker, channel_obj):
+    cc_inst = channel_obj(name="thread-channel")
+    sock_rx, sock_tx = socket.socketpair()
+    mocker.patch.object(cc_inst, "fileno", return_value=sock_rx.fileno())
+
+    try:
+        assert cc_inst.wait_readable(timeout=0) is False
+        sock_tx.send(b"\x01")
+        assert cc_inst.wait_readable(timeout=1) is True
+    finally:
+        sock_rx.close()
+        sock_tx.close()
+
+
 def test_channel_cc_receive_raw(channel_obj, caplog):
     cc_inst = channel_obj(name="thread-channel")
 
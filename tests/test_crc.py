@@ -0,0 +1,69 @@
+##########################################################################
+# Copyright (c) 2010-2022 Robert Bosch GmbH
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# http://www.eclipse.org/legal/epl-2.0.
+#
+# SPDX-License-Identifier: EPL-2.0
+##########################################################################
+
+import struct
+
+import pytest
+
+from pykiso import crc
+from pykiso.message import Message, MessageCommandType, MessageType
+
+
+def bitwise_crc16(data):
+    crc_value = 0
+    for byte in data:
+        crc_value = ((crc_value >> 8) | (crc_value << 8)) & 0xFFFF
+        crc_value ^= byte
+        crc_value ^= (crc_value & 0xFF) >> 4
+        crc_value ^= (crc_value << 12) & 0xFFFF
+        crc_value ^= ((crc_value & 0xFF) << 5) & 0xFFFF
+    return crc_value
+
+
+BUFFERS = [bytes(range(length)) * 3 for length in range(0, 40, 3)] + [b"@\x01\x00\x00\x00UU\x00"]
+
+
+@pytest.mark.parametrize("data", BUFFERS)
+def test_crc16_matches_bitwise_implementation(data):
+    assert crc.crc16(data) == bitwise_crc16(data)
+    assert crc.crc16(list(data)) == bitwise_crc16(data)
+
+
+def test_crc16_in_chunks():
+    data = bytes(range(200))
+
+    assert crc.crc16(data[100:], crc.crc16(data[:100])) == crc.crc16(data)
+
+
+@pytest.mark.parametrize("vectorize_min", [crc.VECTORIZE_MIN_BUFFERS, 0])
+def test_crc16_many(mocker, vectorize_min):
+    mocker.patch.object(crc, "VECTORIZE_MIN_BUFFERS", vectorize_min)
+
+    assert crc.crc16_many(BUFFERS) == [bitwise_crc16(data) for data in BUFFERS]
+
+
+@pytest.mark.parametrize("vectorize_min", [crc.VECTORIZE_MIN_BUFFERS, 0])
+def test_verify_packets(mocker, vectorize_min):
+    mocker.patch.object(crc, "VECTORIZE_MIN_BUFFERS", vectorize_min)
+    packets = [Message(MessageType.COMMAND, MessageCommandType.PING).serialize() for _ in range(20)]
+    corrupted = bytearray(packets[1])
+    corrupted[0] ^= 0xFF
+    packets[1] = bytes(corrupted)
+    big_endian = b"\x01\x02" + struct.pack(">H", crc.crc16(b"\x01\x02"))
+
+    assert crc.verify_packets(packets + [b"", b"\x00"]) == [True, False] + [True] * 18 + [False, False]
+    assert crc.verify_packets([big_endian, memoryview(big_endian)], byteorder="big") == [True, True]
+
+
+def test_vectorized_path_without_numpy(mocker):
+    mocker.patch.object(crc, "np", None)
+
+    assert crc.crc16_many(BUFFERS * 2) == [bitwise_crc16(data) for data in BUFFERS * 2]
+    with pytest.raises(ImportError, match=r"pykiso\[analysis\]"):
+        crc.crc16_array(b"", [], [])
@@ -8,20 +8,27 @@
 ##########################################################################
 
 import logging
+import socket
+import time
 from unittest.mock import Mock
 
 import pytest
 
 from pykiso.auxiliary import (
+    STALL_MAX_RESTARTS,
     AuxCommand,
     AuxiliaryCreationError,
     AuxiliaryInterface,
     AuxiliaryNotStarted,
+    AuxiliaryReactor,
+    AuxiliaryWatchdog,
     close_connector,
     open_connector,
     queue,
     threading,
 )
+from pykiso.connector import CChannel
+from pykiso.message import Message, MessageAckType, MessageCommandType, MessageType
 
 
 @pytest.fixture
@@ -59,6 +66,12 @@ def aux_inst_with_channel(mocker, cchannel_inst):
     return MockDtAux()
 
 
+@pytest.fixture
+def correlating_aux_inst(aux_inst):
+    aux_inst.correlates_responses = True
+    return aux_inst
+
+
 def test_create_instance(mocker, aux_inst):
     thread_start = mocker.patch.object(threading.Thread, "start")
     aux_inst._create_auxiliary_instance.return_value = True
@@ -279,6 +292,113 @@ def test_resume(mocker, aux_inst):
     assert state is True
 
 
+def test_suspend_warm(mocker, aux_inst):
+    mock_delete = mocker.patch.object(aux_inst, "delete_instance", return_value=True)
+    aux_inst.warm_suspend = True
+    aux_inst.is_instance = True
+
+    state = aux_inst.suspend()
+
+    assert state is True
+    assert aux_inst.is_suspended is True
+    mock_delete.assert_not_called()
+
+
+def test_suspend_warm_not_started(aux_inst):
+    aux_inst.warm_suspend = True
+
+    state = aux_inst.suspend()
+
+    assert state is True
+    assert aux_inst.is_suspended is False
+
+
+def test_resume_warm(mocker, aux_inst):
+    mock_create = mocker.patch.object(aux_inst, "create_instance", return_value=True)
+    aux_inst.warm_suspend = True
+    aux_inst.is_instance = True
+    aux_inst.suspend()
+
+    state = aux_inst.resume()
+
+    assert state is True
+    assert aux_inst.is_suspended is False
+    mock_create.assert_not_called()
+
+
+def test_resume_warm_not_started(mocker, aux_inst):
+    mock_create = mocker.patch.object(aux_inst, "create_instance", return_value=True)
+    aux_inst.warm_suspend = True
+
+    state = aux_inst.resume()
+
+    assert state is True
+    mock_create.assert_called_once()
+
+
+def test_run_command_suspended(aux_inst):
+    aux_inst.warm_suspend = True
+    aux_inst.is_instance = True
+    aux_inst.suspend()
+
+    response = aux_inst.run_command("cmd", timeout_result="timeout")
+
+    assert response == "timeout"
+    assert aux_inst.queue_in.empty()
+
+
+def test_submit_command_suspended(correlating_aux_inst):
+    correlating_aux_inst.warm_suspend = True
+    correlating_aux_inst.is_instance = True
+    correlating_aux_inst.suspend()
+
+    future = correlating_aux_inst.submit_command("cmd", correlation_id=1)
+
+    assert future.cancelled()
+    assert correlating_aux_inst.queue_in.empty()
+    assert not correlating_aux_inst._pending_commands
+
+
+def test_dispatch_reception_suspended(aux_inst_with_channel):
+    aux_inst_with_channel.channel._cc_receive.return_value = {"msg": b"\x01"}
+    aux_inst_with_channel.warm_suspend = True
+    aux_inst_with_channel.is_instance = True
+    aux_inst_with_channel.suspend()
+
+    aux_inst_with_channel._dispatch_reception(timeout_in_s=0)
+
+    aux_inst_with_channel._receive_message.assert_not_called()
+    aux_inst_with_channel.channel._cc_receive.assert_called_once_with(timeout=0)
+    assert aux_inst_with_channel.metrics.snapshot()["counters"]["rx_discarded"] == 1
+
+    aux_inst_with_channel.resume()
+    aux_inst_with_channel._dispatch_reception(timeout_in_s=0)
+
+    aux_inst_with_channel._receive_message.assert_called_once_with(timeout_in_s=0)
+
+
+def test_warm_suspend_keeps_threads(mocker, aux_inst):
+    aux_inst._create_auxiliary_instance.return_value = True
+    aux_inst._delete_auxiliary_instance.return_value = True
+    aux_inst.warm_suspend = True
+    aux_inst.rx_task_on = False
+    aux_inst.create_instance()
+    tx_thread = aux_inst.tx_thread
+
+    command_run = threading.Event()
+    aux_inst._run_command.side_effect = lambda *args: command_run.set()
+
+    aux_inst.suspend()
+    aux_inst.queue_in.put(("held", None))
+    assert command_run.wait(0.1) is False
+    aux_inst.resume()
+    assert command_run.wait(2) is True
+    aux_inst.delete_instance()
+
+    assert aux_inst.tx_thread is tx_thread
+    aux_inst._run_command.assert_called_once_with("held", None)
+
+
 def test__transmit_task(aux_inst):
     aux_inst.queue_in.put(("send", b"\x01"))
     aux_inst.queue_in.put((AuxCommand.DELETE_AUXILIARY, None))
@@ -386,3 +506,339 @@ def test_wait_for_queue_out_empty(aux_inst):
     value = aux_inst.wait_for_queue_out(blocking=False, timeout_in_s=0)
 
     assert value is None
+
+
+@pytest.fixture
+def socket_channel(mocker):
+    class SocketChan(CChannel):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.sock_rx, self.sock_tx = socket.socketpair()
+
+        def fileno(self):
+            return self.sock_rx.fileno()
+
+        _cc_open = mocker.stub(name="_cc_open")
+        _cc_close = mocker.stub(name="_cc_close")
+        _cc_send = mocker.stub(name="_cc_send")
+
+        def _cc_receive(self, timeout):
+            return {"msg": self.sock_rx.recv(64)}
+
+    channel = SocketChan(name="socket-channel")
+    yield channel
+    channel.sock_rx.close()
+    channel.sock_tx.close()
+
+
+@pytest.fixture
+def reactor_aux(socket_channel):
+    class ReactorAux(AuxiliaryInterface):
+        def __init__(self, **kwargs):
+            super().__init__(name="reactor_aux", tx_task_on=False, use_reactor=True, **kwargs)
+            self.channel = socket_channel
+
+        def _create_auxiliary_instance(self):
+            return True
+
+        def _delete_auxiliary_instance(self):
+            return True
+
+        def _run_command(self, cmd_message, cmd_data):
+            pass
+
+        def _receive_message(self, timeout_in_s):
+            self.queue_out.put(self.channel.cc_receive(timeout_in_s)["msg"])
+
+    return ReactorAux()
+
+
+def test_reactor_dispatches_reception(reactor_aux, socket_channel):
+    reactor_aux.create_instance()
+
+    assert reactor_aux.rx_thread is None
+    assert AuxiliaryReactor.get_reactor().is_running
+
+    socket_channel.sock_tx.send(b"\x01\x02")
+
+    assert reactor_aux.wait_for_queue_out(blocking=True, timeout_in_s=2) == b"\x01\x02"
+
+    reactor_aux.delete_instance()
+
+    assert reactor_aux._reactor is None
+    assert not AuxiliaryReactor.get_reactor().is_running
+
+
+@pytest.mark.parametrize(
+    "queue_size, queue_policy, rejected",
+    [
+        (10, "block", True),
+        (0, "block", False),
+        (10, "drop-oldest", False),
+        (10, "drop-newest", False),
+    ],
+)
+def test_reactor_rejects_blocking_queue(socket_channel, reactor_aux, queue_size, queue_policy, rejected):
+    aux_class = type(reactor_aux)
+
+    if rejected:
+        with pytest.raises(ValueError, match="reactor"):
+            aux_class(queue_size=queue_size, queue_policy=queue_policy)
+    else:
+        assert aux_class(queue_size=queue_size, queue_policy=queue_policy).use_reactor is True
+
+
+def test_reactor_reception_does_not_block_on_full_queue(reactor_aux, socket_channel):
+    reactor_aux = type(reactor_aux)(queue_size=1, queue_policy="drop-oldest")
+    reactor_aux.create_instance()
+
+    for payload in (b"\x01", b"\x02"):
+        socket_channel.sock_tx.send(payload)
+        time.sleep(0.1)
+
+    assert reactor_aux.wait_for_queue_out(blocking=True, timeout_in_s=2) == b"\x02"
+    assert reactor_aux.queue_out.dropped == 1
+    reactor_aux.delete_instance()
+
+
+def test_reactor_fallback_without_fileno(mocker, aux_inst_with_channel):
+    thread_start = mocker.patch.object(threading.Thread, "start")
+    aux_inst_with_channel.use_reactor = True
+
+    aux_inst_with_channel._start_rx_task()
+
+    thread_start.assert_called_once()
+    assert aux_inst_with_channel._reactor is None
+
+
+def test_submit_command_resolved_by_response(correlating_aux_inst):
+    request = Message(MessageType.COMMAND, MessageCommandType.PING)
+    correlating_aux_inst.is_instance = True
+
+    future = correlating_aux_inst.submit_command(request)
+
+    assert correlating_aux_inst.queue_in.get_nowait() == (request, None)
+    assert not future.done()
+
+    ack = request.generate_ack_message(MessageAckType.ACK)
+    assert correlating_aux_inst._resolve_command(ack) is True
+    assert future.result(timeout=0) is ack
+    assert correlating_aux_inst._pending_commands == {}
+
+
+def test_submit_command_multiple_in_flight(correlating_aux_inst):
+    correlating_aux_inst.is_instance = True
+
+    first = correlating_aux_inst.submit_command("cmd_1", correlation_id=1)
+    second = correlating_aux_inst.submit_command("cmd_2", correlation_id=2)
+
+    with pytest.raises(ValueError):
+        correlating_aux_inst.submit_command("cmd_3", correlation_id=1)
+
+    correlating_aux_inst._get_response_correlation_id = lambda response: response
+    assert correlating_aux_inst._resolve_command(2) is True
+    assert correlating_aux_inst._resolve_command(3) is False
+    assert second.result(timeout=0) == 2
+    assert not first.done()
+
+
+def test_submit_command_no_correlation_id(correlating_aux_inst):
+    correlating_aux_inst.is_instance = True
+
+    with pytest.raises(ValueError):
+        correlating_aux_inst.submit_command("send", b"\x01")
+
+
+def test_submit_command_aux_not_started(correlating_aux_inst):
+    with pytest.raises(AuxiliaryNotStarted):
+        correlating_aux_inst.submit_command("send", correlation_id=1)
+
+
+def test_submit_command_cancel_releases_correlation_id(correlating_aux_inst):
+    correlating_aux_inst.is_instance = True
+
+    future = correlating_aux_inst.submit_command("send", correlation_id=1)
+    future.cancel()
+
+    assert correlating_aux_inst._pending_commands == {}
+    assert correlating_aux_inst._resolve_command(Message()) is False
+
+
+def test_delete_instance_cancels_pending_commands(mocker, correlating_aux_inst):
+    mocker.patch.object(threading.Thread, "start")
+    mocker.patch.object(threading.Thread, "join")
+    correlating_aux_inst._create_auxiliary_instance.return_value = True
+    correlating_aux_inst.create_instance()
+    future = correlating_aux_inst.submit_command("send", correlation_id=1)
+
+    correlating_aux_inst.delete_instance()
+
+    assert future.cancelled()
+
+
+def test_submit_command_not_correlating(aux_inst):
+    aux_inst.is_instance = True
+
+    with pytest.raises(NotImplementedError):
+        aux_inst.submit_command("send", correlation_id=1)
+
+    assert aux_inst.queue_in.empty()
+    assert not aux_inst._pending_commands
+
+
+def test_bounded_queues(mocker):
+    class BoundedAux(AuxiliaryInterface):
+        _create_auxiliary_instance = mocker.stub(name="_create_auxiliary_instance")
+        _delete_auxiliary_instance = mocker.stub(name="_delete_auxiliary_instance")
+        _run_command = mocker.stub(name="_run_command")
+        _receive_message = mocker.stub(name="_receive_message")
+
+    aux = BoundedAux(name="bounded", queue_size=2, queue_policy="drop-oldest")
+    for item in range(3):
+        aux.queue_out.put(item)
+
+    assert aux.wait_for_queue_out() == 1
+    stats = aux.get_queue_stats()
+    assert set(stats["queue_in"].pop("lanes")) == {"control", "realtime", "bulk"}
+    assert stats == {
+        "queue_in": {"size": 0, "capacity": 2, "policy": "drop-oldest", "dropped": 0, "high_water_mark": 0},
+        "queue_out": {"size": 1, "capacity": 2, "policy": "drop-oldest", "dropped": 1, "high_water_mark": 2},
+    }
+
+
+@pytest.fixture
+def lazy_aux_class():
+    class LazyAux(AuxiliaryInterface):
+        def __init__(self, **kwargs):
+            super().__init__(name="lazy", auto_start="lazy", rx_task_on=False, **kwargs)
+
+        def _create_auxiliary_instance(self):
+            return True
+
+        def _delete_auxiliary_instance(self):
+            return True
+
+        def _run_command(self, cmd_message, cmd_data):
+            self.queue_out.put(cmd_message)
+
+        def _receive_message(self, timeout_in_s):
+            pass
+
+        def ping(self):
+            return self.run_command("ping", timeout_in_s=1)
+
+    return LazyAux
+
+
+def test_lazy_start_on_first_use(lazy_aux_class):
+    aux = lazy_aux_class(lazy_idle_timeout=None)
+
+    assert aux.is_instance is False
+    assert aux.get_queue_stats()["queue_in"]["size"] == 0
+    assert aux.is_instance is False
+
+    assert aux.ping() == "ping"
+    assert aux.is_instance is True
+    assert aux._idle_thread is None
+
+    aux.stop()
+
+
+def test_lazy_park_when_idle(lazy_aux_class):
+    aux = lazy_aux_class(lazy_idle_timeout=0.05)
+
+    assert aux.ping() == "ping"
+    aux._idle_thread.join(2)
+    assert aux.is_instance is False
+    assert aux.tx_thread.is_alive() is False
+
+    # parked auxiliary gets started again on next use
+    assert aux.ping() == "ping"
+    assert aux.is_instance is True
+
+    aux.stop()
+    aux._idle_thread.join(2)
+    assert aux._idle_thread.is_alive() is False
+
+
+@pytest.fixture
+def stalling_aux_class():
+    class StallingAux(AuxiliaryInterface):
+        def __init__(self, **kwargs):
+            super().__init__(name="stalling", tx_task_on=False, **kwargs)
+            self.recv_timeout = 0.01
+            self.unblock = threading.Event()
+            self.created = 0
+
+        def _create_auxiliary_instance(self):
+            self.created += 1
+            return True
+
+        def _delete_auxiliary_instance(self):
+            # closing the channel releases the blocked reception
+            self.unblock.set()
+            return True
+
+        def _run_command(self, cmd_message, cmd_data):
+            pass
+
+        def _receive_message(self, timeout_in_s):
+            if self.created == 1:
+                self.unblock.wait()
+
+    return StallingAux
+
+
+def wait_for(condition, timeout=2):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def test_watchdog_reports_stalled_thread(caplog, stalling_aux_class):
+    aux = stalling_aux_class(stall_timeout=0.1)
+
+    with caplog.at_level(logging.ERROR):
+        aux.create_instance()
+        assert wait_for(lambda: "stalled" in caplog.text)
+
+    assert aux.metrics.snapshot()["counters"]["stalls"] == 1
+    assert "Thread stalling_rx of auxiliary stalling stalled" in caplog.text
+    assert "in _receive_message" in caplog.text
+    assert aux in AuxiliaryWatchdog.get_watchdog()._watched
+
+    aux.unblock.set()
+    aux.delete_instance()
+
+    assert aux not in AuxiliaryWatchdog.get_watchdog()._watched
+    assert aux.is_instance is False
+
+
+def test_watchdog_restart_on_stall(stalling_aux_class):
+    aux = stalling_aux_class(stall_timeout=0.1, restart_on_stall=True)
+    aux.create_instance()
+    stalled_thread = aux.rx_thread
+
+    assert wait_for(lambda: aux.created == 2 and aux.is_instance)
+
+    assert aux.rx_thread is not stalled_thread
+    assert aux.rx_thread.is_alive()
+    assert wait_for(lambda: not stalled_thread.is_alive())
+    aux.delete_instance()
+
+
+def test_check_stall_max_restarts(mocker, aux_inst):
+    thread_start = mocker.patch.object(threading.Thread, "start")
+    aux_inst.stall_timeout = 1
+    aux_inst.restart_on_stall = True
+    aux_inst._stall_restarts = STALL_MAX_RESTARTS
+    aux_inst._busy_since[threading.current_thread()] = 0
+
+    aux_inst._check_stall(now=5)
+    aux_inst._check_stall(now=6)
+
+    thread_start.assert_not_called()
+    assert aux_inst.metrics.snapshot()["counters"]["stalls"] == 1
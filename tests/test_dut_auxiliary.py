@@ -9,12 +9,14 @@
 
 import logging
 import threading
+import time
 from typing import Optional
 
 import pytest
 
 from pykiso.exceptions import AuxiliaryCreationError
 from pykiso.lib.auxiliaries.dut_auxiliary import COMMAND_TYPE, MESSAGE_TYPE, REPORT_TYPE, DUTAuxiliary, message, queue
+from pykiso.queues import QueuePriority
 
 
 @pytest.fixture
@@ -112,6 +114,44 @@ def test_send_ping_command_no_ack(mocker, aux_inst):
     assert state is False
 
 
+def test_send_abort_command_overtakes_blocked_command(mocker, aux_inst):
+    mocker.patch.object(aux_inst.channel, "_cc_send")
+    aux_inst.is_instance = True
+    bulk_command = message.Message(MESSAGE_TYPE.COMMAND, COMMAND_TYPE.TEST_CASE_RUN)
+    bulk_results = []
+    bulk_thread = threading.Thread(
+        target=lambda: bulk_results.append(aux_inst.run_command(bulk_command, timeout_in_s=3))
+    )
+    bulk_thread.start()
+    while aux_inst.queue_in.qsize() == 0:
+        time.sleep(0.001)
+
+    def acknowledge_abort():
+        # the DUT only answers the abort
+        deadline = time.monotonic() + 2
+        while not aux_inst._pending_commands:
+            if time.monotonic() > deadline:
+                return
+            time.sleep(0.001)
+        aux_inst._handle_response(aux_inst.current_cmd.generate_ack_message(message.MessageAckType.ACK))
+
+    ack_thread = threading.Thread(target=acknowledge_abort)
+    ack_thread.start()
+
+    state = aux_inst.send_abort_command(timeout=2)
+    ack_thread.join()
+
+    assert state is True
+    # the bulk command is still waiting for its own reply
+    assert bulk_thread.is_alive()
+    assert aux_inst.queue_in.get_nowait()[0] is aux_inst.current_cmd
+    assert aux_inst.queue_in.get_nowait()[0] is bulk_command
+
+    aux_inst.queue_out.put("bulk reply")
+    bulk_thread.join()
+    assert bulk_results == ["bulk reply"]
+
+
 def test_send_ping_command_failed_ack(mocker, aux_inst):
     mocker.patch.object(
         message.Message, "check_if_ack_message_is_matching", return_value=False
@@ -137,7 +177,11 @@ def test_send_abord_command(mocker, aux_inst):
     mock_create.assert_not_called()
     mock_delete.assert_not_called()
     run_mock.assert_called_once_with(
-        cmd_message=aux_inst.current_cmd, cmd_data=None, blocking=True, timeout_in_s=5
+        cmd_message=aux_inst.current_cmd,
+        cmd_data=None,
+        blocking=True,
+        timeout_in_s=5,
+        priority=QueuePriority.CONTROL,
     )
     assert aux_inst.current_cmd.msg_type == MESSAGE_TYPE.COMMAND
     assert aux_inst.current_cmd.sub_type == COMMAND_TYPE.ABORT
@@ -392,3 +436,54 @@ def test__receive_message_response_is_ack(mocker, aux_inst):
 
     send_mock.assert_not_called()
     assert aux_inst.queue_out.get_nowait() == response
+
+
+def test__receive_message_ack_of_submitted_command(mocker, aux_inst):
+    command = message.Message(MESSAGE_TYPE.COMMAND, COMMAND_TYPE.TEST_CASE_RUN)
+    report = message.Message(MESSAGE_TYPE.REPORT, REPORT_TYPE.TEST_PASS)
+    report.msg_token = command.msg_token
+    ack = command.generate_ack_message(message.MessageAckType.ACK)
+    mocker.patch.object(aux_inst.channel, "_cc_send")
+    mocker.patch.object(
+        aux_inst.channel,
+        "_cc_receive",
+        side_effect=[{"msg": report.serialize()}, {"msg": ack.serialize()}],
+    )
+    aux_inst.is_instance = True
+
+    future = aux_inst.submit_command(command)
+    aux_inst._receive_message(timeout_in_s=0)
+    aux_inst._receive_message(timeout_in_s=0)
+
+    assert future.result(timeout=0).msg_type == MESSAGE_TYPE.ACK
+    # the report shares the token but is not a reply to the command
+    assert aux_inst.queue_out.get_nowait().msg_type == MESSAGE_TYPE.REPORT
+    assert aux_inst.queue_out.empty()
+
+
+def test__receive_message_split_and_coalesced_packets(mocker, aux_inst):
+    reports = [message.Message(MESSAGE_TYPE.REPORT, REPORT_TYPE.TEST_PASS, test_case=idx) for idx in range(3)]
+    stream = b"".join(report.serialize() for report in reports)
+    send_mock = mocker.patch.object(aux_inst.channel, "_cc_send")
+    mocker.patch.object(
+        aux_inst.channel,
+        "_cc_receive",
+        side_effect=[{"msg": stream[:5]}, {"msg": stream[5:]}],
+    )
+
+    aux_inst._receive_message(timeout_in_s=0)
+    assert aux_inst.queue_out.empty()
+    aux_inst._receive_message(timeout_in_s=0)
+
+    assert send_mock.call_count == 3
+    assert [aux_inst.queue_out.get_nowait().test_case for _ in range(3)] == [0, 1, 2]
+
+
+def test__receive_message_already_parsed(mocker, aux_inst):
+    response = message.Message(MESSAGE_TYPE.LOG, COMMAND_TYPE.TEST_SUITE_RUN)
+    mocker.patch.object(aux_inst.channel, "_cc_send")
+    mocker.patch.object(aux_inst.channel, "_cc_receive", return_value={"msg": response})
+
+    aux_inst._receive_message(timeout_in_s=0)
+
+    assert aux_inst.queue_out.get_nowait() is response
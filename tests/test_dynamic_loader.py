@@ -8,11 +8,14 @@
 ##########################################################################
 
 import sys
+import threading
+import time
 
 import pytest
 
-from pykiso.exceptions import ConnectorRequiredError
-from pykiso.test_setup.dynamic_loader import DynamicFinder, DynamicImportLinker
+from pykiso.connector import CChannel
+from pykiso.exceptions import AuxiliaryStartupError, ConnectorRequiredError
+from pykiso.test_setup.dynamic_loader import AuxiliaryCache, DynamicFinder, DynamicImportLinker, ModuleCache
 
 
 @pytest.fixture(scope="module")
@@ -165,3 +168,183 @@ def test_import_aux_instanciated(linker):
     assert aux11.is_instance == False
     with pytest.raises(ImportError):
         from pykiso.auxiliaries import aux13
+
+
+@pytest.fixture
+def startup_cache():
+    cache = AuxiliaryCache(ModuleCache())
+    cache.provide("aux1", "module:Aux", connectors={"com": "chan1"})
+    cache.provide("aux2", "module:Aux", connectors={"com": "chan1"})
+    cache.provide("aux3", "module:Aux", connectors={"com": "chan2"})
+    cache.provide("proxy", "module:Proxy", connectors={"com": "chan3"}, aux_list=["aux1", "aux3"])
+    return cache
+
+
+def test_startup_layers(startup_cache):
+    assert startup_cache._get_startup_layers() == [["aux1", "aux3"], ["aux2", "proxy"]]
+
+
+def test_startup_layers_circular_dependency():
+    cache = AuxiliaryCache(ModuleCache())
+    cache.provide("proxy1", "module:Proxy", aux_list=["proxy2"])
+    cache.provide("proxy2", "module:Proxy", aux_list=["proxy1"])
+
+    with pytest.raises(ValueError, match="Circular dependency"):
+        cache._get_startup_layers()
+
+
+def test_start_all_concurrently(mocker, startup_cache):
+    # aux1 and aux3 can only get past the barrier if they are started at the same time
+    barrier = threading.Barrier(2, timeout=5)
+
+    def get_instance(name):
+        if name in ("aux1", "aux3"):
+            barrier.wait()
+        startup_cache.instances[name] = mocker.MagicMock()
+
+    mocker.patch.object(startup_cache, "get_instance", side_effect=get_instance)
+
+    startup_cache.start_all()
+
+    assert set(startup_cache.instances) == {"aux1", "aux2", "aux3", "proxy"}
+
+
+def test_start_all_error(mocker, startup_cache):
+    created = dict()
+
+    def get_instance(name):
+        startup_cache.instances[name] = created[name] = mocker.MagicMock()
+        if name == "aux3":
+            raise RuntimeError("no hardware")
+
+    mocker.patch.object(startup_cache, "get_instance", side_effect=get_instance)
+
+    with pytest.raises(AuxiliaryStartupError) as exc_info:
+        startup_cache.start_all()
+
+    assert list(exc_info.value.errors) == ["aux3"]
+    assert set(startup_cache.instances) == {"aux1"}
+    created["aux1"].stop.assert_called_once()
+    created["aux3"].stop.assert_called_once()
+
+
+def test_start_all_error_in_later_layer(mocker, startup_cache):
+    created = dict()
+    stopped = []
+
+    def get_instance(name):
+        startup_cache.instances[name] = created[name] = mocker.MagicMock()
+        created[name].stop.side_effect = lambda: stopped.append(name)
+        if name == "proxy":
+            raise RuntimeError("no hardware")
+
+    mocker.patch.object(startup_cache, "get_instance", side_effect=get_instance)
+
+    with pytest.raises(AuxiliaryStartupError) as exc_info:
+        startup_cache.start_all()
+
+    assert list(exc_info.value.errors) == ["proxy"]
+    assert "proxy" not in startup_cache.instances
+    # the auxiliaries of the failed layer are stopped before the previous layers
+    assert sorted(stopped[:2]) == ["aux2", "proxy"]
+    assert sorted(stopped[2:]) == ["aux1", "aux3"]
+
+
+def test_stop_auxiliaries_proxies_last(mocker, startup_cache):
+    stopped = []
+    for name in ("proxy", "aux1", "aux3"):
+        startup_cache.instances[name] = mocker.MagicMock()
+        startup_cache.instances[name].stop.side_effect = lambda name=name: stopped.append(name)
+
+    overdue = startup_cache._stop_auxiliaries()
+
+    assert overdue == []
+    assert sorted(stopped[:2]) == ["aux1", "aux3"]
+    assert stopped[2] == "proxy"
+
+
+def test_stop_auxiliaries_deadline_exceeded(mocker, startup_cache):
+    channel_closed = threading.Event()
+    slow_aux = mocker.MagicMock()
+    # the auxiliary only stops once its channel got closed
+    slow_aux.stop.side_effect = lambda: channel_closed.wait(5)
+    slow_aux.channel.close_when_idle.side_effect = lambda timeout: channel_closed.set() or True
+    fast_aux = mocker.MagicMock()
+    startup_cache.instances.update({"aux1": slow_aux, "aux3": fast_aux})
+
+    overdue = startup_cache._stop_auxiliaries(timeout=0.1)
+
+    assert overdue == ["aux1"]
+    slow_aux.channel.close_when_idle.assert_called_once()
+    fast_aux.stop.assert_called_once()
+    fast_aux.channel.close_when_idle.assert_not_called()
+
+
+def test_stop_auxiliaries_stop_thread_closing_channel(mocker, startup_cache, caplog):
+    in_close = threading.Event()
+    release = threading.Event()
+
+    class SlowClosingChannel(CChannel):
+        _cc_open = _cc_send = _cc_receive = mocker.stub()
+
+        def _cc_close(self):
+            in_close.set()
+            release.wait(5)
+
+    channel = SlowClosingChannel(name="slow")
+    close_spy = mocker.spy(channel, "_cc_close")
+    slow_aux = mocker.MagicMock(channel=channel)
+    # the stop thread is still inside _cc_close when the deadline expires
+    slow_aux.stop.side_effect = channel.close
+    startup_cache.instances["aux1"] = slow_aux
+    mocker.patch("pykiso.test_setup.dynamic_loader.FORCED_CLOSE_GRACE_PERIOD", 0.1)
+
+    overdue = startup_cache._stop_auxiliaries(timeout=0.1)
+    release.set()
+
+    assert in_close.is_set()
+    assert overdue == ["aux1"]
+    close_spy.assert_called_once()
+    assert "channel of auxiliary aux1 is still in use" in caplog.text
+
+
+def test_stop_auxiliaries_own_shutdown_timeout(mocker, startup_cache):
+    flasher = mocker.MagicMock()
+    flasher.stop.side_effect = lambda: time.sleep(0.3)
+    channel_closed = threading.Event()
+    slow_aux = mocker.MagicMock()
+    slow_aux.stop.side_effect = lambda: channel_closed.wait(5)
+    slow_aux.channel.close_when_idle.side_effect = lambda timeout: channel_closed.set() or True
+    proxy = mocker.MagicMock()
+    startup_cache.instances.update({"aux1": flasher, "aux3": slow_aux, "proxy": proxy})
+    startup_cache.shutdown_timeouts["aux1"] = 2
+
+    overdue = startup_cache._stop_auxiliaries(timeout=0.1)
+
+    assert overdue == ["aux3"]
+    flasher.channel.close_when_idle.assert_not_called()
+    slow_aux.channel.close_when_idle.assert_called_once()
+    proxy.channel.close_when_idle.assert_not_called()
+
+
+def test_provide_shutdown_timeout():
+    cache = AuxiliaryCache(ModuleCache())
+
+    cache.provide("flasher", "module:Aux", connectors={}, shutdown_timeout=60, param=1)
+
+    assert cache.shutdown_timeouts == {"flasher": 60}
+    assert cache.configs["flasher"] == {"param": 1}
+
+def test_get_instance_lazy_auxiliary_not_started(mocker):
+    cache = AuxiliaryCache(ModuleCache())
+    cache.provide("lazy_aux", "module:Aux", connectors={}, auto_start="lazy")
+    aux_class = mocker.MagicMock()
+    aux_class.return_value.is_instance = False
+    aux_class.return_value.auto_start = "lazy"
+    cache.modules["lazy_aux"] = aux_class
+
+    inst = cache.get_instance("lazy_aux")
+
+    aux_class.assert_called_once_with(name="lazy_aux", auto_start="lazy")
+    inst.start.assert_not_called()
+    inst.create_instance.assert_not_called()
@@ -14,7 +14,17 @@ import unittest
 import pytest
 
 from pykiso import message as message_mod
-from pykiso.message import Message, MessageAckType, MessageCommandType, MessageType, TlvKnownTags
+from pykiso.crc import crc16
+from pykiso.message import (
+    Message,
+    MessageAckType,
+    MessageCommandType,
+    MessageFramer,
+    MessageReportType,
+    MessageType,
+    TlvDict,
+    TlvKnownTags,
+)
 
 
 class MessageTest(unittest.TestCase):
@@ -35,6 +45,7 @@ class MessageTest(unittest.TestCase):
             TlvKnownTags.TEST_REPORT: "OK",
             TlvKnownTags.FAILURE_REASON: b"\x12\x34\x56",
         }
+        message_mod.msg_cnt = itertools.cycle(range(256))
         message_for_test = Message(
             msg_type=MessageType.COMMAND,
             sub_type=MessageCommandType.TEST_CASE_SETUP,
@@ -120,8 +131,8 @@ class MessageTest(unittest.TestCase):
         assert MessageCommandType.TEST_CASE_SETUP == message.get_message_sub_type()
         assert 1 == message.get_message_token()
         assert {
-            TlvKnownTags.TEST_REPORT: [79, 75],
-            TlvKnownTags.FAILURE_REASON: [18, 52, 86],
+            TlvKnownTags.TEST_REPORT: b"OK",
+            TlvKnownTags.FAILURE_REASON: b"\x12\x34\x56",
         } == message.get_message_tlv_dict()
 
     def test_ack_message_matching(self):
@@ -197,3 +208,184 @@ class MessageTest(unittest.TestCase):
         )
 
         assert msg.generate_ack_message(1) is None
+
+    def test_serialize_into(self):
+        msg = Message(
+            msg_type=MessageType.REPORT,
+            sub_type=MessageReportType.TEST_PASS,
+            test_suite=2,
+            test_case=3,
+            tlv_dict={TlvKnownTags.TEST_REPORT: "OK", TlvKnownTags.FAILURE_REASON: 0x1234},
+        )
+        buffer = bytearray(b"\xff" * 40)
+
+        size = msg.serialize_into(buffer, offset=4)
+
+        assert size == 18
+        assert buffer[4 : 4 + size] == msg.serialize()
+        assert buffer[:4] == buffer[4 + size :][:4] == b"\xff" * 4
+        assert Message.parse_packet(buffer[4 : 4 + size]).tlv_dict == {
+            TlvKnownTags.TEST_REPORT: b"OK",
+            TlvKnownTags.FAILURE_REASON: struct.pack("H", 0x1234),
+        }
+
+    def test_serialize_into_buffer_too_small(self):
+        msg = Message(msg_type=MessageType.COMMAND, sub_type=MessageCommandType.PING)
+        buffer = bytearray(12)
+
+        with pytest.raises(ValueError):
+            msg.serialize_into(buffer, offset=4)
+        assert buffer == bytearray(12)
+
+    def test_message_slots(self):
+        msg = Message()
+
+        assert msg.reserved == 0
+        with pytest.raises(AttributeError):
+            msg.unknown_attribute = 1
+
+    def test_parse_packet_without_copy(self):
+        raw_message = bytearray(b"\x40\x01\x03\x00\x01\x02\x03\x09\x6e\x02\x4f\x4b\x70\x03\x12\x34\x56\x00\x8f")
+
+        for raw_packet in (raw_message, memoryview(raw_message)):
+            message = Message.parse_packet(raw_packet)
+
+            assert isinstance(message.tlv_dict, TlvDict)
+            assert message.tlv_dict._raw_packet is raw_packet
+            assert message.tlv_dict[TlvKnownTags.TEST_REPORT] == b"OK"
+            assert message.tlv_dict.get_text(TlvKnownTags.TEST_REPORT) == "OK"
+            assert list(message.tlv_dict) == [TlvKnownTags.TEST_REPORT, TlvKnownTags.FAILURE_REASON]
+
+        # values are only extracted on access
+        raw_message[10:12] = b"KO"
+        assert message.tlv_dict[TlvKnownTags.TEST_REPORT] == b"KO"
+
+    def test_parse_packet_truncated_tlv(self):
+        raw_message = b"\x40\x01\x03\x00\x01\x02\x03\x05\x6e\x05\x4f\x4b\x70\x00\x00"
+
+        message = Message.parse_packet(raw_message)
+
+        assert message.tlv_dict == {TlvKnownTags.TEST_REPORT: b"OK\x70"}
+
+    def test_parsed_message_serialization(self):
+        msg = Message(
+            msg_type=MessageType.REPORT,
+            sub_type=MessageReportType.TEST_FAILED,
+            tlv_dict={TlvKnownTags.TEST_REPORT: "x" * 200},
+        )
+        raw_packet = msg.serialize()
+
+        assert Message.parse_packet(memoryview(raw_packet)).serialize() == raw_packet
+
+
+class TestMessageFramer:
+    @pytest.fixture
+    def packets(self):
+        return [
+            Message(MessageType.COMMAND, MessageCommandType.PING).serialize(),
+            Message(
+                MessageType.REPORT,
+                MessageReportType.TEST_FAILED,
+                tlv_dict={TlvKnownTags.FAILURE_REASON: "x" * 30},
+            ).serialize(),
+            Message(MessageType.ACK, MessageAckType.ACK).serialize(),
+        ]
+
+    def test_feed_byte_per_byte(self, packets):
+        framer = MessageFramer()
+        stream = b"".join(packets)
+
+        messages = [msg for idx in range(len(stream)) for msg in framer.feed(stream[idx : idx + 1])]
+
+        assert [msg.serialize() for msg in messages] == packets
+        assert framer.pending == 0
+
+    def test_feed_coalesced_packets(self, packets):
+        framer = MessageFramer()
+        stream = b"".join(packets)
+
+        messages = framer.feed(memoryview(stream)[:-1])
+        assert [msg.serialize() for msg in messages] == packets[:2]
+        assert framer.pending == len(packets[2]) - 1
+
+        assert [msg.serialize() for msg in framer.feed(stream[-1:])] == packets[2:]
+
+    def test_resynchronize_on_crc_failure(self, packets, caplog):
+        framer = MessageFramer()
+        garbage = b"\x40\x00\x00\x00\x00\x00\x00\x00\xde\xad"
+
+        messages = framer.feed(garbage + b"".join(packets))
+
+        assert [msg.serialize() for msg in messages] == packets
+        assert framer.discarded == len(garbage)
+        assert caplog.text.count("resynchronizing") == 1
+
+    def test_ignore_unused_header_bits(self, packets):
+        framer = MessageFramer()
+        packet = bytearray(packets[0])
+        packet[0] |= 0x0F
+        packet[-2:] = struct.pack("H", crc16(packet[:-2]))
+
+        messages = framer.feed(bytes(packet) + packets[2])
+
+        assert [msg.msg_type for msg in messages] == [MessageType.COMMAND, MessageType.ACK]
+        assert messages[0].sub_type == MessageCommandType.PING
+        assert framer.discarded == 0
+
+    def test_drop_unknown_content(self, packets, caplog):
+        framer = MessageFramer()
+        unknown = bytearray(Message(MessageType.REPORT, MessageReportType.TEST_PASS).serialize())
+        unknown[2] = 0xFF
+        unknown[-2:] = struct.pack("H", crc16(unknown[:-2]))
+
+        messages = framer.feed(bytes(unknown) + packets[0])
+
+        assert [msg.serialize() for msg in messages] == packets[:1]
+        assert "unknown content" in caplog.text
+
+    def test_reset(self, packets):
+        framer = MessageFramer()
+        framer.feed(packets[1][:10])
+
+        framer.reset()
+
+        assert framer.pending == 0
+        assert [msg.serialize() for msg in framer.feed(packets[0])] == packets[:1]
+
+
+def test_parse_many():
+    np = pytest.importorskip("numpy")
+    messages = [
+        Message(
+            MessageType.REPORT,
+            MessageReportType.TEST_FAILED,
+            error_code=idx % 3,
+            test_suite=idx % 7,
+            test_case=idx % 5,
+            tlv_dict={TlvKnownTags.FAILURE_REASON: "x" * idx} if idx else None,
+        )
+        for idx in range(20)
+    ]
+    raw_packets = [msg.serialize() for msg in messages]
+    recording = bytearray(b"".join(raw_packets))
+    recording[len(raw_packets[0])] ^= 0xFF
+
+    packets = Message.parse_many(memoryview(recording + raw_packets[1][:-1]))
+
+    assert len(packets) == len(messages)
+    assert packets["offset"].tolist() == np.cumsum([0] + [len(raw) for raw in raw_packets[:-1]]).tolist()
+    assert packets["size"].tolist() == [len(raw) for raw in raw_packets]
+    assert packets["crc_valid"].tolist() == [True, False] + [True] * 18
+    for msg, packet in zip(messages[2:], packets[2:]):
+        parsed = Message.parse_packet(recording[packet["offset"] : packet["offset"] + packet["size"]])
+        assert (parsed.msg_type, parsed.msg_token, parsed.sub_type) == tuple(packet[["msg_type", "msg_token", "sub_type"]])
+        assert (msg.error_code, msg.test_suite, msg.test_case) == tuple(
+            packet[["error_code", "test_suite", "test_case"]]
+        )
+
+
+def test_parse_many_without_numpy(mocker):
+    mocker.patch.object(message_mod, "np", None)
+
+    with pytest.raises(ImportError, match=r"pykiso\[analysis\]"):
+        Message.parse_many(b"")
@@ -0,0 +1,139 @@
+##########################################################################
+# Copyright (c) 2010-2022 Robert Bosch GmbH
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# http://www.eclipse.org/legal/epl-2.0.
+#
+# SPDX-License-Identifier: EPL-2.0
+##########################################################################
+
+import json
+
+from pykiso.auxiliary import AuxiliaryInterface
+from pykiso.metrics import Histogram, Metrics, registry
+
+
+def test_histogram():
+    hist = Histogram(buckets=(1, 10))
+    for value in (0.5, 1, 5, 50):
+        hist.observe(value)
+
+    assert hist.snapshot() == {
+        "count": 4,
+        "sum": 56.5,
+        "min": 0.5,
+        "max": 50,
+        "mean": 14.125,
+        "buckets": {"<=1": 2, "<=10": 1, "+inf": 1},
+    }
+
+
+def test_histogram_empty():
+    snapshot = Histogram().snapshot()
+
+    assert snapshot["count"] == 0
+    assert snapshot["min"] is snapshot["max"] is snapshot["mean"] is None
+
+
+def test_metrics_snapshot_and_reset():
+    metrics = Metrics("component")
+    child = Metrics("child")
+    child.increment("calls")
+    metrics.increment("calls")
+    metrics.increment("calls", 2)
+    metrics.observe("latency", 0.002)
+    metrics.register_gauge("depth", lambda: 3)
+    metrics.register_gauge("broken", lambda: 1 / 0)
+    metrics.register_child("child", lambda: child)
+    metrics.register_child("missing", lambda: None)
+
+    snapshot = metrics.snapshot()
+
+    assert snapshot["counters"] == {"calls": 3}
+    assert snapshot["histograms"]["latency"]["count"] == 1
+    assert snapshot["gauges"] == {"depth": 3, "broken": None}
+    assert snapshot["child"]["counters"] == {"calls": 1}
+    assert "missing" not in snapshot
+
+    metrics.reset()
+
+    assert metrics.snapshot()["counters"] == {}
+
+
+def test_registry_dump_json(tmp_path):
+    metrics = Metrics("dumped_component")
+    metrics.increment("calls")
+    output = tmp_path / "metrics.json"
+
+    registry.dump_json(output)
+
+    content = json.loads(output.read_text())
+    assert content["dumped_component"]["counters"] == {"calls": 1}
+
+
+def test_registry_keeps_duplicate_names():
+    first = Metrics("duplicated_component")
+    second = Metrics("duplicated_component")
+    first.increment("calls")
+    second.increment("calls", 2)
+
+    snapshot = registry.snapshot_all()
+
+    assert snapshot["duplicated_component"]["counters"] == {"calls": 1}
+    assert snapshot["duplicated_component#2"]["counters"] == {"calls": 2}
+
+
+def test_metrics_record():
+    metrics = Metrics("component")
+    metrics.increment("calls")
+
+    metrics.record({"latency": 0.002}, {"calls": 2, "bytes": 10})
+    metrics.record(counters={"calls": 1})
+
+    snapshot = metrics.snapshot()
+    assert snapshot["counters"] == {"calls": 4, "bytes": 10}
+    assert snapshot["histograms"]["latency"]["count"] == 1
+
+
+def test_channel_metrics(cchannel_inst):
+    cchannel_inst._cc_receive.side_effect = [{"msg": b"\x01\x02"}, {"msg": None}]
+
+    cchannel_inst.cc_send(b"\x01\x02\x03")
+    cchannel_inst.cc_receive()
+    cchannel_inst.cc_receive()
+
+    snapshot = cchannel_inst.metrics.snapshot()
+    assert snapshot["counters"] == {
+        "send_calls": 1,
+        "send_bytes": 3,
+        "receive_data": 1,
+        "receive_bytes": 2,
+        "receive_empty": 1,
+    }
+    assert snapshot["histograms"]["send_duration"]["count"] == 1
+    assert snapshot["histograms"]["receive_duration"]["count"] == 2
+
+
+def test_auxiliary_metrics(mocker, cchannel_inst):
+    class MetricsAux(AuxiliaryInterface):
+        def __init__(self):
+            super().__init__(name="metrics_aux")
+            self.channel = cchannel_inst
+
+        _create_auxiliary_instance = mocker.stub(name="_create_auxiliary_instance")
+        _delete_auxiliary_instance = mocker.stub(name="_delete_auxiliary_instance")
+        _run_command = mocker.stub(name="_run_command")
+        _receive_message = mocker.stub(name="_receive_message")
+
+    aux = MetricsAux()
+    aux.is_instance = True
+    aux.queue_out.put("response")
+
+    assert aux.run_command("cmd") == "response"
+    assert aux.run_command("cmd", timeout_in_s=0) is None
+
+    snapshot = aux.metrics.snapshot()
+    assert snapshot["counters"] == {"run_command_timeouts": 1}
+    assert snapshot["histograms"]["run_command_latency"]["count"] == 1
+    assert snapshot["gauges"] == {"queue_in_depth": 2, "queue_out_depth": 0}
+    assert snapshot["channel"] == cchannel_inst.metrics.snapshot()
@@ -0,0 +1,153 @@
+##########################################################################
+# Copyright (c) 2010-2022 Robert Bosch GmbH
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# http://www.eclipse.org/legal/epl-2.0.
+#
+# SPDX-License-Identifier: EPL-2.0
+##########################################################################
+
+import logging
+import os
+
+import pytest
+
+from pykiso.auxiliary import AuxiliaryInterface
+from pykiso.exceptions import AuxiliaryCreationError
+from pykiso.interfaces.process_auxiliary import ProcessAuxiliary, is_auxiliary_of_type
+from pykiso.test_setup.config_registry import ConfigRegistry
+from pykiso.test_setup.dynamic_loader import AuxiliaryCache, ModuleCache
+
+COM_AUX_TYPE = "pykiso.lib.auxiliaries.communication_auxiliary:CommunicationAuxiliary"
+LOOPBACK_TYPE = "pykiso.lib.connectors.cc_raw_loopback:CCLoopback"
+
+
+@pytest.fixture
+def process_aux():
+    aux = ProcessAuxiliary("loop_aux", COM_AUX_TYPE, {}, {"com": "loop"}, {"loop": (LOOPBACK_TYPE, {})})
+    yield aux
+    aux.close()
+
+
+def test_process_auxiliary_api(process_aux):
+    assert process_aux.process.pid != os.getpid()
+    assert process_aux.is_instance is True
+    assert process_aux.send_message(b"\x01\x02") is True
+
+    process_aux.recv_timeout = 0.5
+    assert process_aux.recv_timeout == 0.5
+
+    with pytest.raises(AttributeError):
+        process_aux.unknown_attribute
+
+
+def test_process_auxiliary_close(process_aux):
+    process_aux.close()
+
+    assert process_aux.process.exitcode == 0
+    with pytest.raises(RuntimeError, match="not running"):
+        process_aux.is_instance
+
+
+def test_process_auxiliary_creation_error():
+    with pytest.raises(AuxiliaryCreationError):
+        ProcessAuxiliary("bad_aux", "pykiso.unknown:Auxiliary", {}, {}, {})
+
+
+def test_auxiliary_cache_process_instance(mocker):
+    con_cache = ModuleCache()
+    con_cache.provide("loop", LOOPBACK_TYPE)
+    cache = AuxiliaryCache(con_cache)
+    cache.provide("loop_aux", COM_AUX_TYPE, connectors={"com": "loop"}, process=True)
+    process_aux_mock = mocker.patch("pykiso.interfaces.process_auxiliary.ProcessAuxiliary")
+
+    inst = cache.get_instance("loop_aux")
+
+    assert inst is process_aux_mock.return_value
+    process_aux_mock.assert_called_once_with("loop_aux", COM_AUX_TYPE, {}, {"com": "loop"}, {"loop": (LOOPBACK_TYPE, {})})
+    # the connector is only created in the child process
+    assert con_cache.instances == {}
+
+    cache._stop_auxiliaries()
+
+    inst.stop.assert_called_once()
+    inst.close.assert_called_once()
+
+
+def test_process_auxiliary_shared_connector():
+    config = {
+        "auxiliaries": {
+            "aux1": {"connectors": {"com": "chan"}, "config": {"process": True}, "type": COM_AUX_TYPE},
+            "aux2": {"connectors": {"com": "chan"}, "type": COM_AUX_TYPE},
+        },
+        "connectors": {"chan": {"type": LOOPBACK_TYPE}},
+    }
+
+    with pytest.raises(ValueError, match="aux1 cannot run in a child process"):
+        ConfigRegistry.register_aux_con(config)
+
+
+def test_process_auxiliary_forwards_logs(process_aux, caplog):
+    with caplog.at_level(logging.INFO):
+        process_aux.run_command("unknown", timeout_in_s=0)
+        process_aux.close()
+
+    records = [record for record in caplog.records if record.process == process_aux.process.pid]
+    assert records
+    assert any("unknown" in record.getMessage() for record in records)
+
+
+def test_process_auxiliary_forwards_attributes(mocker, process_aux):
+    request = mocker.spy(ProcessAuxiliary, "_request")
+
+    # state attributes always reflect the hosted auxiliary
+    for _ in range(3):
+        assert process_aux.is_instance is True
+    assert request.call_count == 3
+    assert process_aux.is_proxy_capable is True
+    assert process_aux.auto_start is True
+
+    # methods are only looked up once
+    request.reset_mock()
+    process_aux.send_message(b"\x01")
+    process_aux.send_message(b"\x02")
+    assert [call.args[1] for call in request.call_args_list] == ["getattr", "call", "call"]
+
+    process_aux.stop()
+    assert process_aux.is_instance is False
+
+
+def test_process_auxiliary_is_auxiliary(process_aux):
+    from pykiso.lib.auxiliaries.communication_auxiliary import CommunicationAuxiliary
+    from pykiso.lib.auxiliaries.dut_auxiliary import DUTAuxiliary
+
+    assert isinstance(process_aux, AuxiliaryInterface)
+    assert process_aux.hosts(CommunicationAuxiliary)
+    assert process_aux.hosts(AuxiliaryInterface)
+    assert not process_aux.hosts(DUTAuxiliary)
+    assert is_auxiliary_of_type(process_aux, CommunicationAuxiliary)
+    assert is_auxiliary_of_type(process_aux, ProcessAuxiliary)
+    assert not is_auxiliary_of_type(process_aux, DUTAuxiliary)
+
+
+def test_process_auxiliary_get_instance(mocker, process_aux):
+    from pykiso.lib.auxiliaries.communication_auxiliary import CommunicationAuxiliary
+    from pykiso.lib.auxiliaries.dut_auxiliary import DUTAuxiliary
+
+    mocker.patch.object(ConfigRegistry, "get_aux_by_alias", return_value=process_aux)
+    linker = mocker.patch.object(ConfigRegistry, "_linker")
+    linker._aux_cache.instances = {"loop_aux": process_aux}
+
+    assert CommunicationAuxiliary.get_instance("loop_aux") is process_aux
+    assert AuxiliaryInterface.get_instance("loop_aux") is process_aux
+    with pytest.raises(ValueError, match="not of type"):
+        DUTAuxiliary.get_instance("loop_aux")
+    assert ConfigRegistry.get_auxes_by_type(CommunicationAuxiliary) == {"loop_aux": process_aux}
+    assert ConfigRegistry.get_auxes_by_type(DUTAuxiliary) == {}
+
+
+def test_process_auxiliary_not_proxy_compatible(process_aux):
+    from pykiso.lib.auxiliaries.proxy_auxiliary import ProxyAuxiliary
+
+    with pytest.raises(NotImplementedError, match="child process"):
+        ProxyAuxiliary._check_aux_compatibility(process_aux)
@@ -368,7 +368,7 @@ def test_delete_auxiliary_instance_exception(mocker, cchannel_inst):
 )
 def test_receive_message_valid(mocker, mock_auxiliaries, cchannel_inst, response):
     proxy_inst = ProxyAuxiliary(cchannel_inst, [*AUX_LIST_NAMES])
-    mocker.patch.object(proxy_inst.channel, "cc_receive", return_value=response)
+    mocker.patch.object(proxy_inst.channel, "cc_receive_many", return_value=[response])
 
     proxy_inst._receive_message()
 
@@ -391,9 +391,24 @@ def test_receive_message_valid(mocker, mock_auxiliaries, cchannel_inst, response
     assert source_2 == response["remote_id"]
 
 
+def test_receive_message_batch(mocker, mock_auxiliaries, cchannel_inst):
+    proxy_inst = ProxyAuxiliary(cchannel_inst, [*AUX_LIST_NAMES])
+    cchannel_inst._cc_receive.side_effect = [{"msg": b"\x01"}, {"msg": b"\x02"}, {"msg": None}]
+    mocker.patch.object(cchannel_inst, "fileno", return_value=3)
+    mocker.patch.object(cchannel_inst, "wait_readable", return_value=True)
+
+    proxy_inst._receive_message(timeout_in_s=0.5)
+
+    link_aux_1 = sys.modules["pykiso.auxiliaries.MockAux1"]
+    first, second = link_aux_1.channel.queue_out.get_nowait(), link_aux_1.channel.queue_out.get_nowait()
+    assert (first["msg"], second["msg"]) == (b"\x01", b"\x02")
+    assert first["rx_timestamp"] <= second["rx_timestamp"]
+    assert cchannel_inst._cc_receive.call_args_list[0].kwargs == {"timeout": 0.5}
+
+
 def test_receive_message_no_message(mocker, mock_auxiliaries, cchannel_inst):
     proxy_inst = ProxyAuxiliary(cchannel_inst, [*AUX_LIST_NAMES])
-    mocker.patch.object(proxy_inst.channel, "cc_receive", return_value={"msg": None})
+    mocker.patch.object(proxy_inst.channel, "cc_receive_many", return_value=[])
 
     proxy_inst._receive_message()
 
@@ -406,7 +421,7 @@ def test_receive_message_no_message(mocker, mock_auxiliaries, cchannel_inst):
 
 def test_receive_message_exception(mocker, mock_auxiliaries, cchannel_inst):
     proxy_inst = ProxyAuxiliary(cchannel_inst, [*AUX_LIST_NAMES])
-    mocker.patch.object(proxy_inst.channel, "cc_receive", return_value=ValueError())
+    mocker.patch.object(proxy_inst.channel, "cc_receive_many", side_effect=ValueError)
 
     proxy_inst._receive_message()
 
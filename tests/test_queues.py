@@ -0,0 +1,107 @@
+##########################################################################
+# Copyright (c) 2010-2022 Robert Bosch GmbH
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# http://www.eclipse.org/legal/epl-2.0.
+#
+# SPDX-License-Identifier: EPL-2.0
+##########################################################################
+
+import queue
+
+import pytest
+
+from pykiso.queues import MonitoredQueue, PriorityLaneQueue, QueuePolicy, QueuePriority
+
+
+def test_unbounded_queue_high_water_mark():
+    q = MonitoredQueue()
+
+    for item in range(5):
+        q.put(item)
+    q.get()
+    q.put(5)
+
+    assert q.stats() == {"size": 5, "capacity": 0, "policy": "block", "dropped": 0, "high_water_mark": 5}
+
+
+def test_block_policy():
+    q = MonitoredQueue(1, "block")
+    q.put(1)
+
+    with pytest.raises(queue.Full):
+        q.put(2, timeout=0.01)
+
+    assert q.dropped == 0
+
+
+def test_drop_oldest_policy():
+    q = MonitoredQueue(2, QueuePolicy.DROP_OLDEST)
+
+    for item in range(4):
+        q.put(item)
+
+    assert [q.get_nowait(), q.get_nowait()] == [2, 3]
+    assert q.dropped == 2
+    assert q.high_water_mark == 2
+    assert q.unfinished_tasks == 2
+
+
+def test_drop_newest_policy():
+    q = MonitoredQueue(2, "drop-newest")
+
+    for item in range(4):
+        q.put(item)
+
+    assert [q.get_nowait(), q.get_nowait()] == [0, 1]
+    assert q.stats()["dropped"] == 2
+
+
+def test_invalid_policy():
+    with pytest.raises(ValueError):
+        MonitoredQueue(2, "drop-random")
+
+
+def test_priority_lanes_order():
+    q = PriorityLaneQueue()
+
+    q.put("bulk_1")
+    q.put("realtime", priority="realtime")
+    q.put("bulk_2", priority=QueuePriority.BULK)
+    q.put("control", priority=QueuePriority.CONTROL)
+
+    assert [q.get_nowait() for _ in range(4)] == ["control", "realtime", "bulk_1", "bulk_2"]
+    with pytest.raises(queue.Empty):
+        q.get_nowait()
+
+
+def test_priority_lanes_stats():
+    q = PriorityLaneQueue(default_priority="realtime")
+    q.put(1)
+    q.put(2)
+    q.get()
+
+    stats = q.stats()
+
+    assert stats["size"] == 1
+    assert stats["high_water_mark"] == 2
+    assert stats["lanes"]["realtime"]["size"] == 1
+    assert stats["lanes"]["realtime"]["latency"]["count"] == 1
+    assert stats["lanes"]["control"] == {"size": 0, "latency": q.latencies[QueuePriority.CONTROL].snapshot()}
+
+
+def test_priority_lanes_drop_oldest_lowest_priority():
+    q = PriorityLaneQueue(2, QueuePolicy.DROP_OLDEST)
+
+    q.put("control", priority="control")
+    q.put("bulk")
+    q.put("realtime", priority="realtime")
+
+    assert [q.get_nowait(), q.get_nowait()] == ["control", "realtime"]
+    assert q.dropped == 1
+    assert q.unfinished_tasks == 2
+
+
+def test_priority_lanes_invalid_priority():
+    with pytest.raises(ValueError):
+        PriorityLaneQueue().put(1, priority="urgent")
@@ -25,6 +25,7 @@ def mock_channel(mocker):
         open = mocker.stub(name="open")
         close = mocker.stub(name="close")
         cc_receive = mocker.stub(name="cc_receive")
+        cc_receive_many = mocker.stub(name="cc_receive_many")
 
     return Channel(name="test-channel")
 
@@ -138,7 +139,7 @@ def test_receive(data, expected_data, mocker, mock_channel):
     record_aux = RecordAuxiliary(mock_channel, is_active=True)
 
     mock_dump_to_file = mocker.patch.object(record_aux, "dump_to_file")
-    mocker.patch.object(record_aux.channel, "cc_receive", return_value=data)
+    mocker.patch.object(record_aux.channel, "cc_receive_many", return_value=[data])
     mock_set_data = mocker.patch.object(record_aux, "set_data")
 
     record_aux.receive()
@@ -215,9 +216,21 @@ def test_stop_and_resume(mocker, mock_channel):
     assert record_aux._create_auxiliary_instance() is True
 
 
+def test_receive_batch(mocker, mock_channel):
+    mocker.patch("pykiso.lib.auxiliaries.record_auxiliary.threading.Event.is_set", side_effect=[False, True])
+    mocker.patch.object(threading.Thread, "start", return_value=None)
+    record_aux = RecordAuxiliary(mock_channel, is_active=True)
+    mock_channel.cc_receive_many.return_value = [{"msg": b"first"}, {"msg": None}, {"msg": b"second", "remote_id": 2}]
+    mock_set_data = mocker.patch.object(record_aux, "set_data")
+
+    record_aux.receive()
+
+    mock_set_data.assert_called_once_with("\nfirst\n2    second")
+
+
 def test_size_too_large(mocker, caplog, mock_channel):
     mocker.patch.object(threading.Thread, "start")
-    mock_channel.cc_receive.return_value = {"msg": "test".encode()}
+    mock_channel.cc_receive_many.return_value = [{"msg": "test".encode()}]
     mock_event = mocker.Mock()
     mock_event.is_set.side_effect = [False, False, True]
 
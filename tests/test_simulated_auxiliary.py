@@ -138,11 +138,7 @@ def simulated_constructor_init(mocker, mock_channel, mock_msg):
 
 @pytest.fixture
 def mock_msg(mocker):
-    msg = message.Message
-    msg.msg_type = ABORT
-    msg.sub_type = ACK
-    msg.test_suite = 1
-    msg.test_case = 1
+    msg = message.Message(msg_type=ABORT, sub_type=ACK, test_suite=1, test_case=1)
     return {"msg": msg}
 
 
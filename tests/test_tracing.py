@@ -0,0 +1,118 @@
+##########################################################################
+# Copyright (c) 2010-2022 Robert Bosch GmbH
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# http://www.eclipse.org/legal/epl-2.0.
+#
+# SPDX-License-Identifier: EPL-2.0
+##########################################################################
+
+import json
+import threading
+import unittest
+
+import pytest
+
+from pykiso.test_coordinator import test_case
+from pykiso.tracing import Tracer, tracer
+
+
+@pytest.fixture
+def enabled_tracer():
+    tracer.enable()
+    yield tracer
+    tracer.disable()
+
+
+def test_span_disabled():
+    trace = Tracer()
+
+    with trace.span("ignored"):
+        pass
+
+    assert trace.events() == []
+
+
+def test_span_and_dump_json(tmp_path):
+    trace = Tracer()
+    trace.enable()
+
+    with trace.span("outer", "test", step=1):
+        with trace.span("inner"):
+            pass
+    thread = threading.Thread(target=lambda: trace.span("threaded").__enter__().__exit__(), name="worker")
+    thread.start()
+    thread.join()
+    output = tmp_path / "trace.json"
+    trace.dump_json(output)
+
+    events = json.loads(output.read_text())["traceEvents"]
+    spans = {event["name"]: event for event in events if event["ph"] == "X"}
+    thread_names = {event["args"]["name"] for event in events if event["ph"] == "M"}
+    assert list(spans) == ["inner", "outer", "threaded"]
+    assert spans["outer"]["args"] == {"step": "1"}
+    assert spans["outer"]["cat"] == "test"
+    assert spans["outer"]["ts"] <= spans["inner"]["ts"]
+    assert spans["outer"]["dur"] >= spans["inner"]["dur"]
+    assert spans["threaded"]["tid"] != spans["outer"]["tid"]
+    assert thread_names == {threading.current_thread().name, "worker"}
+
+
+def test_enable_clears_previous_spans():
+    trace = Tracer()
+    trace.enable()
+    with trace.span("first"):
+        pass
+
+    trace.enable()
+
+    assert trace.events() == []
+
+
+def test_channel_spans(enabled_tracer, cchannel_inst):
+    cchannel_inst.cc_send(b"\x01")
+    cchannel_inst.cc_receive()
+
+    names = [event["name"] for event in enabled_tracer.events() if event["ph"] == "X"]
+    assert names == ["cc_send", "cc_receive"]
+
+
+def test_test_case_phase_spans(enabled_tracer):
+    class TracedTest(test_case.BasicTest):
+        def test_run(self):
+            pass
+
+    test = TracedTest(1, 1, [], None, None, None, None, None, methodName="test_run")
+    test.run()
+
+    names = [event["name"] for event in enabled_tracer.events() if event["ph"] == "X"]
+    assert names == ["setUp", "test_run", "tearDown"]
+
+
+def test_events_are_capped():
+    trace = Tracer(max_events=2)
+    trace.enable()
+
+    for name in ("first", "second", "third"):
+        with trace.span(name):
+            pass
+
+    names = [event["name"] for event in trace.events() if event["ph"] == "X"]
+    assert names == ["second", "third"]
+    assert trace.dropped == 1
+    trace.enable()
+    assert trace.dropped == 0
+
+
+def test_test_case_phase_spans_keep_skip(enabled_tracer):
+    class SkippedTest(test_case.BasicTest):
+        @unittest.skip("not today")
+        def test_run(self):
+            raise AssertionError("skipped test was run")
+
+    test = SkippedTest(1, 1, [], None, None, None, None, None, methodName="test_run")
+    result = unittest.TestResult()
+    test.run(result)
+
+    assert len(result.skipped) == 1
+    assert "test_run" not in test.__dict__